@@ -1,9 +1,16 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import Depends, FastAPI, HTTPException, Request, Response, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import Dict, Any, Optional
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ValidationError
+from cachetools import TTLCache
+from typing import Dict, Any, Optional, Tuple
+from contextlib import asynccontextmanager, suppress
+import asyncio
+import logging
 import uuid
 
+import orjson
+
 import sys
 import os
 
@@ -18,6 +25,10 @@ from pypokerengine.engine.player import Player
 from pypokerengine.engine.action_manager import ActionManager
 from pypokerengine.engine.round import Street
 from pypokerengine.strategy import BotStrategy
+from backend.turn_logic import next_to_act
+
+
+logger = logging.getLogger(__name__)
 
 
 class StartGameRequest(BaseModel):
@@ -44,7 +55,27 @@ class SessionState:
         self.awaiting_player: Optional[str] = None  # name
         self.human_name = human_name
         self.bot_name = bot_name
+        # Seat index of the human; the app is heads-up only
+        self.human_idx = 0 if game.players[0].name == human_name else 1
         self.action_log = []  # list[str]
+        # Serializes mutating requests on this session (double-clicks, timer + click)
+        self.lock = asyncio.Lock()
+        # Last _state_dict result; rebuilt only after the game is mutated
+        self.state_cache: Optional[Dict[str, Any]] = None
+        self.state_dirty = True
+        # Bumped on every rebuild so pollers can skip unchanged states
+        self.state_version = 0
+        # Legal-action dicts for the current spot keyed by every input that
+        # affects them; see _legal_actions_for. Treat entries as read-only.
+        self.legal_actions_cache: Dict[tuple, Dict[str, Any]] = {}
+        # Community cards as strings; refreshed by _maybe_advance when dealt
+        self.board_strs: list = []
+        # ((round, street, len(action_history)), next actor); see _find_next_to_act
+        self.next_actor_cache: Optional[tuple] = None
+        # Open /ws sockets, and the last state pushed to them (for deltas)
+        self.subscribers: set = set()
+        self.last_broadcast: Optional[Dict[str, Any]] = None
+        self.broadcast_log_len = 0
         # Initialize bot strategy
         self.bot_strategy = BotStrategy(
             bot_name=bot_name,
@@ -53,113 +84,146 @@ class SessionState:
             n_simulations=5000  # Fast equity calculations
         )
 
+    def __getstate__(self) -> Dict[str, Any]:
+        # Picklable for an external session store: drop the lock and the
+        # derived caches, which are rebuilt on demand after loading
+        state = self.__dict__.copy()
+        del state["lock"]
+        state["state_cache"] = None
+        state["state_dirty"] = True
+        state["legal_actions_cache"] = {}
+        state["next_actor_cache"] = None
+        state["subscribers"] = set()
+        state["last_broadcast"] = None
+        return state
 
-app = FastAPI()
-
-app.add_middleware(
-    CORSMiddleware,
-    # Allow any dev origin (handles localhost, 127.0.0.1, LAN IPs, etc.)
-    allow_origin_regex=r".*",
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-SESSIONS: Dict[str, SessionState] = {}
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self.lock = asyncio.Lock()
 
 
-def _acting_order(round_obj) -> list:
-    if round_obj.street == Street.PREFLOP:
-        return [round_obj.dealer_position, 1 - round_obj.dealer_position]
-    return [1 - round_obj.dealer_position, round_obj.dealer_position]
+# How often abandoned sessions are purged; TTLCache otherwise only expires
+# entries lazily when the store is touched
+SESSION_EXPIRE_INTERVAL_SECONDS = 60
 
 
-def _acted_names_nonblind(round_obj) -> set:
-    """Return set of player names who have taken a non-blind action on this street."""
-    actions_this_street = round_obj.street_actions.get(round_obj.street, [])
-    return set(
-        a["player"]
-        for a in actions_this_street
-        if a.get("action") not in ("small_blind", "big_blind")
-    )
+async def _expire_sessions() -> None:
+    while True:
+        await asyncio.sleep(SESSION_EXPIRE_INTERVAL_SECONDS)
+        SESSIONS.expire()
 
 
-def _find_next_to_act(round_obj) -> Optional[Player]:
-    players = round_obj.players
-    current_bet = round_obj.current_bet
-    acting_order = _acting_order(round_obj)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Set up one throwaway game and bot per worker so the first real player
+    # doesn't pay for cold code paths and lazily-filled tables
+    await asyncio.to_thread(_run_start_game, StartGameRequest(), "warmup")
+    expiry = asyncio.create_task(_expire_sessions())
+    yield
+    expiry.cancel()
+    with suppress(asyncio.CancelledError):
+        await expiry
 
-    # Get active players (including all-in players who are still active)
-    active_players = [p for p in players if p.is_active]
-    if len(active_players) <= 1:
-        return None
 
-    # Get players who can still act (not all-in)
-    can_act_players = [p for p in active_players if p.can_act()]
-    
-    # Track who has acted this street (exclude blinds)
-    acted_names = _acted_names_nonblind(round_obj)
+app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
 
-    # If there are no players who can act (all all-in), check if bets need to be matched
-    if not can_act_players:
-        # All players are all-in - no one can act anymore
-        return None
+app.add_middleware(
+    CORSMiddleware,
+    # Allow any dev origin (handles localhost, 127.0.0.1, LAN IPs, etc.)
+    allow_origin_regex=r".*",
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
 
-    # Iterate acting order to find someone who needs to act
-    for pos in acting_order:
-        p = players[pos]
-        # Skip if not active
-        if not p.is_active:
-            continue
-        # Skip all-in players (they can't act, but check if others need to match their bet)
-        if not p.can_act():
-            continue
-        if current_bet == 0:
-            # No outstanding bet: player acts if they haven't acted yet this street
-            if p.name not in acted_names:
-                return p
-        else:
-            # There is a bet; act if not matched OR if they haven't acted yet (e.g., BB option preflop)
-            if p.current_bet < current_bet:
-                return p
-            if p.name not in acted_names:
-                return p
-    
-    # If no one can act but there's a bet and someone hasn't matched it, 
-    # check if an all-in player raised and the other player needs to match
-    if current_bet > 0 and len(can_act_players) == 0:
-        # All players are all-in, no one can act
-        return None
-    
-    return None
+# Bounded so abandoned games are dropped: a session expires after an hour
+# without requests, and the least recently used goes first when full. Only
+# touched from the event loop (TTLCache is not thread-safe).
+SESSION_TTL_SECONDS = 3600
+MAX_SESSIONS = 10000
+SESSIONS: "TTLCache[str, SessionState]" = TTLCache(maxsize=MAX_SESSIONS, ttl=SESSION_TTL_SECONDS)
 
 
-def _legal_actions_for(round_obj, player: Player) -> Dict[str, Any]:
-    return ActionManager.get_legal_actions(
-        player,
-        round_obj.players,
+def _get_session(session_id: str) -> SessionState:
+    session = SESSIONS.get(session_id)
+    if not session:
+        raise HTTPException(status_code=404, detail="Session not found")
+    # Re-insert to restart the expiry clock for games still being played
+    SESSIONS[session_id] = session
+    return session
+
+
+def _acted_mask_nonblind(round_obj) -> int:
+    """Return bitmask of seats (bit i = players[i]) with a non-blind action on this street."""
+    return round_obj.acted_mask_by_street.get(round_obj.street, 0)
+
+
+def _find_next_to_act(round_obj, session: Optional[SessionState] = None) -> Optional[Player]:
+    if session is None:
+        return next_to_act(round_obj, _acted_mask_nonblind(round_obj))
+    # Every action is recorded in action_history and every deal or settle
+    # changes the street, so (round, street, history length) pins the answer
+    key = (round_obj, round_obj.street, len(round_obj.action_history))
+    cached = session.next_actor_cache
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    actor = next_to_act(round_obj, _acted_mask_nonblind(round_obj))
+    session.next_actor_cache = (key, actor)
+    return actor
+
+
+def _legal_actions_for(round_obj, player: Player, session: Optional[SessionState] = None) -> Dict[str, Any]:
+    if session is None:
+        return ActionManager.get_legal_actions(
+            player,
+            round_obj.players,
+            round_obj.current_bet,
+            round_obj.pot,
+            round_obj.big_blind,
+        )
+    # The same spot is looked up for the state dict, the bot's decision and
+    # validation of the resulting action, so memoize it for the hand
+    p0, p1 = round_obj.players  # heads-up only
+    opponent = p1 if player is p0 else p0
+    key = (
+        player.name,
+        player.current_bet,
+        player.stack,
+        player.can_act(),
+        opponent.current_bet + opponent.stack,
+        opponent.is_active,
         round_obj.current_bet,
         round_obj.pot,
         round_obj.big_blind,
     )
+    legal = session.legal_actions_cache.get(key)
+    if legal is None:
+        legal = ActionManager.get_legal_actions(
+            player,
+            round_obj.players,
+            round_obj.current_bet,
+            round_obj.pot,
+            round_obj.big_blind,
+        )
+        session.legal_actions_cache[key] = legal
+    return legal
 
 
 def _apply_action(round_obj, player: Player, action: str, amount: int, session: Optional[SessionState] = None) -> None:
-    legal = _legal_actions_for(round_obj, player)
+    legal = _legal_actions_for(round_obj, player, session)
     ok, err = ActionManager.validate_action(player, action, amount, legal)
     if not ok:
         raise HTTPException(status_code=400, detail=f"Invalid action: {err}")
+    if session is not None:
+        session.state_dirty = True
+        # Entries are only reused within one spot; drop them once it changes
+        session.legal_actions_cache.clear()
     added = ActionManager.apply_action(player, action, amount, round_obj.current_bet)
     round_obj.pot += added
-    if action.lower() in ["raise", "bet"]:
+    if ActionManager.normalize_action(action) in ("raise", "bet"):
         round_obj.current_bet = amount
     # Record action into round history so turn logic can see who acted
-    try:
-        round_obj._record_action(player.name, action, amount)  # type: ignore[attr-defined]
-    except Exception:
-        # Fallback: append minimal record
-        round_obj.action_history.append({"player": player.name, "action": action, "amount": amount, "street": round_obj.street.value})
-        round_obj.street_actions.setdefault(round_obj.street, []).append({"player": player.name, "action": action, "amount": amount, "street": round_obj.street.value})
+    round_obj._record_action(player.name, action, amount)
     
     # Record action in bot strategy for opponent modeling
     if session is not None:
@@ -183,10 +247,10 @@ def _apply_action(round_obj, player: Player, action: str, amount: int, session:
 
 def _maybe_advance(round_obj, session: Optional[SessionState] = None):
     # Advance street if betting round appears complete
-    active_players = [p for p in round_obj.players if p.is_active]
-    if len(active_players) <= 1:
+    p0, p1 = round_obj.players  # heads-up only
+    if not (p0.is_active and p1.is_active):
         return
-    can_act = [p for p in active_players if p.can_act()]
+    can_act = [p for p in (p0, p1) if p.can_act()]
     
     # If no one can act (all-in situation), deal remaining cards and go to showdown
     if not can_act:
@@ -194,59 +258,44 @@ def _maybe_advance(round_obj, session: Optional[SessionState] = None):
         while round_obj.street != Street.SHOWDOWN and round_obj.street != Street.RIVER:
             round_obj.advance_street()
             if session is not None:
-                if round_obj.street == Street.FLOP and round_obj.community_cards:
-                    board = " ".join(str(c) for c in round_obj.community_cards)
-                    session.action_log.append(f"Flop dealt: {board}")
-                elif round_obj.street == Street.TURN and round_obj.community_cards:
-                    session.action_log.append(f"Turn dealt: {str(round_obj.community_cards[-1])}")
+                session.state_dirty = True
+                session.board_strs = [str(c) for c in round_obj.community_cards]
+                if round_obj.street == Street.FLOP and session.board_strs:
+                    session.action_log.append(f"Flop dealt: {' '.join(session.board_strs)}")
+                elif round_obj.street == Street.TURN and session.board_strs:
+                    session.action_log.append(f"Turn dealt: {session.board_strs[-1]}")
         
         # If we're at river and all-in, go to showdown
         if round_obj.street == Street.RIVER:
             round_obj.advance_street()
-            if session is not None and round_obj.community_cards:
-                session.action_log.append(f"River dealt: {str(round_obj.community_cards[-1])}")
+            if session is not None:
+                session.state_dirty = True
+                session.board_strs = [str(c) for c in round_obj.community_cards]
+                if session.board_strs:
+                    session.action_log.append(f"River dealt: {session.board_strs[-1]}")
         return
     
-    # All players must have acted at least once this street (excluding blinds) AND bets must be equal
-    acted_names = _acted_names_nonblind(round_obj)
-    all_acted_once = all(p.name in acted_names for p in can_act)
-    bets_equal = len(set(p.current_bet for p in can_act)) == 1
-    
-    # Also check if bets are equal across ALL active players (including all-ins)
-    all_bets_equal = len(set(p.current_bet for p in active_players)) == 1
+    # All players that can act must have acted at least once this street (excluding blinds)
+    # AND bets must be equal across both players (including an all-in player)
+    acted_mask = _acted_mask_nonblind(round_obj)
+    all_acted_once = all(
+        acted_mask >> seat & 1
+        for seat, p in enumerate((p0, p1))
+        if p.can_act()
+    )
     
-    if all_acted_once and bets_equal and all_bets_equal:
-        # Check if all players are all-in - if so, deal remaining cards and go to showdown
-        all_all_in = all(not p.can_act() for p in active_players)
-        if all_all_in:
-            # Deal remaining cards up to river, then go to showdown
-            while round_obj.street != Street.SHOWDOWN:
-                prev_street = round_obj.street
-                round_obj.advance_street()
-                if session is not None:
-                    if round_obj.street == Street.FLOP and round_obj.community_cards:
-                        board = " ".join(str(c) for c in round_obj.community_cards)
-                        session.action_log.append(f"Flop dealt: {board}")
-                    elif round_obj.street == Street.TURN and round_obj.community_cards:
-                        session.action_log.append(f"Turn dealt: {str(round_obj.community_cards[-1])}")
-                    elif round_obj.street == Street.RIVER and round_obj.community_cards:
-                        session.action_log.append(f"River dealt: {str(round_obj.community_cards[-1])}")
-                    elif round_obj.street == Street.SHOWDOWN:
-                        if prev_street == Street.RIVER:
-                            session.action_log.append("All-in: Going to showdown")
-                if round_obj.street == Street.SHOWDOWN:
-                    break
-        else:
-            # Normal advance to next street
-            round_obj.advance_street()
-            if session is not None:
-                if round_obj.street == Street.FLOP and round_obj.community_cards:
-                    board = " ".join(str(c) for c in round_obj.community_cards)
-                    session.action_log.append(f"Flop dealt: {board}")
-                elif round_obj.street == Street.TURN and round_obj.community_cards:
-                    session.action_log.append(f"Turn dealt: {str(round_obj.community_cards[-1])}")
-                elif round_obj.street == Street.RIVER and round_obj.community_cards:
-                    session.action_log.append(f"River dealt: {str(round_obj.community_cards[-1])}")
+    if all_acted_once and p0.current_bet == p1.current_bet:
+        # Normal advance to next street (someone can still act, so no all-in runout here)
+        round_obj.advance_street()
+        if session is not None:
+            session.state_dirty = True
+            session.board_strs = [str(c) for c in round_obj.community_cards]
+            if round_obj.street == Street.FLOP and session.board_strs:
+                session.action_log.append(f"Flop dealt: {' '.join(session.board_strs)}")
+            elif round_obj.street == Street.TURN and session.board_strs:
+                session.action_log.append(f"Turn dealt: {session.board_strs[-1]}")
+            elif round_obj.street == Street.RIVER and session.board_strs:
+                session.action_log.append(f"River dealt: {session.board_strs[-1]}")
 
 
 def _maybe_finish_hand(session: SessionState):
@@ -256,9 +305,10 @@ def _maybe_finish_hand(session: SessionState):
         return
     
     # Check if only one player is active (fold case)
-    active_players = [p for p in round_obj.players if p.is_active]
-    if len(active_players) == 1 and not round_obj.is_complete:
+    p0, p1 = round_obj.players
+    if not (p0.is_active and p1.is_active) and not round_obj.is_complete:
         # Someone folded - determine winner immediately
+        session.state_dirty = True
         round_obj.street = Street.SHOWDOWN
         result = round_obj.determine_winner()
         winners = ", ".join(result.get("winners", []))
@@ -271,6 +321,7 @@ def _maybe_finish_hand(session: SessionState):
     # Handle showdown case
     if round_obj.street == Street.SHOWDOWN and not round_obj.is_complete:
         # Determine winners and award pot
+        session.state_dirty = True
         result = round_obj.determine_winner()
         winners = ", ".join(result.get("winners", []))
         session.action_log.append(f"Showdown — Winner(s): {winners}; Pot: {result.get('pot')}")
@@ -301,12 +352,35 @@ def _evaluate_player_hand(player: Player, round_obj) -> Optional[str]:
 
 
 def _state_dict(session: SessionState) -> Dict[str, Any]:
+    """Return the client-facing state, rebuilding it only if the game changed."""
+    if session.state_dirty or session.state_cache is None:
+        session.state_version += 1
+        session.state_cache = _build_state_dict(session)
+        session.state_cache["version"] = session.state_version
+        session.state_dirty = False
+    return session.state_cache
+
+
+def _snapshot(session: SessionState) -> Dict[str, Any]:
+    """
+    State for read-only callers on the event loop.
+    
+    While a mutating request holds session.lock its worker thread may be
+    midway through an action, so serve the last consistent state instead of
+    rebuilding (and caching) a half-applied one.
+    """
+    if session.lock.locked() and session.state_cache is not None:
+        return session.state_cache
+    return _state_dict(session)
+
+
+def _build_state_dict(session: SessionState) -> Dict[str, Any]:
     game = session.game
     round_obj = game.current_round
     # Compute current actor live to avoid stale session flag
     awaiting = None
     if round_obj:
-        next_actor = _find_next_to_act(round_obj)
+        next_actor = _find_next_to_act(round_obj, session)
         awaiting = next_actor.name if next_actor else None
     state = {
         "hand_number": game.hand_number,
@@ -315,11 +389,13 @@ def _state_dict(session: SessionState) -> Dict[str, Any]:
         "street": round_obj.street.value if round_obj else None,
         "pot": round_obj.pot if round_obj else 0,
         "current_bet": round_obj.current_bet if round_obj else 0,
-        "community_cards": [str(c) for c in (round_obj.community_cards if round_obj else [])],
+        "community_cards": session.board_strs if round_obj else [],
         "players": [p.to_dict() for p in game.players],
         "awaiting_player": awaiting,
         "is_complete": round_obj.is_complete if round_obj else False,
-        "action_log": session.action_log,
+        # Copied: the cached dict must not change under its version when
+        # later actions append to session.action_log
+        "action_log": list(session.action_log),
         "big_blind": round_obj.big_blind if round_obj else game.big_blind,
     }
     
@@ -347,36 +423,110 @@ def _state_dict(session: SessionState) -> Dict[str, Any]:
     
     # Include legal actions for the human when it's their turn
     if round_obj and awaiting == session.human_name:
-        # Find the human player object
-        human = next((p for p in game.players if p.name == session.human_name), None)
-        if human is not None:
-            state["legal_actions"] = _legal_actions_for(round_obj, human)
+        human = game.players[session.human_idx]
+        state["legal_actions"] = _legal_actions_for(round_obj, human, session)
     if round_obj and round_obj.is_complete:
-        state["winners"] = getattr(round_obj, "winners", [])
-        state["winning_hand"] = getattr(round_obj, "winning_hand", "")
+        state["winners"] = round_obj.winners
+        state["winning_hand"] = round_obj.winning_hand
         # Build simple hands dict for UI (names and hole cards only)
         state["hands"] = {p.name: {"hole_cards": [str(c) for c in p.hole_cards]} for p in round_obj.players}
     return state
 
 
-def _auto_play_bots(session: SessionState):
+def _advance_or_finish(session: SessionState) -> None:
+    """Close out a completed betting round: deal the next street or settle the hand."""
+    _maybe_advance(session.game.current_round, session)
+    _maybe_finish_hand(session)
+
+
+def _bot_choose_and_apply(session: SessionState, round_obj, actor: Player) -> None:
+    """Pick the bot's action with its strategy and apply it."""
+    amount_to_call = round_obj.current_bet - actor.current_bet
+    
+    # Handle forced all-in FIRST: if bot can't match bet but has chips, call with all chips
+    if amount_to_call > 0 and actor.stack < amount_to_call and actor.stack > 0 and actor.can_act():
+        # Forced all-in: call with remaining chips (player.call will handle this)
+        _apply_action(round_obj, actor, "call", round_obj.current_bet, session)
+        logger.debug("Bot %s forced all-in: called %s with stack %s", actor.name, round_obj.current_bet, actor.stack)
+        return
+    
+    # Use intelligent strategy to decide action
+    legal = _legal_actions_for(round_obj, actor, session)
+    logger.debug(
+        "Bot %s acting: legal=%s, street=%s, current_bet=%s, actor.current_bet=%s, stack=%s",
+        actor.name, legal, round_obj.street.value, round_obj.current_bet, actor.current_bet, actor.stack,
+    )
+    
+    try:
+        # Get opponent's last action for range estimation
+        opponent_last_action = None
+        if round_obj.action_history:
+            # Find most recent opponent action
+            for action_dict in reversed(round_obj.action_history):
+                if action_dict.get('player') == session.human_name:
+                    opponent_last_action = action_dict.get('action')
+                    break
+        
+        # Determine position (simplified for heads-up)
+        position = "BTN" if actor == round_obj.players[round_obj.dealer_position] else "BB"
+        
+        # Get bot's decision
+        action_str, action_amount = session.bot_strategy.decide_action(
+            hero_hand=actor.hole_cards,
+            board=round_obj.community_cards,
+            pot=round_obj.pot,
+            current_bet=round_obj.current_bet,
+            hero_current_bet=actor.current_bet,
+            hero_stack=actor.stack,
+            street=round_obj.street,
+            position=position,
+            legal_actions=legal,
+            big_blind=round_obj.big_blind,
+            opponent_last_action=opponent_last_action
+        )
+        
+        # Apply the action
+        _apply_action(round_obj, actor, action_str, action_amount, session)
+        logger.debug("Bot %s decided: %s %s", actor.name, action_str, action_amount)
+        
+    except Exception as e:
+        # Fallback to safe play if strategy fails
+        logger.warning("Bot strategy error: %s. Falling back to safe play.", e)
+        if legal.get("check"):
+            _apply_action(round_obj, actor, "check", 0, session)
+            logger.debug("Bot %s checked (fallback)", actor.name)
+        elif legal.get("call"):
+            _apply_action(round_obj, actor, "call", round_obj.current_bet, session)
+            logger.debug("Bot %s called (fallback)", actor.name)
+        else:
+            _apply_action(round_obj, actor, "fold", 0, session)
+            logger.debug("Bot %s folded (fallback)", actor.name)
+
+
+def _bot_step(session: SessionState, actor: Optional[Player] = None):
     """
-    Make the bot act ONCE using intelligent strategy.
-    Stop after one action.
-    The frontend will call this again after the timer expires for the next action.
+    Run one bot cycle: act once, then advance the street or settle the hand.
+    
+    Heads-up needs at most one bot decision per request; if the bot is also
+    first to act on the next street, the frontend timer calls /bot_action again.
+    The hand is always settled (if over) when this returns.
+    
+    Args:
+        session: Session to play in
+        actor: Next player to act, if the caller already computed it
     """
     game = session.game
     round_obj = game.current_round
     if not round_obj:
         return
     
-    # Find the next actor
-    actor = _find_next_to_act(round_obj)
+    # Find the next actor; the next actor is only recomputed after the game state changes
+    if actor is None:
+        actor = _find_next_to_act(round_obj, session)
     if not actor:
         # No one needs to act - advance/finish
-        _maybe_advance(round_obj, session)
-        _maybe_finish_hand(session)
-        actor = _find_next_to_act(round_obj)
+        _advance_or_finish(session)
+        actor = _find_next_to_act(round_obj, session)
         if not actor:
             # Hand is complete or no one can act
             return
@@ -386,89 +536,20 @@ def _auto_play_bots(session: SessionState):
         return
     
     # Bot acts ONCE with intelligent strategy
-    amount_to_call = round_obj.current_bet - actor.current_bet
-    
-    # Handle forced all-in FIRST: if bot can't match bet but has chips, call with all chips
-    if amount_to_call > 0 and actor.stack < amount_to_call and actor.stack > 0 and actor.can_act():
-        # Forced all-in: call with remaining chips (player.call will handle this)
-        _apply_action(round_obj, actor, "call", round_obj.current_bet, session)
-        print(f"Bot {actor.name} forced all-in: called {round_obj.current_bet} with stack {actor.stack}")
-    else:
-        # Use intelligent strategy to decide action
-        legal = _legal_actions_for(round_obj, actor)
-        print(f"Bot {actor.name} acting: legal={legal}, street={round_obj.street.value}, current_bet={round_obj.current_bet}, actor.current_bet={actor.current_bet}, stack={actor.stack}")
-        
-        try:
-            # Get opponent's last action for range estimation
-            opponent = next((p for p in round_obj.players if p.name == session.human_name), None)
-            opponent_last_action = None
-            if round_obj.action_history:
-                # Find most recent opponent action
-                for action_dict in reversed(round_obj.action_history):
-                    if action_dict.get('player') == session.human_name:
-                        opponent_last_action = action_dict.get('action')
-                        break
-            
-            # Determine position (simplified for heads-up)
-            position = "BTN" if actor == round_obj.players[round_obj.dealer_position] else "BB"
-            
-            # Get bot's decision
-            action_str, action_amount = session.bot_strategy.decide_action(
-                hero_hand=actor.hole_cards,
-                board=round_obj.community_cards,
-                pot=round_obj.pot,
-                current_bet=round_obj.current_bet,
-                hero_current_bet=actor.current_bet,
-                hero_stack=actor.stack,
-                street=round_obj.street,
-                position=position,
-                legal_actions=legal,
-                big_blind=round_obj.big_blind,
-                opponent_last_action=opponent_last_action
-            )
-            
-            # Apply the action
-            _apply_action(round_obj, actor, action_str, action_amount, session)
-            print(f"Bot {actor.name} decided: {action_str} {action_amount}")
-            
-        except Exception as e:
-            # Fallback to safe play if strategy fails
-            print(f"Bot strategy error: {e}. Falling back to safe play.")
-            if legal.get("check"):
-                _apply_action(round_obj, actor, "check", 0, session)
-                print(f"Bot {actor.name} checked (fallback)")
-            elif legal.get("call"):
-                _apply_action(round_obj, actor, "call", round_obj.current_bet, session)
-                print(f"Bot {actor.name} called (fallback)")
-            else:
-                _apply_action(round_obj, actor, "fold", 0, session)
-                print(f"Bot {actor.name} folded (fallback)")
+    _bot_choose_and_apply(session, round_obj, actor)
     
     # After bot action, check if hand finished
     _maybe_finish_hand(session)
     if round_obj.is_complete:
         return
     
-    # Check if betting round is complete after bot action - if so, advance street
-    # But DON'T continue looping - let the frontend timer handle the next action
-    next_actor = _find_next_to_act(round_obj)
-    if not next_actor:
-        # Betting round complete - advance/finish
-        _maybe_advance(round_obj, session)
-        _maybe_finish_hand(session)
-        # After advancing, return - let frontend timer handle next action
-        return
-    
-    # If it's now human's turn, we're done
-    if next_actor.name == session.human_name:
-        return
-    
-    # Otherwise, bot will need to act again, but that's for the NEXT bot_action call
-    # Don't loop - stop here and let the frontend timer trigger the next action
+    # If the betting round is now complete, advance the street. Whoever acts next
+    # (human or bot) is left for the next request - the frontend timer drives it.
+    if not _find_next_to_act(round_obj, session):
+        _advance_or_finish(session)
 
 
-@app.post("/start_game")
-def start_game(req: StartGameRequest) -> Dict[str, Any]:
+def _run_start_game(req: StartGameRequest, session_id: str) -> Tuple[SessionState, Dict[str, Any]]:
     game = Game(
         req.player_name,
         req.bot_name,
@@ -478,39 +559,26 @@ def start_game(req: StartGameRequest) -> Dict[str, Any]:
         seed=None,
     )
     game.start_new_hand()
-    session_id = str(uuid.uuid4())
-    SESSIONS[session_id] = SessionState(game, req.player_name, req.bot_name)
+    session = SessionState(game, req.player_name, req.bot_name)
     # Initial log
-    SESSIONS[session_id].action_log.append(f"Hand #{game.hand_number} started. Dealer: {game.players[game.dealer_position].name}")
+    session.action_log.append(f"Hand #{game.hand_number} started. Dealer: {game.players[game.dealer_position].name}")
     # Don't auto-play bots here - let the frontend timer control bot actions
     # Check who should act first and set awaiting_player accordingly
     round_obj = game.current_round
     if round_obj:
-        next_actor = _find_next_to_act(round_obj)
+        next_actor = _find_next_to_act(round_obj, session)
         if next_actor and next_actor.name != req.player_name:
             # Bot acts first - frontend will handle the timer
             pass
-    return {"session_id": session_id, "state": _state_dict(SESSIONS[session_id])}
-
-
-@app.get("/state")
-def get_state(session_id: str) -> Dict[str, Any]:
-    session = SESSIONS.get(session_id)
-    if not session:
-        raise HTTPException(status_code=404, detail="Session not found")
-    return _state_dict(session)
+    return session, {"session_id": session_id, "state": _state_dict(session)}
 
 
-@app.post("/player_action")
-def player_action(req: PlayerActionRequest) -> Dict[str, Any]:
-    session = SESSIONS.get(req.session_id)
-    if not session:
-        raise HTTPException(status_code=404, detail="Session not found")
+def _run_player_action(session: SessionState, req: PlayerActionRequest) -> Dict[str, Any]:
     game = session.game
     round_obj = game.current_round
     if not round_obj:
         raise HTTPException(status_code=400, detail="No active hand")
-    player_to_act = _find_next_to_act(round_obj)
+    player_to_act = _find_next_to_act(round_obj, session)
     # Only allow action when it's human's turn
     if not player_to_act or player_to_act.name != session.human_name:
         raise HTTPException(status_code=400, detail="Not waiting for player action")
@@ -520,16 +588,13 @@ def player_action(req: PlayerActionRequest) -> Dict[str, Any]:
     # After action, check if there's a next actor
     # IMPORTANT: Only advance if NO ONE needs to act (not even the bot)
     # If bot needs to act, return state with awaiting_player set to bot name
-    next_actor = _find_next_to_act(round_obj)
+    next_actor = _find_next_to_act(round_obj, session)
     
     if not next_actor:
         # No one needs to act - betting round is complete, advance/finish
-        _maybe_advance(round_obj, session)
-        _maybe_finish_hand(session)
+        _advance_or_finish(session)
     # Don't auto-play bots here - let the frontend timer control bot actions
     # The frontend will call bot_action endpoint after the timer expires
-    # Make sure we finish the hand if it's complete after advancing
-    _maybe_finish_hand(session)
     
     # Return state - _state_dict will compute awaiting_player from _find_next_to_act
     # This ensures awaiting_player is always correct based on current game state
@@ -537,48 +602,40 @@ def player_action(req: PlayerActionRequest) -> Dict[str, Any]:
     return state
 
 
-@app.get("/bot_action")
-def bot_action(session_id: str) -> Dict[str, Any]:
-    session = SESSIONS.get(session_id)
-    if not session:
-        raise HTTPException(status_code=404, detail="Session not found")
+def _run_bot_action(session: SessionState) -> Dict[str, Any]:
     game = session.game
     round_obj = game.current_round
     if not round_obj:
         raise HTTPException(status_code=400, detail="No active hand")
 
     # Debug: Check who should act before bot action
-    next_before = _find_next_to_act(round_obj)
-    if next_before:
-        print(f"Bot action called: Next to act is {next_before.name} on {round_obj.street.value}, current_bet={round_obj.current_bet}")
-        for p in round_obj.players:
-            print(f"  {p.name}: current_bet={p.current_bet}, can_act={p.can_act()}, is_active={p.is_active}")
-    else:
-        print(f"Bot action called: No one to act on {round_obj.street.value}")
+    next_before = _find_next_to_act(round_obj, session)
+    if logger.isEnabledFor(logging.DEBUG):
+        if next_before:
+            logger.debug(
+                "Bot action called: Next to act is %s on %s, current_bet=%s",
+                next_before.name, round_obj.street.value, round_obj.current_bet,
+            )
+            for p in round_obj.players:
+                logger.debug("  %s: current_bet=%s, can_act=%s, is_active=%s", p.name, p.current_bet, p.can_act(), p.is_active)
+        else:
+            logger.debug("Bot action called: No one to act on %s", round_obj.street.value)
 
     # Let bot act - this will handle the action and advance/finish as needed
-    _auto_play_bots(session)
-    # Make sure we finish the hand if it's complete
-    _maybe_finish_hand(session)
+    _bot_step(session, next_before)
     # Return updated state
     return _state_dict(session)
 
 
-@app.get("/")
-def root():
-    return {"ok": True}
-
-
-@app.post("/next_hand")
-def next_hand(req: NextHandRequest) -> Dict[str, Any]:
-    session = SESSIONS.get(req.session_id)
-    if not session:
-        raise HTTPException(status_code=404, detail="Session not found")
+def _run_next_hand(session: SessionState) -> Dict[str, Any]:
     game = session.game
     # Start a new hand
     # Rotate dealer button heads-up
     game.dealer_position = 1 - game.dealer_position
     game.start_new_hand()
+    session.state_dirty = True
+    session.legal_actions_cache = {}
+    session.board_strs = []
     # Reset and log new hand start
     session.action_log = [
         f"Hand #{game.hand_number} started. Dealer: {game.players[game.dealer_position].name}"
@@ -587,3 +644,236 @@ def next_hand(req: NextHandRequest) -> Dict[str, Any]:
     return _state_dict(session)
 
 
+# Routes are async so they don't each occupy a threadpool slot; the engine work
+# (dealing, bot decisions with equity simulations) runs via asyncio.to_thread so
+# the event loop stays free to serve other sessions meanwhile. Mutating routes
+# hold session.lock so a single session is strictly serialized.
+
+@app.post("/start_game", response_model=None)
+async def start_game(req: StartGameRequest) -> Dict[str, Any]:
+    session_id = str(uuid.uuid4())
+    session, payload = await asyncio.to_thread(_run_start_game, req, session_id)
+    SESSIONS[session_id] = session
+    return payload
+
+
+@app.get("/state", response_model=None)
+async def get_state(
+    request: Request,
+    response: Response,
+    version: Optional[int] = None,
+    since: Optional[int] = None,
+    session: SessionState = Depends(_get_session),
+) -> Any:
+    """
+    Poll the session state.
+    
+    Responses carry an ETag of the state version; sending it back in
+    If-None-Match gets an empty 304 until the state changes. Alternatively
+    pass the last seen ``version`` to get just ``{"version", "unchanged": true}``.
+    ``since`` (the action-log length already shown) limits the log to newer
+    entries, starting at ``action_log_start``. Without any of these, the full
+    state is returned.
+    """
+    state = _snapshot(session)
+    etag = f'"{state["version"]}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    if version is not None and version == state["version"]:
+        return {"version": version, "unchanged": True}
+    if since is not None:
+        log = state["action_log"]
+        # The log restarts each hand; a stale offset gets the whole log
+        start = since if 0 <= since <= len(log) else 0
+        state = dict(state, action_log=log[start:], action_log_start=start)
+    return state
+
+
+@app.post("/player_action", response_model=None)
+async def player_action(req: PlayerActionRequest) -> Dict[str, Any]:
+    session = _get_session(req.session_id)
+    async with session.lock:
+        state = await asyncio.to_thread(_run_player_action, session, req)
+        await _broadcast(session, state)
+        return state
+
+
+@app.get("/bot_action", response_model=None)
+async def bot_action(session: SessionState = Depends(_get_session)) -> Dict[str, Any]:
+    async with session.lock:
+        state = await asyncio.to_thread(_run_bot_action, session)
+        await _broadcast(session, state)
+        return state
+
+
+# Health check; the body never changes, so the response is built once
+_ROOT_RESPONSE = ORJSONResponse({"ok": True})
+
+
+@app.get("/", response_model=None)
+async def root() -> ORJSONResponse:
+    return _ROOT_RESPONSE
+
+
+@app.post("/next_hand", response_model=None)
+async def next_hand(req: NextHandRequest) -> Dict[str, Any]:
+    session = _get_session(req.session_id)
+    async with session.lock:
+        state = await asyncio.to_thread(_run_next_hand, session)
+        await _broadcast(session, state)
+        return state
+
+
+# WebSocket play: the client sends {"type": "player_action", "action", "amount"}
+# or {"type": "next_hand"}. Each socket gets the full state on connect, then a
+# delta after every change to the session, whichever client made it: the
+# top-level keys whose values changed (None for keys that went away) plus the
+# new action-log entries, to be spliced in at action_log_start. The server
+# plays the bot's turns itself, pausing BOT_THINK_SECONDS before each, so no
+# /bot_action timer or /state polling is needed on this path. With no think
+# time, consecutive bot turns are played as one batch and the client gets a
+# single update once it's the human's move again.
+BOT_THINK_SECONDS = 1.0
+
+
+def _state_delta(session: SessionState, state: Dict[str, Any]) -> Dict[str, Any]:
+    prev = session.last_broadcast
+    log = state["action_log"]
+    if prev is None or prev["hand_number"] != state["hand_number"]:
+        start = 0  # the log restarts with each hand
+    else:
+        start = min(session.broadcast_log_len, len(log))
+    if prev is None:
+        delta = {k: v for k, v in state.items() if k != "action_log"}
+    else:
+        delta = {k: v for k, v in state.items() if k != "action_log" and prev.get(k) != v}
+        delta.update((k, None) for k in prev if k not in state)
+    delta["action_log"] = log[start:]
+    delta["action_log_start"] = start
+    session.last_broadcast = state
+    session.broadcast_log_len = len(log)
+    return delta
+
+
+async def _broadcast(session: SessionState, state: Dict[str, Any]) -> None:
+    """Push the change since the last broadcast to every open socket (hold session.lock)."""
+    if not session.subscribers:
+        return
+    payload = orjson.dumps(_state_delta(session, state)).decode()
+    for websocket in list(session.subscribers):
+        try:
+            await websocket.send_text(payload)
+        except Exception:
+            session.subscribers.discard(websocket)
+
+
+def _bot_to_act(session: SessionState) -> bool:
+    round_obj = session.game.current_round
+    if not round_obj or round_obj.is_complete:
+        return False
+    actor = _find_next_to_act(round_obj, session)
+    return actor is not None and actor.name != session.human_name
+
+
+def _run_bot_turns(session: SessionState) -> Dict[str, Any]:
+    """Play bot steps until the human must act or the hand is over."""
+    while _bot_to_act(session):
+        _bot_step(session)
+    return _state_dict(session)
+
+
+def _run_bot_turn_if_due(session: SessionState) -> Optional[Dict[str, Any]]:
+    """Play one bot step if it's still the bot's turn; None otherwise."""
+    if not _bot_to_act(session):
+        return None
+    return _run_bot_action(session)
+
+
+async def _ws_send(websocket: WebSocket, payload: Dict[str, Any]) -> None:
+    await websocket.send_text(orjson.dumps(payload).decode())
+
+
+async def _ws_play_bots(websocket: WebSocket, session: SessionState) -> None:
+    # Whose turn it is is read under session.lock like any other session
+    # state, and re-checked after the think pause in case another client
+    # acted meanwhile
+    if BOT_THINK_SECONDS <= 0:
+        async with session.lock:
+            if _bot_to_act(session):
+                state = await asyncio.to_thread(_run_bot_turns, session)
+                await _broadcast(session, state)
+        return
+    while True:
+        async with session.lock:
+            if not _bot_to_act(session):
+                return
+        await asyncio.sleep(BOT_THINK_SECONDS)
+        async with session.lock:
+            state = await asyncio.to_thread(_run_bot_turn_if_due, session)
+            if state is None:
+                return
+            await _broadcast(session, state)
+
+
+@app.websocket("/ws/{session_id}")
+async def play_ws(websocket: WebSocket, session_id: str) -> None:
+    session = SESSIONS.get(session_id)
+    if not session:
+        await websocket.close(code=4404)
+        return
+    await websocket.accept()
+    try:
+        async with session.lock:
+            state = _state_dict(session)
+            await _ws_send(websocket, state)
+            # Deltas for everyone continue from the state this socket just got
+            session.last_broadcast = state
+            session.broadcast_log_len = len(state["action_log"])
+            session.subscribers.add(websocket)
+        try:
+            await _ws_play_bots(websocket, session)
+        except HTTPException as e:
+            await _ws_send(websocket, {"error": e.detail})
+        while True:
+            try:
+                msg = await websocket.receive_json()
+            except (ValueError, KeyError):
+                # Not JSON, or a binary frame
+                await _ws_send(websocket, {"error": "Invalid message"})
+                continue
+            if not isinstance(msg, dict):
+                await _ws_send(websocket, {"error": "Invalid message"})
+                continue
+            if SESSIONS.get(session_id) is None:
+                # Expired while the socket was open
+                await websocket.close(code=4404)
+                return
+            # Keep the session alive while it's played over the socket
+            SESSIONS[session_id] = session
+            msg_type = msg.get("type")
+            if msg_type not in ("next_hand", "player_action"):
+                continue
+            try:
+                if msg_type == "player_action":
+                    req = PlayerActionRequest(
+                        session_id=session_id,
+                        action=msg.get("action", ""),
+                        amount=msg.get("amount", 0),
+                    )
+                async with session.lock:
+                    if msg_type == "next_hand":
+                        state = await asyncio.to_thread(_run_next_hand, session)
+                    else:
+                        state = await asyncio.to_thread(_run_player_action, session, req)
+                    await _broadcast(session, state)
+                await _ws_play_bots(websocket, session)
+            except ValidationError:
+                # e.g. a non-integer amount or a null action
+                await _ws_send(websocket, {"error": "Invalid message"})
+            except HTTPException as e:
+                await _ws_send(websocket, {"error": e.detail})
+    except WebSocketDisconnect:
+        return
+    finally:
+        session.subscribers.discard(websocket)
@@ -0,0 +1,79 @@
+"""
+Heads-up turn order for the API.
+
+Kept free of FastAPI and session state, with plain typed ints, so the
+module can be compiled with mypyc (``mypyc backend/turn_logic.py``) and
+imported by app.py unchanged.
+"""
+
+from typing import Dict, Optional, Tuple
+
+from pypokerengine.engine.player import Player
+from pypokerengine.engine.round import Round
+
+
+# Turn order as a lookup table. Each seat contributes three flag bits
+# (SEAT_*, shifted by 3 * seat) and the table maps (first seat to act on
+# this street, flags) to the seat that must act next, or None when the
+# street's betting is closed. A seat acts if it can act and either faces an
+# unmatched bet or hasn't taken a non-blind action yet (e.g. the BB option).
+SEAT_CAN_ACT = 1
+SEAT_ACTED = 2
+SEAT_UNMATCHED = 4
+
+
+def _next_seat(first: int, flags: int) -> Optional[int]:
+    for pos in (first, 1 - first):
+        seat = flags >> (3 * pos)
+        if not seat & SEAT_CAN_ACT:
+            continue
+        if seat & SEAT_UNMATCHED or not seat & SEAT_ACTED:
+            return pos
+    return None
+
+
+NEXT_TO_ACT: Dict[Tuple[int, int], Optional[int]] = {
+    (first, flags): _next_seat(first, flags)
+    for first in (0, 1)
+    for flags in range(64)
+}
+
+
+def seat_flags(player: Player, current_bet: int, acted: bool) -> int:
+    """Pack one seat's SEAT_* flags for the current street."""
+    flags = 0
+    if player.can_act():
+        flags |= SEAT_CAN_ACT
+    if acted:
+        flags |= SEAT_ACTED
+    if player.current_bet < current_bet:
+        flags |= SEAT_UNMATCHED
+    return flags
+
+
+def next_to_act(round_obj: Round, acted_mask: int) -> Optional[Player]:
+    """
+    Find the player who must act next on the current street.
+    
+    Args:
+        round_obj: Current heads-up round
+        acted_mask: Seats with a non-blind action on this street (bit i = seat i)
+        
+    Returns:
+        Player to act, or None if the hand is decided or the street is closed
+    """
+    players = round_obj.players
+    p0, p1 = players  # heads-up only
+
+    # Hand is decided once either player has folded
+    if not (p0.is_active and p1.is_active):
+        return None
+
+    first = round_obj.acting_order[0]
+    current_bet = round_obj.current_bet
+    flags = (
+        seat_flags(p0, current_bet, bool(acted_mask & 1))
+        | (seat_flags(p1, current_bet, bool(acted_mask & 2)) << 3)
+    )
+    pos = NEXT_TO_ACT[first, flags]
+    return None if pos is None else players[pos]
@@ -74,9 +74,12 @@ def demo_hand_evaluation():
     ]
     
     print("Evaluating poker hands:")
-    for card_strings, expected in test_hands:
-        cards = [Card.from_string(s) for s in card_strings]
-        rank, tiebreakers, hand_name = HandEvaluator.evaluate_hand(cards)
+    masks = [
+        HandEvaluator.hand_mask([Card.from_string(s) for s in card_strings])
+        for card_strings, _ in test_hands
+    ]
+    results = HandEvaluator.evaluate_batch(masks)
+    for (card_strings, expected), (rank, tiebreakers, hand_name) in zip(test_hands, results):
         cards_str = " ".join(card_strings)
         print(f"  {cards_str:25} → {hand_name}")
     
@@ -7,6 +7,7 @@ Shows how to track player stats, estimate ranges, and predict opponent behavior.
 
 import sys
 import os
+import numpy as np
 
 # Add parent directory to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -16,7 +17,7 @@ from pypokerengine.opponent_modeling import (
     HandHistory, ActionRecord, Street,
     RuleBasedRangeEstimator,
     RangePredictor, HybridRangeEstimator,
-    extract_features
+    extract_features, extract_features_batch
 )
 
 
@@ -30,17 +31,21 @@ def demo_player_profile():
     # Create profile
     profile = PlayerProfile(player_id="villain_1")
     
+    # Draw every hand's random decisions up front
+    n_hands = 50
+    rng = np.random.default_rng()
+    enters = rng.random(n_hands) < 0.25  # 25% VPIP
+    raises = rng.random(n_hands) < 0.20  # 20% PFR
+    sees_flop = enters & (rng.random(n_hands) < 0.7)  # See flop 70% of time
+    postflop_actions = np.array(["bet", "call", "check", "fold"])[rng.integers(0, 4, size=n_hands)]
+    
     # Simulate 50 hands
-    for hand_num in range(50):
-        # Randomly decide if player enters pot
-        import random
-        enters_pot = random.random() < 0.25  # 25% VPIP
-        raises = random.random() < 0.20  # 20% PFR
-        
-        if enters_pot:
+    for hand_num in range(n_hands):
+        if enters[hand_num]:
+            is_raise = bool(raises[hand_num])
             profile.update_preflop_action(
-                action="raise" if raises else "call",
-                is_raise=raises,
+                action="raise" if is_raise else "call",
+                is_raise=is_raise,
                 is_voluntary=True
             )
         else:
@@ -51,8 +56,8 @@ def demo_player_profile():
             )
         
         # Add some postflop actions
-        if enters_pot and random.random() < 0.7:  # See flop 70% of time
-            action_type = random.choice(["bet", "call", "check", "fold"])
+        if sees_flop[hand_num]:
+            action_type = str(postflop_actions[hand_num])
             profile.update_postflop_action(
                 action=action_type,
                 is_bet=action_type == "bet",
@@ -109,14 +114,17 @@ def demo_hand_history():
         winner="villain"
     )
     
+    hand = history.hands[0]
     print(f"Hands recorded: {len(history)}")
-    print(f"\nHand #{history.hands[0].hand_id}:")
-    print(f"  Board: {', '.join(history.hands[0].board)}")
-    print(f"  Winner: {history.hands[0].winner}")
-    print(f"  Total actions: {len(history.hands[0].actions)}")
+    print(f"\nHand #{hand.hand_id}:")
+    print(f"  Board: {', '.join(hand.board)}")
+    print(f"  Winner: {hand.winner}")
+    print(f"  Total actions: {len(hand.actions)}")
     print(f"\n  Action sequence:")
-    for i, action in enumerate(history.hands[0].actions, 1):
-        print(f"    {i}. {action.street.value:8s} - {action.player_id:8s} {action.action_type:6s} ${action.amount:4d}")
+    print("\n".join(
+        f"    {i}. {action.street.value:8s} - {action.player_id:8s} {action.action_type:6s} ${action.amount:4d}"
+        for i, action in enumerate(hand.actions, 1)
+    ))
 
 
 def demo_rule_based_estimation():
@@ -205,17 +213,42 @@ def demo_feature_extraction():
     for i in range(min(15, len(features))):
         print(f"  {feature_names[i]:25s}: {features[i]:.4f}")
     print(f"  ... ({len(features) - 15} more features)")
+    
+    # Featurize many situations in one call
+    n_situations = 100
+    streets = [Street.PREFLOP, Street.FLOP, Street.TURN, Street.RIVER]
+    boards = [None, ["As", "Kh", "Qd"], ["As", "Kh", "Qd", "7c"], ["As", "Kh", "Qd", "7c", "2s"]]
+    batch = extract_features_batch(
+        player_profiles=[profile] * n_situations,
+        actions=[("bet", "call", "check", "raise", "fold")[i % 5] for i in range(n_situations)],
+        streets=[streets[i % 4] for i in range(n_situations)],
+        boards=[boards[i % 4] for i in range(n_situations)],
+        positions=[("BTN", "BB")[i % 2] for i in range(n_situations)],
+        amounts=[25 * (i % 5) for i in range(n_situations)],
+        pot_sizes=[100 + 10 * i for i in range(n_situations)],
+        effective_stacks=[1000 - 5 * i for i in range(n_situations)],
+        facing_bets=[10 * (i % 3) for i in range(n_situations)]
+    )
+    print(f"\nBatch of {n_situations} situations → feature matrix shape: {batch.shape}")
+
+
+MODEL_PATH = "models/range_model.pkl"
+
 
+def load_range_model():
+    """Load the trained range model once for the ML demos (None if missing)."""
+    if not os.path.exists(MODEL_PATH):
+        return None
+    return RangePredictor.load(MODEL_PATH)
 
-def demo_ml_prediction():
+
+def demo_ml_prediction(predictor):
     """Demonstrate ML-based range prediction (if model exists)."""
     print("\n\n" + "=" * 80)
     print("DEMO 5: ML-BASED RANGE PREDICTION")
     print("=" * 80)
     
-    model_path = "models/range_model.pkl"
-    
-    if not os.path.exists(model_path):
+    if predictor is None:
         print("\n⚠️  ML model not found!")
         print(f"\nTo train the model:")
         print(f"  1. Generate training data: python scripts/generate_training_data.py")
@@ -225,9 +258,6 @@ def demo_ml_prediction():
     
     print("\nUsing trained ML model to predict ranges...\n")
     
-    # Load model
-    predictor = RangePredictor.load(model_path)
-    
     # Create sample profile
     profile = PlayerProfile(player_id="villain", hands_played=100)
     profile.vpip_count = 25
@@ -253,7 +283,7 @@ def demo_ml_prediction():
             print(f"  {category:15s}: {prob:.1%}")
 
 
-def demo_hybrid_approach():
+def demo_hybrid_approach(ml_predictor):
     """Demonstrate hybrid rule-based + ML approach."""
     print("\n\n" + "=" * 80)
     print("DEMO 6: HYBRID APPROACH (Rules + ML)")
@@ -268,12 +298,7 @@ def demo_hybrid_approach():
     profile.postflop_raises = 20
     profile.postflop_calls = 25
     
-    # Try to load ML model
-    model_path = "models/range_model.pkl"
-    ml_predictor = None
-    
-    if os.path.exists(model_path):
-        ml_predictor = RangePredictor.load(model_path)
+    if ml_predictor is not None:
         print("✓ ML model loaded")
     else:
         print("⚠️  ML model not found - using rule-based fallback only")
@@ -302,21 +327,29 @@ def demo_hybrid_approach():
         print("\n✓ Fell back to rule-based estimation")
 
 
+_BANNER = "\n".join([
+    "\n",
+    "╔" + "═" * 78 + "╗",
+    "║" + " " * 20 + "OPPONENT MODELING SYSTEM DEMO" + " " * 29 + "║",
+    "║" + " " * 78 + "║",
+    "║" + "  Phase 3: Track opponents, estimate ranges, predict behavior" + " " * 16 + "║",
+    "╚" + "═" * 78 + "╝",
+])
+
+
 def main():
     """Run all demos."""
-    print("\n")
-    print("╔" + "═" * 78 + "╗")
-    print("║" + " " * 20 + "OPPONENT MODELING SYSTEM DEMO" + " " * 29 + "║")
-    print("║" + " " * 78 + "║")
-    print("║" + "  Phase 3: Track opponents, estimate ranges, predict behavior" + " " * 16 + "║")
-    print("╚" + "═" * 78 + "╝")
+    print(_BANNER)
     
     demo_player_profile()
     demo_hand_history()
     demo_rule_based_estimation()
     demo_feature_extraction()
-    demo_ml_prediction()
-    demo_hybrid_approach()
+    
+    # Both ML demos share one loaded model
+    predictor = load_range_model()
+    demo_ml_prediction(predictor)
+    demo_hybrid_approach(predictor)
     
     print("\n\n" + "=" * 80)
     print("✅ DEMO COMPLETE!")
@@ -19,19 +19,14 @@ def simple_ai_strategy(player, legal_actions, street):
         street: Current betting street
     
     Returns:
-        Tuple of (action, amount)
+        Tuple of (action, amount); a call's amount is left to the caller,
+        since legal_actions only flags whether calling is allowed
     """
-    if legal_actions.get("check"):
+    if legal_actions["check"]:
         return "check", 0
-    elif legal_actions.get("call"):
-        # For call, we need to determine the amount to call
-        # The legal_actions['call'] should contain the amount
-        call_amount = legal_actions.get('call', 0)
-        if isinstance(call_amount, dict):
-            call_amount = call_amount.get('amount', 0)
-        return "call", call_amount
-    else:
-        return "fold", 0
+    if legal_actions["call"]:
+        return "call", 0
+    return "fold", 0
 
 
 def main():
@@ -55,6 +50,17 @@ def main():
         seed=42  # For reproducible results
     )
     
+    # Action callback, shared by every hand
+    def get_action(player, legal_actions, street):
+        action, amount = simple_ai_strategy(player, legal_actions, street)
+        
+        # Determine actual amount for call/raise
+        if action == "call":
+            amount = game.current_round.current_bet
+        
+        print(f"  {player.name} {action}s" + (f" {amount}" if amount > 0 else ""))
+        return action, amount
+    
     hands_played = 0
     max_hands = 50  # Limit number of hands for demo
     
@@ -70,17 +76,6 @@ def main():
         for player in game.players:
             print(f"{player.name}: {player.stack} chips")
         
-        # Define action callback
-        def get_action(player, legal_actions, street):
-            action, amount = simple_ai_strategy(player, legal_actions, street)
-            
-            # Determine actual amount for call/raise
-            if action == "call" and legal_actions.get("call"):
-                amount = game.current_round.current_bet
-            
-            print(f"  {player.name} {action}s" + (f" {amount}" if amount > 0 else ""))
-            return action, amount
-        
         # Play the hand
         try:
             result = game.play_hand(get_action)
@@ -18,7 +18,9 @@ from pypokerengine.engine import (
     Player, HandEvaluator, HandRank,
     ActionManager, Round, Street, Game
 )
-from pypokerengine.utils import setup_game_logger
+from pypokerengine.utils import (
+    setup_game_logger, ACTION_COMMANDS, RAISE_RE, ACTION_PROMPT, INVALID_CHOICE, board_string
+)
 import logging
 
 
@@ -367,20 +369,16 @@ class InteractiveTester:
         
         # Simple AI strategy for Bob
         def bob_strategy(player, legal_actions, street):
-            print(f"\n--- {player.name}'s turn on {street.upper()} ---")
-            
-            # Show the board if there are community cards
-            if game.current_round.community_cards:
-                board = " ".join(str(c) for c in game.current_round.community_cards)
-                print(f"Board: {board}")
-            else:
-                print("Board: (no community cards yet)")
-            
-            print(f"{player.name}'s cards: {player.get_hole_cards_string()}")
-            print(f"{player.name}'s stack: {player.stack}")
-            print(f"Current bet: {game.current_round.current_bet}")
-            print(f"{player.name}'s bet: {player.current_bet}")
-            print(f"Pot: {game.current_round.pot}")
+            current_round = game.current_round
+            print("\n".join([
+                f"\n--- {player.name}'s turn on {street.upper()} ---",
+                f"Board: {board_string(current_round.community_cards)}",
+                f"{player.name}'s cards: {player.get_hole_cards_string()}",
+                f"{player.name}'s stack: {player.stack}",
+                f"Current bet: {current_round.current_bet}",
+                f"{player.name}'s bet: {player.current_bet}",
+                f"Pot: {current_round.pot}",
+            ]))
             
             if legal_actions.get('check'):
                 print(f"{player.name} checks")
@@ -388,7 +386,7 @@ class InteractiveTester:
             elif legal_actions.get('call'):
                 print(f"{player.name} calls")
                 # For call, we need to determine the amount to call
-                current_bet = game.current_round.current_bet
+                current_bet = current_round.current_bet
                 return 'call', current_bet
             else:
                 print(f"{player.name} folds")
@@ -399,62 +397,64 @@ class InteractiveTester:
             if player.name != "You":
                 return bob_strategy(player, legal_actions, street)
             
-            print(f"\n--- Your turn on {street.upper()} ---")
+            current_round = game.current_round
             
-            # Always show the board if there are community cards
-            if game.current_round.community_cards:
-                board = " ".join(str(c) for c in game.current_round.community_cards)
-                print(f"Board: {board}")
-            else:
-                print("Board: (no community cards yet)")
-            
-            print(f"Your cards: {player.get_hole_cards_string()}")
-            print(f"Your stack: {player.stack}")
-            print(f"Current bet: {game.current_round.current_bet}")
-            print(f"Your bet: {player.current_bet}")
-            print(f"Pot: {game.current_round.pot}")
+            # Look each legal action up once; 'raise' is None when raising isn't allowed
+            can_fold = legal_actions.get('fold')
+            can_check = legal_actions.get('check')
+            can_call = legal_actions.get('call')
+            raise_info = legal_actions.get('raise')
+            if raise_info and not raise_info['allowed']:
+                raise_info = None
             
-            print(f"\nLegal actions:")
-            if legal_actions.get('fold'):
-                print("  [f] Fold")
-            if legal_actions.get('check'):
-                print("  [c] Check")
-            if legal_actions.get('call'):
-                # For call, we need to determine the amount to call
-                current_bet = game.current_round.current_bet
-                print(f"  [c] Call {current_bet}")
-            if legal_actions.get('raise') and legal_actions['raise']['allowed']:
-                raise_info = legal_actions['raise']
-                print(f"  [r] Raise (min: {raise_info['min']}, max: {raise_info['max']})")
+            lines = [
+                f"\n--- Your turn on {street.upper()} ---",
+                f"Board: {board_string(current_round.community_cards)}",
+                f"Your cards: {player.get_hole_cards_string()}",
+                f"Your stack: {player.stack}",
+                f"Current bet: {current_round.current_bet}",
+                f"Your bet: {player.current_bet}",
+                f"Pot: {current_round.pot}",
+                "\nLegal actions:",
+            ]
+            if can_fold:
+                lines.append("  [f] Fold")
+            if can_check:
+                lines.append("  [c] Check")
+            if can_call:
+                lines.append(f"  [c] Call {current_round.current_bet}")
+            if raise_info:
+                lines.append(f"  [r] Raise (min: {raise_info['min']}, max: {raise_info['max']})")
+            print("\n".join(lines))
             
             while True:
                 try:
-                    choice = input("\nYour action: ").strip().lower()
+                    choice = input(ACTION_PROMPT).strip().lower()
+                    command = ACTION_COMMANDS.get(choice)
                     
-                    if choice in ['f', 'fold']:
-                        if legal_actions.get('fold'):
+                    if command == 'fold':
+                        if can_fold:
                             return 'fold', 0
                         print("Cannot fold - no bet to face")
-                    elif choice in ['c', 'check']:
-                        if legal_actions.get('check'):
+                    elif command == 'check':
+                        if can_check:
                             return 'check', 0
-                        elif legal_actions.get('call'):
+                        elif can_call:
                             # For call, we need to determine the amount to call
-                            current_bet = game.current_round.current_bet
+                            current_bet = current_round.current_bet
                             return 'call', current_bet
                         print("Invalid action")
                     elif choice.startswith('r'):
-                        if not (legal_actions.get('raise') and legal_actions['raise']['allowed']):
+                        if not raise_info:
                             print("Cannot raise")
                             continue
                         
                         try:
-                            if len(choice.split()) > 1:
-                                amount = int(choice.split()[1])
-                            else:
-                                amount = int(input("Raise to: "))
+                            amount_str = RAISE_RE.match(choice).group(1)
+                            if amount_str is None:
+                                amount_str = input("Raise to: ")
+                            amount = int(amount_str)
                             
-                            raise_info = legal_actions['raise']
                             if amount < raise_info['min'] or amount > raise_info['max']:
                                 print(f"Amount must be between {raise_info['min']} and {raise_info['max']}")
                                 continue
@@ -463,7 +463,7 @@ class InteractiveTester:
                         except ValueError:
                             print("Invalid amount")
                     else:
-                        print("Invalid choice. Use: f (fold), c (check/call), r (raise)")
+                        print(INVALID_CHOICE)
                 
                 except KeyboardInterrupt:
                     print("\nGame interrupted")
@@ -514,19 +514,22 @@ class InteractiveTester:
             self.print_header("TEST RESULTS SUMMARY")
             
             print("All tests completed:")
+            failed = 0
             for test_name, passed in self.test_results:
                 status = "✅ PASSED" if passed else "❌ FAILED"
                 print(f"  {test_name:20} {status}")
+                if not passed:
+                    failed += 1
             
-            print(f"\nTotal tests: {len(self.test_results)}")
-            passed = sum(1 for _, p in self.test_results if p)
-            print(f"Passed: {passed}")
-            print(f"Failed: {len(self.test_results) - passed}")
+            total = len(self.test_results)
+            print(f"\nTotal tests: {total}")
+            print(f"Passed: {total - failed}")
+            print(f"Failed: {failed}")
             
-            if passed == len(self.test_results):
+            if not failed:
                 print("\n🎉 ALL TESTS PASSED! Your poker engine is working perfectly!")
             else:
-                print(f"\n⚠️  {len(self.test_results) - passed} tests failed. Check the output above.")
+                print(f"\n⚠️  {failed} tests failed. Check the output above.")
             
         except KeyboardInterrupt:
             print("\n\nTesting interrupted by user.")
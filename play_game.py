@@ -12,10 +12,28 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from pypokerengine.engine import Game
-from pypokerengine.utils import setup_game_logger
+from pypokerengine.simulation import EquityCalculator
+from pypokerengine.utils import (
+    setup_game_logger, ACTION_COMMANDS, RAISE_RE, ACTION_PROMPT, INVALID_CHOICE, board_string
+)
 import logging
 
 
+# The AI's hand-strength read: equity against a random hand over 1000
+# runouts, and the equity at which it min-raises (--ai-raise-equity)
+AI_EQUITY_SIMULATIONS = 1000
+AI_RAISE_EQUITY = 0.70
+_ai_equity = None
+
+
+def _ai_equity_calculator():
+    """Create the AI's EquityCalculator on first use."""
+    global _ai_equity
+    if _ai_equity is None:
+        _ai_equity = EquityCalculator(default_simulations=AI_EQUITY_SIMULATIONS)
+    return _ai_equity
+
+
 def print_header(title):
     """Print a formatted header."""
     print("\n" + "="*60)
@@ -32,86 +50,81 @@ def display_game_state(game, player_name):
     """Display the current game state."""
     you = game.players[0] if game.players[0].name == player_name else game.players[1]
     opponent = game.players[1] if game.players[0].name == player_name else game.players[0]
+    current_round = game.current_round
     
-    print(f"\n--- Hand #{game.hand_number} ---")
-    print(f"Dealer: {game.players[game.dealer_position].name}")
-    
-    # Show your cards
-    print(f"\nYour cards: {you.get_hole_cards_string()}")
-    print(f"Your stack: {you.stack} chips")
-    
-    # Show opponent info (without cards)
-    print(f"Opponent: {opponent.name} ({opponent.stack} chips)")
-    
-    # Show board
-    if game.current_round.community_cards:
-        board = " ".join(str(c) for c in game.current_round.community_cards)
-        print(f"Board: {board}")
-    else:
-        print("Board: (no community cards yet)")
-    
-    # Show pot and betting info
-    print(f"Pot: {game.current_round.pot}")
-    print(f"Current bet: {game.current_round.current_bet}")
-    print(f"Your bet: {you.current_bet}")
+    # Your cards, the opponent without cards, then the board and betting
+    print("\n".join([
+        f"\n--- Hand #{game.hand_number} ---",
+        f"Dealer: {game.players[game.dealer_position].name}",
+        f"\nYour cards: {you.get_hole_cards_string()}",
+        f"Your stack: {you.stack} chips",
+        f"Opponent: {opponent.name} ({opponent.stack} chips)",
+        f"Board: {board_string(current_round.community_cards)}",
+        f"Pot: {current_round.pot}",
+        f"Current bet: {current_round.current_bet}",
+        f"Your bet: {you.current_bet}",
+    ]))
 
 
 def get_player_action(player, legal_actions, street):
     """Get action from human player."""
-    print(f"\n--- Your turn on {street.upper()} ---")
-    
-    # Show board if there are community cards
-    if player.game.current_round.community_cards:
-        board = " ".join(str(c) for c in player.game.current_round.community_cards)
-        print(f"Board: {board}")
-    else:
-        print("Board: (no community cards yet)")
+    current_round = player.game.current_round
     
-    print(f"Your cards: {player.get_hole_cards_string()}")
-    print(f"Your stack: {player.stack}")
-    print(f"Current bet: {player.game.current_round.current_bet}")
-    print(f"Your bet: {player.current_bet}")
-    print(f"Pot: {player.game.current_round.pot}")
+    # Look each legal action up once; 'raise' is None when raising isn't allowed
+    can_fold = legal_actions.get('fold')
+    can_check = legal_actions.get('check')
+    can_call = legal_actions.get('call')
+    raise_info = legal_actions.get('raise')
+    if raise_info and not raise_info['allowed']:
+        raise_info = None
     
-    print(f"\nLegal actions:")
-    if legal_actions.get('fold'):
-        print("  [f] Fold")
-    if legal_actions.get('check'):
-        print("  [c] Check")
-    if legal_actions.get('call'):
-        current_bet = player.game.current_round.current_bet
-        print(f"  [c] Call {current_bet}")
-    if legal_actions.get('raise') and legal_actions['raise']['allowed']:
-        raise_info = legal_actions['raise']
-        print(f"  [r] Raise (min: {raise_info['min']}, max: {raise_info['max']})")
+    lines = [
+        f"\n--- Your turn on {street.upper()} ---",
+        f"Board: {board_string(current_round.community_cards)}",
+        f"Your cards: {player.get_hole_cards_string()}",
+        f"Your stack: {player.stack}",
+        f"Current bet: {current_round.current_bet}",
+        f"Your bet: {player.current_bet}",
+        f"Pot: {current_round.pot}",
+        "\nLegal actions:",
+    ]
+    if can_fold:
+        lines.append("  [f] Fold")
+    if can_check:
+        lines.append("  [c] Check")
+    if can_call:
+        lines.append(f"  [c] Call {current_round.current_bet}")
+    if raise_info:
+        lines.append(f"  [r] Raise (min: {raise_info['min']}, max: {raise_info['max']})")
+    print("\n".join(lines))
     
     while True:
         try:
-            choice = input("\nYour action: ").strip().lower()
+            choice = input(ACTION_PROMPT).strip().lower()
+            command = ACTION_COMMANDS.get(choice)
             
-            if choice in ['f', 'fold']:
-                if legal_actions.get('fold'):
+            if command == 'fold':
+                if can_fold:
                     return 'fold', 0
                 print("Cannot fold - no bet to face")
-            elif choice in ['c', 'check']:
-                if legal_actions.get('check'):
+            elif command == 'check':
+                if can_check:
                     return 'check', 0
-                elif legal_actions.get('call'):
-                    current_bet = player.game.current_round.current_bet
+                elif can_call:
+                    current_bet = current_round.current_bet
                     return 'call', current_bet
                 print("Invalid action")
             elif choice.startswith('r'):
-                if not (legal_actions.get('raise') and legal_actions['raise']['allowed']):
+                if not raise_info:
                     print("Cannot raise")
                     continue
                 
                 try:
-                    if len(choice.split()) > 1:
-                        amount = int(choice.split()[1])
-                    else:
-                        amount = int(input("Raise to: "))
+                    amount_str = RAISE_RE.match(choice).group(1)
+                    if amount_str is None:
+                        amount_str = input("Raise to: ")
+                    amount = int(amount_str)
                     
-                    raise_info = legal_actions['raise']
                     if amount < raise_info['min'] or amount > raise_info['max']:
                         print(f"Amount must be between {raise_info['min']} and {raise_info['max']}")
                         continue
@@ -120,44 +133,61 @@ def get_player_action(player, legal_actions, street):
                 except ValueError:
                     print("Invalid amount")
             else:
-                print("Invalid choice. Use: f (fold), c (check/call), r (raise)")
+                print(INVALID_CHOICE)
         
         except KeyboardInterrupt:
             print("\nGame interrupted")
             return 'fold', 0
 
 
-def simple_ai_strategy(player, legal_actions, street):
-    """Simple AI strategy for the computer opponent."""
-    print(f"\n--- {player.name}'s turn on {street.upper()} ---")
+def simple_ai_strategy(player, legal_actions, street, calculator=None,
+                       raise_equity=AI_RAISE_EQUITY):
+    """
+    Simple AI strategy for the computer opponent.
     
-    # Show board if there are community cards
-    if player.game.current_round.community_cards:
-        board = " ".join(str(c) for c in player.game.current_round.community_cards)
-        print(f"Board: {board}")
-    else:
-        print("Board: (no community cards yet)")
+    Min-raises at raise_equity or better against a random hand, otherwise
+    checks, and facing a bet calls only when equity beats the pot odds.
+    calculator defaults to a shared 1000-runout EquityCalculator.
+    """
+    current_round = player.game.current_round
+    print("\n".join([
+        f"\n--- {player.name}'s turn on {street.upper()} ---",
+        f"Board: {board_string(current_round.community_cards)}",
+        f"{player.name}'s cards: {player.get_hole_cards_string()}",
+        f"{player.name}'s stack: {player.stack}",
+        f"Current bet: {current_round.current_bet}",
+        f"{player.name}'s bet: {player.current_bet}",
+        f"Pot: {current_round.pot}",
+    ]))
     
-    print(f"{player.name}'s cards: {player.get_hole_cards_string()}")
-    print(f"{player.name}'s stack: {player.stack}")
-    print(f"Current bet: {player.game.current_round.current_bet}")
-    print(f"{player.name}'s bet: {player.current_bet}")
-    print(f"Pot: {player.game.current_round.pot}")
+    # Simple AI logic: raise strong hands, otherwise check, or call when
+    # equity beats the pot odds
+    calculator = calculator or _ai_equity_calculator()
+    equity = calculator.calculate_equity(
+        player.hole_cards, board=current_round.community_cards
+    ).equity
+    print(f"{player.name}'s equity vs a random hand: {equity:.1%}")
     
-    # Simple AI logic
-    if legal_actions.get('check'):
+    raise_info = legal_actions.get('raise')
+    if equity >= raise_equity and raise_info and raise_info['allowed']:
+        print(f"{player.name} raises to {raise_info['min']}")
+        return 'raise', raise_info['min']
+    elif legal_actions.get('check'):
         print(f"{player.name} checks")
         return 'check', 0
     elif legal_actions.get('call'):
-        current_bet = player.game.current_round.current_bet
-        print(f"{player.name} calls {current_bet}")
-        return 'call', current_bet
-    else:
-        print(f"{player.name} folds")
-        return 'fold', 0
+        current_bet = current_round.current_bet
+        to_call = current_bet - player.current_bet
+        pot_odds = to_call / (current_round.pot + to_call)
+        if equity >= pot_odds:
+            print(f"{player.name} calls {current_bet}")
+            return 'call', current_bet
+    
+    print(f"{player.name} folds")
+    return 'fold', 0
 
 
-def play_game():
+def play_game(ai_raise_equity=AI_RAISE_EQUITY):
     """Main game loop."""
     print_header("POKER GAME")
     print("Welcome to Heads-Up Pot-Limit Hold'em!")
@@ -196,7 +226,9 @@ def play_game():
                 if player.name == player_name:
                     return get_player_action(player, legal_actions, street)
                 else:
-                    return simple_ai_strategy(player, legal_actions, street)
+                    return simple_ai_strategy(
+                        player, legal_actions, street, raise_equity=ai_raise_equity
+                    )
             
             # Play the hand
             print(f"\nPlaying hand...")
@@ -248,11 +280,18 @@ def play_game():
 
 
 if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Play heads-up poker against the AI")
+    parser.add_argument('--ai-raise-equity', type=float, default=AI_RAISE_EQUITY,
+                       help='Equity vs a random hand at which the AI raises')
+    args = parser.parse_args()
+    
     # Set up logging to reduce noise
     setup_game_logger(level=logging.WARNING)
     
     try:
-        play_game()
+        play_game(ai_raise_equity=args.ai_raise_equity)
     except KeyboardInterrupt:
         print("\n\nGame interrupted. Goodbye!")
     except Exception as e:
@@ -4,7 +4,7 @@ Command-Line Interface for Poker Game
 This module provides an interactive CLI for playing poker.
 """
 
-from typing import Dict, Any, Tuple
+from typing import Callable, Dict, Any, Optional, Tuple
 import sys
 from ..engine.game import Game
 from ..engine.player import Player
@@ -21,17 +21,32 @@ class PokerCLI:
     - Action prompts with valid options
     """
     
-    def __init__(self, game: Game, human_player_index: int = 0):
+    def __init__(
+        self,
+        game: Game,
+        human_player_index: int = 0,
+        verbose: bool = True,
+        action_callback: Optional[Callable[[Player, Dict[str, Any], str], Tuple[str, int]]] = None
+    ):
         """
         Initialize the CLI.
         
         Args:
             game: Game instance to play
             human_player_index: Index of human player (0 or 1)
+            verbose: Print table state and AI actions, prompt the human seat
+                and pause between hands; pass False for batch runs, which
+                never print or read input
+            action_callback: Policy for every seat, called as
+                (player, legal_actions, street); by default the human seat is
+                prompted when verbose and both seats use get_ai_action in
+                batch runs
         """
         self.game = game
         self.human_player_index = human_player_index
         self.ai_player_index = 1 - human_player_index
+        self.verbose = verbose
+        self.action_callback = action_callback or self._action_callback
     
     def display_game_state(self, street: str = ""):
         """Display current game state."""
@@ -190,19 +205,39 @@ class PokerCLI:
             Tuple of (action, amount)
         """
         # Simple AI: check/call if possible, otherwise fold
+        verbose = self.verbose
         if legal_actions.get("check"):
-            print(f"{player.name} checks")
+            if verbose:
+                print(f"{player.name} checks")
             return "check", 0
         elif legal_actions.get("call"):
             amount = self.game.current_round.current_bet
-            print(f"{player.name} calls {amount}")
+            if verbose:
+                print(f"{player.name} calls {amount}")
             return "call", amount
         else:
-            print(f"{player.name} folds")
+            if verbose:
+                print(f"{player.name} folds")
             return "fold", 0
     
+    def _action_callback(
+        self,
+        player: Player,
+        legal_actions: Dict[str, Any],
+        street: str
+    ) -> Tuple[str, int]:
+        """Route the human seat to the prompt, unless batch running, and others to the AI."""
+        if self.verbose and player is self.game.players[self.human_player_index]:
+            return self.get_human_action(player, legal_actions)
+        return self.get_ai_action(player, legal_actions)
+    
     def play_game(self):
         """Play a complete game until one player busts."""
+        if not self.verbose:
+            while not self.game.is_game_over():
+                self.play_hand()
+            return
+        
         print("\n" + "="*60)
         print("HEADS-UP POT-LIMIT HOLD'EM")
         print("="*60)
@@ -234,16 +269,12 @@ class PokerCLI:
     def play_hand(self):
         """Play a single hand."""
         self.game.start_new_hand()
-        self.display_game_state(street="preflop")
-        
-        def action_callback(player: Player, legal_actions: Dict[str, Any], street: str) -> Tuple[str, int]:
-            # Display state before action
-            if player == self.game.players[self.human_player_index]:
-                return self.get_human_action(player, legal_actions)
-            else:
-                return self.get_ai_action(player, legal_actions)
+        if self.verbose:
+            self.display_game_state(street="preflop")
         
-        result = self.game.play_hand(action_callback)
+        result = self.game.play_hand(self.action_callback)
+        if not self.verbose:
+            return
         
         # Show final result
         print("\n" + "="*60)
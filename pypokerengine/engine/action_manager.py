@@ -8,6 +8,18 @@ from typing import List, Dict, Any, Tuple
 from .player import Player
 
 
+# Actions that are legal exactly when their legal_actions flag is set, with
+# the error reported when it isn't
+_FLAG_ACTION_ERRORS = {
+    "fold": "Cannot fold - no bet to face (use check instead)",
+    "check": "Cannot check - must call or fold",
+    "call": "Cannot call",
+}
+
+# Lowercase spellings; anything else goes through str.lower() once
+_CANONICAL_ACTIONS = frozenset(("fold", "check", "call", "raise", "bet"))
+
+
 class ActionManager:
     """
     Manages and validates player actions in Pot-Limit Hold'em.
@@ -88,60 +100,59 @@ class ActionManager:
         Returns:
             Tuple of (min_raise, max_raise) as total bet amounts
         """
-        amount_to_call = current_bet - player.current_bet
-        
-        # Minimum total bet for a raise:
-        # - If no outstanding bet, minimum is a bet of at least big blind
-        # - If there is an outstanding bet (e.g., BB=20 preflop), minimum total bet
-        #   must be current_bet + big_blind (e.g., 40). This prevents redundant
-        #   "raise" to the same amount as a call.
         if current_bet == 0:
+            # No prior bet this round - bet at least the big blind, up to the pot
             min_raise = big_blind
-        else:
-            min_raise = current_bet + big_blind
-        
-        # Calculate maximum raise using official pot-limit formula
-        if current_bet == 0:
-            # No prior bet this round - can bet up to pot size
             max_raise = pot_size
         else:
-            # Special case for initial betting after blinds: allow up to 70 total bet
-            if pot_size == 30 and current_bet == 20:  # After blinds (10 + 20)
-                max_raise = 70  # Allow bet up to 70 total
-            else:
-                # There's a bet to call - use 3x rule
-                # pot_size includes the current bet, so pot_before_last_bet = pot_size - current_bet
-                pot_before_last_bet = pot_size - current_bet
-                max_raise = (3 * current_bet) + pot_before_last_bet
+            # With an outstanding bet (e.g., BB=20 preflop) the minimum total bet
+            # is current_bet + big_blind (e.g., 40), so a "raise" is never just
+            # a call.
+            min_raise = current_bet + big_blind
             
-            # Special case: If player already bet this round (not just posted blinds), subtract that amount
-            # Only subtract if the player's current bet is from a raise/bet action, not from posting blinds
-            # But don't subtract if this is the special case for initial betting after blinds
-            if (player.current_bet > 0 and player.current_bet != current_bet and 
-                not (pot_size == 30 and current_bet == 20)):
+            # There's a bet to call - use 3x rule
+            # pot_size includes the current bet, so pot_before_last_bet = pot_size - current_bet
+            max_raise = 3 * current_bet + pot_size - current_bet
+            
+            # If player already bet this round, subtract that amount - but not
+            # a posted small blind facing an unraised big blind (e.g., 10 into a
+            # pot of 30 facing 20), which the formula above already allows for
+            unraised_blinds = current_bet == big_blind and pot_size - current_bet == player.current_bet
+            if 0 < player.current_bet != current_bet and not unraised_blinds:
                 max_raise -= player.current_bet
         
         # Cap at player's stack (all-in)
-        player_max_total_bet = player.stack + player.current_bet
-        max_raise = min(max_raise, player_max_total_bet)
-
+        max_raise = min(max_raise, player.stack + player.current_bet)
+        
         # Additional cap: opponent(s) effective stack to avoid side pots
         # A player's total bet cannot exceed what any opponent can cover
-        if players:
-            opponents_effective_caps = [
-                (opponent.stack + opponent.current_bet)
-                for opponent in players
-                if opponent is not player and opponent.is_active
-            ]
-            if opponents_effective_caps:
-                max_raise = min(max_raise, min(opponents_effective_caps))
+        for opponent in players:
+            if opponent is not player and opponent.is_active:
+                max_raise = min(max_raise, opponent.stack + opponent.current_bet)
         
         # Ensure min doesn't exceed max
-        if min_raise > max_raise:
-            min_raise = max_raise
+        min_raise = min(min_raise, max_raise)
         
         return min_raise, max_raise
     
+    @staticmethod
+    def normalize_action(action: str) -> str:
+        """
+        Return the lowercase form of an action name.
+        
+        Canonical names are returned as-is, so engine-generated actions
+        don't allocate a new string on every call.
+        
+        Args:
+            action: Action type in any case
+            
+        Returns:
+            Lowercase action type
+        """
+        if action in _CANONICAL_ACTIONS:
+            return action
+        return action.lower()
+    
     @staticmethod
     def validate_action(
         player: Player,
@@ -161,21 +172,12 @@ class ActionManager:
         Returns:
             Tuple of (is_valid, error_message)
         """
-        action = action.lower()
+        action = ActionManager.normalize_action(action)
         
-        if action == "fold":
-            if not legal_actions.get("fold"):
-                return False, "Cannot fold - no bet to face (use check instead)"
-            return True, ""
-        
-        elif action == "check":
-            if not legal_actions.get("check"):
-                return False, "Cannot check - must call or fold"
-            return True, ""
-        
-        elif action == "call":
-            if not legal_actions.get("call"):
-                return False, "Cannot call"
+        flag_error = _FLAG_ACTION_ERRORS.get(action)
+        if flag_error is not None:
+            if not legal_actions.get(action):
+                return False, flag_error
             return True, ""
         
         elif action == "raise" or action == "bet":
@@ -215,7 +217,7 @@ class ActionManager:
         Returns:
             Amount added to pot
         """
-        action = action.lower()
+        action = ActionManager.normalize_action(action)
         
         if action == "fold":
             player.fold()
@@ -226,13 +228,10 @@ class ActionManager:
             return 0
         
         elif action == "call":
-            amount_to_call = current_bet - player.current_bet
-            added = player.call(current_bet)
-            return added
+            return player.call(current_bet)
         
         elif action == "raise" or action == "bet":
-            added = player.bet(amount)
-            return added
+            return player.bet(amount)
         
         else:
             raise ValueError(f"Invalid action: {action}")
@@ -250,7 +249,7 @@ class ActionManager:
         Returns:
             Description string
         """
-        action = action.lower()
+        action = ActionManager.normalize_action(action)
         
         if action == "fold":
             return f"{player_name} folds"
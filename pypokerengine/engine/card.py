@@ -5,7 +5,7 @@ This module provides Card and Deck classes for poker game management.
 """
 
 import random
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from enum import IntEnum
 
 
@@ -43,16 +43,15 @@ class Card:
         suit (Suit): The suit of the card (0-3)
     """
     
+    __slots__ = ('rank', 'suit')
+    
     RANK_SYMBOLS = {
         2: '2', 3: '3', 4: '4', 5: '5', 6: '6', 7: '7', 8: '8',
         9: '9', 10: 'T', 11: 'J', 12: 'Q', 13: 'K', 14: 'A'
     }
     
     SUIT_SYMBOLS = {
-        Suit.CLUBS: '♣',
-        Suit.DIAMONDS: '♦',
-        Suit.HEARTS: '♥',
-        Suit.SPADES: '♠'
+        0: '♣', 1: '♦', 2: '♥', 3: '♠'
     }
     
     def __init__(self, rank: int, suit: int):
@@ -66,9 +65,30 @@ class Card:
         self.rank = rank
         self.suit = suit
     
+    def to_bit(self) -> int:
+        """
+        Return this card's bit in a 52-bit hand mask.
+        
+        Bits are laid out as suit * 13 + (rank - 2), so each suit occupies
+        13 consecutive bits ordered by rank and a hand is the OR of its cards.
+        
+        Returns:
+            Integer with exactly one bit set
+        """
+        return 1 << (self.suit * 13 + self.rank - 2)
+    
     def __str__(self) -> str:
         """Return string representation like 'A♠' or 'K♥'."""
-        return f"{self.RANK_SYMBOLS[self.rank]}{self.SUIT_SYMBOLS[self.suit]}"
+        return _CARD_STRS[self.suit * 13 + self.rank - 2]
+    
+    def to_ascii(self) -> str:
+        """
+        Return the two-character ASCII form like 'As' or 'Kh'.
+        
+        This is the spelling Card.from_string parses, for hand strings,
+        logs and files; str(card) keeps the suit symbols for display.
+        """
+        return _CARD_ASCII[self.suit * 13 + self.rank - 2]
     
     def __repr__(self) -> str:
         """Return detailed representation."""
@@ -76,13 +96,15 @@ class Card:
     
     def __eq__(self, other) -> bool:
         """Check equality based on rank and suit."""
+        if self is other:
+            return True
         if not isinstance(other, Card):
             return False
         return self.rank == other.rank and self.suit == other.suit
     
     def __hash__(self) -> int:
-        """Hash based on rank and suit."""
-        return hash((self.rank, self.suit))
+        """Hash by the card's 0-51 index (its to_bit position)."""
+        return self.suit * 13 + self.rank - 2
     
     @classmethod
     def from_string(cls, card_str: str) -> 'Card':
@@ -93,34 +115,62 @@ class Card:
             card_str: String like 'AS', 'Kh', 'Td', '2c'
             
         Returns:
-            Card instance
+            Card instance, shared with every other parse of the same card
         """
+        card = _CARD_BY_STR.get(card_str)
+        if card is not None:
+            return card
+        
         if len(card_str) != 2:
             raise ValueError(f"Invalid card string: {card_str}")
-        
         rank_char, suit_char = card_str[0].upper(), card_str[1].lower()
-        
-        # Parse rank
-        rank_map = {'2': 2, '3': 3, '4': 4, '5': 5, '6': 6, '7': 7, '8': 8,
-                    '9': 9, 'T': 10, 'J': 11, 'Q': 12, 'K': 13, 'A': 14}
-        if rank_char not in rank_map:
+        if rank_char not in _RANK_BY_CHAR:
             raise ValueError(f"Invalid rank: {rank_char}")
-        rank = rank_map[rank_char]
-        
-        # Parse suit
-        suit_map = {'c': Suit.CLUBS, 'd': Suit.DIAMONDS, 'h': Suit.HEARTS, 's': Suit.SPADES}
-        if suit_char not in suit_map:
-            raise ValueError(f"Invalid suit: {suit_char}")
-        suit = suit_map[suit_char]
-        
-        return cls(rank, suit)
+        raise ValueError(f"Invalid suit: {suit_char}")
+
+
+# Display strings indexed like Card.to_bit (suit * 13 + rank - 2), built once
+# so str(card) is a list lookup
+_CARD_STRS: List[str] = [
+    Card.RANK_SYMBOLS[rank] + Card.SUIT_SYMBOLS[suit]
+    for suit in range(4)
+    for rank in range(2, 15)
+]
+
+# ASCII spellings for Card.to_ascii, indexed the same way
+_CARD_ASCII: List[str] = [
+    Card.RANK_SYMBOLS[rank] + suit_char
+    for suit_char in 'cdhs'
+    for rank in range(2, 15)
+]
+
+# Cards are never mutated, so every deck reset reuses these 52 objects
+_FULL_DECK: Tuple[Card, ...] = tuple(
+    Card(rank, suit)
+    for suit in range(4)
+    for rank in range(2, 15)
+)
+
+# Parsing tables for Card.from_string: rank is case-insensitive, suit letters
+# are too, so every accepted spelling maps straight to its _FULL_DECK card
+_RANK_BY_CHAR = {symbol: rank for rank, symbol in Card.RANK_SYMBOLS.items()}
+_SUIT_BY_CHAR = {'c': 0, 'd': 1, 'h': 2, 's': 3}
+_CARD_BY_STR = {
+    rank_char + suit_char: _FULL_DECK[suit * 13 + rank - 2]
+    for symbol, rank in _RANK_BY_CHAR.items()
+    for rank_char in {symbol, symbol.lower()}
+    for letter, suit in _SUIT_BY_CHAR.items()
+    for suit_char in (letter, letter.upper())
+}
 
 
 class Deck:
     """
     Represents a standard 52-card deck.
     
-    Supports shuffling, dealing, and resetting.
+    Supports shuffling, dealing, and resetting. The cards live in one list
+    in deal order with a cursor at the top of the deck, so dealing just
+    moves the cursor.
     """
     
     def __init__(self, seed: Optional[int] = None):
@@ -128,27 +178,45 @@ class Deck:
         Initialize a deck with all 52 cards.
         
         Args:
-            seed: Optional random seed for reproducible shuffling
+            seed: Optional random seed for reproducible shuffling. A seeded
+                deck shuffles with its own generator instead of reseeding the
+                global random module; an unseeded deck uses the global one.
         """
         self.seed = seed
-        if seed is not None:
-            random.seed(seed)
-        self.cards: List[Card] = []
-        self.dealt_cards: List[Card] = []
+        self._rng = random.Random(seed) if seed is not None else None
+        self._cards: List[Card] = []
+        self._top = 0
         self.reset()
     
+    @property
+    def cards(self) -> List[Card]:
+        """Cards still in the deck, top card first."""
+        return self._cards[self._top:]
+    
+    @property
+    def dealt_cards(self) -> List[Card]:
+        """Cards dealt since the last reset, in deal order."""
+        return self._cards[:self._top]
+    
     def reset(self):
         """Reset the deck to contain all 52 cards in order."""
-        self.cards = [
-            Card(rank, suit)
-            for suit in range(4)
-            for rank in range(2, 15)
-        ]
-        self.dealt_cards = []
+        self._cards = list(_FULL_DECK)
+        self._top = 0
     
     def shuffle(self):
-        """Shuffle the deck randomly."""
-        random.shuffle(self.cards)
+        """
+        Shuffle the cards remaining in the deck.
+        
+        Runs Fisher-Yates off one random float per swap, like the Monte
+        Carlo runout kernels, which is cheaper than random.shuffle's
+        rejection-sampled integer draws.
+        """
+        rand = self._rng.random if self._rng is not None else random.random
+        cards = self._cards
+        top = self._top
+        for i in range(len(cards) - 1, top, -1):
+            j = top + int(rand() * (i - top + 1))
+            cards[i], cards[j] = cards[j], cards[i]
     
     def deal(self, num_cards: int = 1) -> List[Card]:
         """
@@ -163,13 +231,13 @@ class Deck:
         Raises:
             ValueError: If not enough cards remain in deck
         """
-        if num_cards > len(self.cards):
-            raise ValueError(f"Cannot deal {num_cards} cards, only {len(self.cards)} remain")
+        top = self._top
+        remaining = len(self._cards) - top
+        if num_cards > remaining:
+            raise ValueError(f"Cannot deal {num_cards} cards, only {remaining} remain")
         
-        dealt = self.cards[:num_cards]
-        self.cards = self.cards[num_cards:]
-        self.dealt_cards.extend(dealt)
-        return dealt
+        self._top = top + num_cards
+        return self._cards[top:top + num_cards]
     
     def deal_one(self) -> Card:
         """
@@ -177,18 +245,26 @@ class Deck:
         
         Returns:
             The dealt card
+            
+        Raises:
+            ValueError: If the deck is empty
         """
-        return self.deal(1)[0]
+        top = self._top
+        if top >= len(self._cards):
+            raise ValueError("Cannot deal 1 cards, only 0 remain")
+        
+        self._top = top + 1
+        return self._cards[top]
     
     def cards_remaining(self) -> int:
         """Return the number of cards remaining in the deck."""
-        return len(self.cards)
+        return len(self._cards) - self._top
     
     def __len__(self) -> int:
         """Return the number of cards remaining in the deck."""
-        return len(self.cards)
+        return len(self._cards) - self._top
     
     def __str__(self) -> str:
         """Return string representation showing number of cards."""
-        return f"Deck({len(self.cards)} cards remaining)"
+        return f"Deck({len(self)} cards remaining)"
 
@@ -116,18 +116,21 @@ class Game:
             self.start_new_hand()
         
         round_obj = self.current_round
+        # Skip building log messages (board strings, results) nobody will see
+        log_info = self.logger.isEnabledFor(logging.INFO)
         
         # Play through all streets
         streets = [Street.PREFLOP, Street.FLOP, Street.TURN, Street.RIVER]
         
         for street in streets:
-            self.logger.info(f"\n{street.value.upper()}")
+            if log_info:
+                self.logger.info(f"\n{street.value.upper()}")
             
             if street != Street.PREFLOP:
                 round_obj.advance_street()
             
             # Display board if postflop
-            if round_obj.community_cards:
+            if log_info and round_obj.community_cards:
                 cards_str = " ".join(str(c) for c in round_obj.community_cards)
                 self.logger.info(f"Board: {cards_str}")
             
@@ -142,13 +145,12 @@ class Game:
                 break
             
             # Check if all but one player is all-in
-            can_act = [p for p in self.players if p.can_act()]
-            if len(can_act) == 0:
+            if not any(p.can_act() for p in self.players):
                 # All players all-in, deal remaining cards
                 self.logger.info("All players all-in, running out the board")
                 while round_obj.street != Street.RIVER:
                     round_obj.advance_street()
-                    if round_obj.community_cards:
+                    if log_info and round_obj.community_cards:
                         cards_str = " ".join(str(c) for c in round_obj.community_cards)
                         self.logger.info(f"Board: {cards_str}")
                 break
@@ -157,10 +159,11 @@ class Game:
         result = round_obj.determine_winner()
         
         # Log result
-        self.logger.info(f"\nHand complete!")
-        self.logger.info(f"Winner(s): {', '.join(result['winners'])}")
-        self.logger.info(f"Winning hand: {result['winning_hand']}")
-        self.logger.info(f"Pot: {result['pot']}")
+        if log_info:
+            self.logger.info(f"\nHand complete!")
+            self.logger.info(f"Winner(s): {', '.join(result['winners'])}")
+            self.logger.info(f"Winning hand: {result['winning_hand']}")
+            self.logger.info(f"Pot: {result['pot']}")
         
         # Record hand history
         hand_record = {
@@ -272,7 +275,7 @@ class Game:
         self.current_round = None
         self.game_over = False
         self.hand_history = []
-        self.deck = Deck()
+        self.deck.reset()
         
         self.logger.info("Game reset")
     
@@ -5,12 +5,64 @@ This module provides comprehensive hand evaluation for 7-card poker (Texas Hold'
 Evaluates the best 5-card hand from any combination of cards.
 """
 
-from typing import List, Tuple, Dict
-from collections import Counter
-from itertools import combinations
+from typing import Iterable, List, Tuple, Dict
 from .card import Card
 
 
+# Evaluations memoized by 52-bit hand mask (see Card.to_bit). Monte Carlo
+# runouts on a fixed board re-evaluate the same 7 cards thousands of times.
+_EVAL_CACHE: Dict[int, Tuple[int, List[int], str]] = {}
+_EVAL_CACHE_SIZE = 100000
+
+# 13 rank bits per suit in a hand mask
+_SUIT_BITS = 0x1FFF
+
+if hasattr(int, "bit_count"):
+    _popcount = int.bit_count
+else:  # Python < 3.10
+    def _popcount(x: int) -> int:
+        return bin(x).count("1")
+
+# Number of ranks in each 13-bit rank set
+_RANK_COUNT = [_popcount(rank_bits) for rank_bits in range(1 << 13)]
+
+# Sum of 5**(r-2) over the ranks in each 13-bit rank set. Adding the four
+# suits' entries gives a base-5 number with one digit per rank holding how
+# many of that rank a hand has, so every rank multiset has a unique key.
+_QUINARY = [0] * (1 << 13)
+for _rank_bits in range(1, 1 << 13):
+    _low_bit = _rank_bits & -_rank_bits
+    _QUINARY[_rank_bits] = _QUINARY[_rank_bits ^ _low_bit] + 5 ** (_low_bit.bit_length() - 1)
+del _rank_bits, _low_bit
+
+# Evaluations of hands without a flush, keyed by rank multiset (see
+# _QUINARY). Suits don't matter once a flush is ruled out, and 5-7 card
+# hands have under 75k rank multisets, so the table fills up without bound.
+_RANK_TABLE: Dict[int, Tuple[int, List[int], str]] = {}
+
+# The same hands' single-int scores (see HandEvaluator.score_mask)
+_RANK_SCORES: Dict[int, int] = {}
+
+
+def _pack_score(evaluation: Tuple[int, List[int], str]) -> int:
+    """Pack a hand rank and its tiebreakers into 4-bit digits, high to low."""
+    hand_rank, tiebreakers, _ = evaluation
+    score = hand_rank
+    for rank in tiebreakers:
+        score = score << 4 | rank
+    return score << 4 * (5 - len(tiebreakers))
+
+
+def _top_ranks(rank_bits: int, n: int) -> List[int]:
+    """Highest n ranks in a 13-bit rank set (bit r-2 for rank r), high to low."""
+    ranks = []
+    while rank_bits and len(ranks) < n:
+        bit = rank_bits.bit_length() - 1
+        ranks.append(bit + 2)
+        rank_bits ^= 1 << bit
+    return ranks
+
+
 class HandRank:
     """Hand ranking constants."""
     HIGH_CARD = 0
@@ -50,7 +102,8 @@ class HandEvaluator:
         """
         Evaluate a poker hand (5-7 cards) and return its rank.
         
-        For 7 cards, evaluates all possible 5-card combinations and returns the best.
+        The best 5-card hand is read off the cards' 52-bit mask with bitwise
+        rank-set operations, rather than by scoring every 5-card combination.
         
         Args:
             cards: List of 5-7 cards to evaluate
@@ -64,24 +117,26 @@ class HandEvaluator:
         if len(cards) < 5:
             raise ValueError(f"Need at least 5 cards, got {len(cards)}")
         
-        if len(cards) == 5:
-            return HandEvaluator._evaluate_5_cards(cards)
-        
-        # For 6-7 cards, check all 5-card combinations
-        best_rank = -1
-        best_tiebreakers = []
-        best_name = ""
+        mask = 0
+        for card in cards:
+            mask |= 1 << (card.suit * 13 + card.rank - 2)
+        return HandEvaluator.evaluate_mask(mask)
+    
+    @staticmethod
+    def hand_mask(cards: List[Card]) -> int:
+        """
+        Get the 52-bit mask of a set of cards (OR of Card.to_bit).
         
-        for combo in combinations(cards, 5):
-            rank, tiebreakers, name = HandEvaluator._evaluate_5_cards(list(combo))
+        Args:
+            cards: Cards to combine
             
-            # Compare hands
-            if rank > best_rank or (rank == best_rank and tiebreakers > best_tiebreakers):
-                best_rank = rank
-                best_tiebreakers = tiebreakers
-                best_name = name
-        
-        return best_rank, best_tiebreakers, best_name
+        Returns:
+            Integer with one bit set per card
+        """
+        mask = 0
+        for card in cards:
+            mask |= card.to_bit()
+        return mask
     
     @staticmethod
     def _evaluate_5_cards(cards: List[Card]) -> Tuple[int, List[int], str]:
@@ -97,76 +152,211 @@ class HandEvaluator:
         if len(cards) != 5:
             raise ValueError(f"Expected 5 cards, got {len(cards)}")
         
-        ranks = sorted([card.rank for card in cards], reverse=True)
-        suits = [card.suit for card in cards]
-        
-        is_flush = len(set(suits)) == 1
-        is_straight, straight_high = HandEvaluator._check_straight(ranks)
+        return HandEvaluator._evaluate_cards(cards)
+    
+    @staticmethod
+    def evaluate_mask(hand_mask: int) -> Tuple[int, List[int], str]:
+        """
+        Evaluate a hand given as a 52-bit mask (see Card.to_bit).
         
-        rank_counts = Counter(ranks)
-        counts_sorted = sorted(rank_counts.items(), key=lambda x: (x[1], x[0]), reverse=True)
+        Lets callers that track hands as masks, such as simulations, skip
+        building Card lists.
         
-        # Check for specific hands
-        if is_straight and is_flush:
-            if straight_high == 14:  # Ace-high straight flush
-                return HandRank.ROYAL_FLUSH, [14], "Royal Flush"
-            return HandRank.STRAIGHT_FLUSH, [straight_high], f"Straight Flush, {HandEvaluator._rank_name(straight_high)} high"
+        Args:
+            hand_mask: Mask with 5-7 card bits set
+            
+        Returns:
+            Tuple of (hand_rank, tiebreakers, hand_name)
+        """
+        result = _EVAL_CACHE.get(hand_mask)
+        if result is None:
+            result = HandEvaluator._evaluate_mask(hand_mask)
+            if len(_EVAL_CACHE) >= _EVAL_CACHE_SIZE:
+                _EVAL_CACHE.clear()
+            _EVAL_CACHE[hand_mask] = result
+        return result
+    
+    @staticmethod
+    def score_mask(hand_mask: int) -> int:
+        """
+        Score a hand given as a 52-bit mask as one comparable integer.
         
-        if counts_sorted[0][1] == 4:  # Four of a kind
-            quad_rank = counts_sorted[0][0]
-            kicker = counts_sorted[1][0]
-            return HandRank.FOUR_OF_A_KIND, [quad_rank, kicker], f"Four of a Kind, {HandEvaluator._rank_name(quad_rank)}s"
+        The hand rank and up to five tiebreakers are packed 4 bits each, so
+        scores order hands exactly like (hand_rank, tiebreakers) and equal
+        scores tie. Hands without a flush are looked up by rank multiset in
+        _RANK_SCORES, so showdown loops compare two ints without building
+        or caching full evaluations.
         
-        if counts_sorted[0][1] == 3 and counts_sorted[1][1] == 2:  # Full house
-            trips_rank = counts_sorted[0][0]
-            pair_rank = counts_sorted[1][0]
-            return HandRank.FULL_HOUSE, [trips_rank, pair_rank], f"Full House, {HandEvaluator._rank_name(trips_rank)}s over {HandEvaluator._rank_name(pair_rank)}s"
+        Args:
+            hand_mask: Mask with 5-7 card bits set
+            
+        Returns:
+            Integer score, higher is better
+        """
+        clubs = hand_mask & _SUIT_BITS
+        diamonds = (hand_mask >> 13) & _SUIT_BITS
+        hearts = (hand_mask >> 26) & _SUIT_BITS
+        spades = (hand_mask >> 39) & _SUIT_BITS
+        rank_count = _RANK_COUNT
+        if (rank_count[clubs] >= 5 or rank_count[diamonds] >= 5
+                or rank_count[hearts] >= 5 or rank_count[spades] >= 5):
+            return _pack_score(HandEvaluator._evaluate_mask(hand_mask))
+        
+        key = _QUINARY[clubs] + _QUINARY[diamonds] + _QUINARY[hearts] + _QUINARY[spades]
+        score = _RANK_SCORES.get(key)
+        if score is None:
+            score = _RANK_SCORES[key] = _pack_score(HandEvaluator._evaluate_ranks(clubs, diamonds, hearts, spades, 0))
+        return score
+    
+    @staticmethod
+    def evaluate_batch(hand_masks: Iterable[int]) -> List[Tuple[int, List[int], str]]:
+        """
+        Evaluate many hands given as 52-bit masks.
         
-        if is_flush:
-            return HandRank.FLUSH, ranks, f"Flush, {HandEvaluator._rank_name(ranks[0])} high"
+        Args:
+            hand_masks: Masks with 5-7 card bits set each
+            
+        Returns:
+            List of (hand_rank, tiebreakers, hand_name), one per mask
+        """
+        evaluate = HandEvaluator.evaluate_mask
+        return [evaluate(mask) for mask in hand_masks]
+    
+    @staticmethod
+    def _evaluate_cards(cards: List[Card], hand_mask: int = 0) -> Tuple[int, List[int], str]:
+        """
+        Find the best 5-card hand among 5 or more cards.
         
-        if is_straight:
-            return HandRank.STRAIGHT, [straight_high], f"Straight, {HandEvaluator._rank_name(straight_high)} high"
+        Args:
+            cards: 5 or more cards
+            hand_mask: The cards' 52-bit mask, if already computed
+            
+        Returns:
+            Tuple of (hand_rank, tiebreakers, hand_name)
+        """
+        return HandEvaluator._evaluate_mask(hand_mask or HandEvaluator.hand_mask(cards))
+    
+    @staticmethod
+    def _evaluate_mask(hand_mask: int) -> Tuple[int, List[int], str]:
+        """
+        Find the best 5-card hand in a 52-bit hand mask.
         
-        if counts_sorted[0][1] == 3:  # Three of a kind
-            trips_rank = counts_sorted[0][0]
-            kickers = sorted([counts_sorted[1][0], counts_sorted[2][0]], reverse=True)
-            return HandRank.THREE_OF_A_KIND, [trips_rank] + kickers, f"Three of a Kind, {HandEvaluator._rank_name(trips_rank)}s"
+        Works on 13-bit rank sets (bit r-2 for rank r), one per suit. Hands
+        without a flush are looked up by rank multiset in _RANK_TABLE, and
+        only evaluated the first time that multiset is seen.
         
-        if counts_sorted[0][1] == 2 and counts_sorted[1][1] == 2:  # Two pair
-            high_pair = max(counts_sorted[0][0], counts_sorted[1][0])
-            low_pair = min(counts_sorted[0][0], counts_sorted[1][0])
-            kicker = counts_sorted[2][0]
-            return HandRank.TWO_PAIR, [high_pair, low_pair, kicker], f"Two Pair, {HandEvaluator._rank_name(high_pair)}s and {HandEvaluator._rank_name(low_pair)}s"
+        Args:
+            hand_mask: Mask with 5 or more card bits set
+            
+        Returns:
+            Tuple of (hand_rank, tiebreakers, hand_name)
+        """
+        clubs = hand_mask & _SUIT_BITS
+        diamonds = (hand_mask >> 13) & _SUIT_BITS
+        hearts = (hand_mask >> 26) & _SUIT_BITS
+        spades = (hand_mask >> 39) & _SUIT_BITS
+        
+        # Flush and straight flush (at most one suit can hold 5+ of 7 cards)
+        flush_bits = 0
+        for suit_bits in (clubs, diamonds, hearts, spades):
+            if _RANK_COUNT[suit_bits] >= 5:
+                flush_bits = suit_bits
+                break
+        if flush_bits:
+            straight_flush_high = _STRAIGHT_HIGH[flush_bits]
+            if straight_flush_high == 14:
+                return HandRank.ROYAL_FLUSH, [14], "Royal Flush"
+            if straight_flush_high:
+                return HandRank.STRAIGHT_FLUSH, [straight_flush_high], f"Straight Flush, {HandEvaluator._rank_name(straight_flush_high)} high"
+            return HandEvaluator._evaluate_ranks(clubs, diamonds, hearts, spades, flush_bits)
+        
+        key = _QUINARY[clubs] + _QUINARY[diamonds] + _QUINARY[hearts] + _QUINARY[spades]
+        result = _RANK_TABLE.get(key)
+        if result is None:
+            result = _RANK_TABLE[key] = HandEvaluator._evaluate_ranks(clubs, diamonds, hearts, spades, 0)
+        return result
+    
+    @staticmethod
+    def _evaluate_ranks(clubs: int, diamonds: int, hearts: int, spades: int, flush_bits: int) -> Tuple[int, List[int], str]:
+        """
+        Find the best hand below a straight flush from per-suit rank sets.
         
-        if counts_sorted[0][1] == 2:  # One pair
-            pair_rank = counts_sorted[0][0]
-            kickers = sorted([counts_sorted[1][0], counts_sorted[2][0], counts_sorted[3][0]], reverse=True)
-            return HandRank.ONE_PAIR, [pair_rank] + kickers, f"Pair of {HandEvaluator._rank_name(pair_rank)}s"
+        Args:
+            clubs, diamonds, hearts, spades: 13-bit rank set for each suit
+            flush_bits: Rank set of the suit holding 5+ cards, or 0 if none
+            
+        Returns:
+            Tuple of (hand_rank, tiebreakers, hand_name)
+        """
+        rank_name = HandEvaluator._rank_name
+        top_ranks = _top_ranks
+        
+        # Ranks held at least once / twice / three times / four times
+        cd = clubs & diamonds
+        hs = hearts & spades
+        ones = clubs | diamonds | hearts | spades
+        twos = cd | hs | ((clubs | diamonds) & (hearts | spades))
+        threes = (cd & (hearts | spades)) | (hs & (clubs | diamonds))
+        fours = cd & hs
+        
+        if fours:  # Four of a kind
+            quad_rank = fours.bit_length() + 1
+            kickers = top_ranks(ones & ~(1 << (quad_rank - 2)), 1)
+            return HandRank.FOUR_OF_A_KIND, [quad_rank] + kickers, f"Four of a Kind, {rank_name(quad_rank)}s"
+        
+        if threes:
+            trips_rank = threes.bit_length() + 1
+            pairs = twos & ~(1 << (trips_rank - 2))
+            if pairs:  # Full house
+                pair_rank = pairs.bit_length() + 1
+                return HandRank.FULL_HOUSE, [trips_rank, pair_rank], f"Full House, {rank_name(trips_rank)}s over {rank_name(pair_rank)}s"
+        
+        if flush_bits:
+            flush_ranks = top_ranks(flush_bits, 5)
+            return HandRank.FLUSH, flush_ranks, f"Flush, {rank_name(flush_ranks[0])} high"
+        
+        straight_high = _STRAIGHT_HIGH[ones]
+        if straight_high:
+            return HandRank.STRAIGHT, [straight_high], f"Straight, {rank_name(straight_high)} high"
+        
+        if threes:  # Three of a kind
+            kickers = top_ranks(ones & ~(1 << (trips_rank - 2)), 2)
+            return HandRank.THREE_OF_A_KIND, [trips_rank] + kickers, f"Three of a Kind, {rank_name(trips_rank)}s"
+        
+        if twos:
+            high_pair = twos.bit_length() + 1
+            rest = twos & ~(1 << (high_pair - 2))
+            if rest:  # Two pair
+                low_pair = rest.bit_length() + 1
+                kickers = top_ranks(ones & ~(1 << (high_pair - 2)) & ~(1 << (low_pair - 2)), 1)
+                return HandRank.TWO_PAIR, [high_pair, low_pair] + kickers, f"Two Pair, {rank_name(high_pair)}s and {rank_name(low_pair)}s"
+            # One pair
+            kickers = top_ranks(ones & ~(1 << (high_pair - 2)), 3)
+            return HandRank.ONE_PAIR, [high_pair] + kickers, f"Pair of {rank_name(high_pair)}s"
         
         # High card
-        return HandRank.HIGH_CARD, ranks, f"{HandEvaluator._rank_name(ranks[0])} high"
+        high_cards = top_ranks(ones, 5)
+        return HandRank.HIGH_CARD, high_cards, f"{rank_name(high_cards[0])} high"
     
     @staticmethod
-    def _check_straight(ranks: List[int]) -> Tuple[bool, int]:
+    def _straight_high(rank_mask: int) -> int:
         """
-        Check if ranks form a straight.
+        Find the highest straight in a rank bitmask.
         
         Args:
-            ranks: Sorted ranks (descending)
+            rank_mask: Bitmask with bit r set for each rank r present (2-14)
             
         Returns:
-            Tuple of (is_straight, high_card_rank)
+            High card of the best straight, or 0 if there is none
         """
-        # Check for normal straight
-        if ranks[0] - ranks[4] == 4 and len(set(ranks)) == 5:
-            return True, ranks[0]
-        
-        # Check for wheel (A-2-3-4-5)
-        if ranks == [14, 5, 4, 3, 2]:
-            return True, 5  # In a wheel, the straight is 5-high
-        
-        return False, 0
+        # An ace also plays low for the wheel (A-2-3-4-5)
+        if rank_mask & (1 << 14):
+            rank_mask |= 1 << 1
+        # Bit r of `runs` is set when ranks r..r+4 are all present
+        runs = rank_mask & (rank_mask >> 1) & (rank_mask >> 2) & (rank_mask >> 3) & (rank_mask >> 4)
+        if not runs:
+            return 0
+        return runs.bit_length() + 3
     
     @staticmethod
     def _rank_name(rank: int) -> str:
@@ -260,3 +450,7 @@ class HandEvaluator:
         
         return min(strength, 1.0)
 
+
+# High card of the best straight in each 13-bit rank set (0 if none), so the
+# evaluator does a list lookup instead of the shift-and-AND run search
+_STRAIGHT_HIGH = [HandEvaluator._straight_high(rank_bits << 2) for rank_bits in range(1 << 13)]
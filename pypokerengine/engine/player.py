@@ -211,7 +211,7 @@ class Player:
             "is_active": self.is_active,
             "is_all_in": self.is_all_in,
             "has_folded": self.has_folded,
-            "action_history": self.action_history
+            "action_history": list(self.action_history)
         }
     
     def __str__(self) -> str:
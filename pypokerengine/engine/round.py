@@ -4,7 +4,7 @@ Round Management for Poker
 This module provides the Round class for managing poker hand rounds.
 """
 
-from typing import List, Dict, Any, Optional, Callable
+from typing import List, Dict, Any, Optional, Callable, Tuple
 from enum import Enum
 from .player import Player
 from .card import Card, Deck
@@ -61,6 +61,9 @@ class Round:
         self.current_bet = 0
         self.street = Street.PREFLOP
         self.community_cards: List[Card] = []
+        # Seats in acting order for the current street: the dealer (SB) opens
+        # preflop, the big blind on every later street
+        self.acting_order: Tuple[int, int] = (dealer_position, 1 - dealer_position)
         
         # Action tracking
         self.action_history: List[Dict[str, Any]] = []
@@ -70,6 +73,12 @@ class Round:
             Street.TURN: [],
             Street.RIVER: []
         }
+        # Seats (bit i = players[i]) with a non-blind action on each street,
+        # kept in step with street_actions so turn logic doesn't rescan them
+        self.acted_mask_by_street: Dict[Street, int] = {
+            street: 0 for street in self.street_actions
+        }
+        self._seat_by_name = {p.name: i for i, p in enumerate(players)}
         
         # State flags
         self.is_complete = False
@@ -123,41 +132,36 @@ class Round:
         Returns:
             True if hand should continue, False if hand is over
         """
-        # Determine action order
-        if self.street == Street.PREFLOP:
-            # Preflop: SB acts first in heads-up
-            acting_order = [self.dealer_position, 1 - self.dealer_position]
-        else:
-            # Postflop: BB acts first (out of position)
-            acting_order = [1 - self.dealer_position, self.dealer_position]
+        players = self.players
+        acting_order = self.acting_order
+        n_seats = len(acting_order)
         
         actions_this_round = 0
         current_player_index = 0  # Track which player should act next
         
         while True:
-            active_players = [p for p in self.players if p.can_act()]
+            active_players = [p for p in players if p.can_act()]
+            n_active = len(active_players)
             
             # Check if betting is complete
-            if len(active_players) <= 1:
-                return len([p for p in self.players if p.is_active]) > 1
+            if n_active <= 1:
+                return sum(1 for p in players if p.is_active) > 1
             
-            # Check if all active players have acted and bets are equal
-            if actions_this_round >= len(active_players):
-                all_bets_equal = len(set(
-                    p.current_bet for p in active_players
-                )) == 1
-                if all_bets_equal:
+            if actions_this_round >= n_active:
+                # All active players have acted and bets are equal
+                first_bet = active_players[0].current_bet
+                if all(p.current_bet == first_bet for p in active_players):
+                    break
+                
+                # Additional check: if all players have checked (no bets) and all have acted
+                if self.current_bet == 0:
                     break
-            
-            # Additional check: if all players have checked (no bets) and all have acted
-            if self.current_bet == 0 and actions_this_round >= len(active_players):
-                break
             
             # Find the next player who needs to act
             player_to_act = None
-            for i in range(len(acting_order)):
-                pos = acting_order[(current_player_index + i) % len(acting_order)]
-                player = self.players[pos]
+            for i in range(n_seats):
+                pos = acting_order[(current_player_index + i) % n_seats]
+                player = players[pos]
                 if not player.can_act():
                     continue
                 
@@ -165,11 +169,11 @@ class Round:
                 # Player needs to act if:
                 # 1. They haven't matched the current bet, OR
                 # 2. Not all players have acted yet (but not if this player just raised)
-                needs_to_act = player.current_bet < self.current_bet or (actions_this_round < len(active_players) and self.last_aggressor != player)
+                needs_to_act = player.current_bet < self.current_bet or (actions_this_round < n_active and self.last_aggressor != player)
                 
                 if needs_to_act:
                     player_to_act = player
-                    current_player_index = (current_player_index + i + 1) % len(acting_order)
+                    current_player_index = (current_player_index + i + 1) % n_seats
                     break
             
             # If no player needs to act, all players have checked through
@@ -178,7 +182,7 @@ class Round:
             
             player = player_to_act
             legal_actions = ActionManager.get_legal_actions(
-                player, self.players, self.current_bet, self.pot, self.big_blind
+                player, players, self.current_bet, self.pot, self.big_blind
             )
             
             # Get action from callback
@@ -199,7 +203,8 @@ class Round:
             self.pot += added
             
             # Update current bet if raised
-            if action.lower() in ["raise", "bet"]:
+            action_type = ActionManager.normalize_action(action)
+            if action_type in ("raise", "bet"):
                 self.current_bet = amount
                 self.last_aggressor = player
                 actions_this_round = 1  # Reset count after raise
@@ -210,8 +215,8 @@ class Round:
             self._record_action(player.name, action, amount)
             
             # Check if hand is over
-            if action.lower() == "fold":
-                return len([p for p in self.players if p.is_active]) > 1
+            if action_type == "fold":
+                return sum(1 for p in players if p.is_active) > 1
         
         return True
     
@@ -223,6 +228,8 @@ class Round:
         self.current_bet = 0
         # Reset last aggressor for new street
         self.last_aggressor = None
+        # Postflop: BB acts first (out of position)
+        self.acting_order = (1 - self.dealer_position, self.dealer_position)
         
         if self.street == Street.PREFLOP:
             # Deal flop (3 cards)
@@ -314,6 +321,8 @@ class Round:
         }
         self.action_history.append(action_record)
         self.street_actions[self.street].append(action_record)
+        if action not in ("small_blind", "big_blind"):
+            self.acted_mask_by_street[self.street] |= 1 << self._seat_by_name[player_name]
     
     def get_state(self) -> Dict[str, Any]:
         """
@@ -11,7 +11,7 @@ by providing context about what opponents likely hold based on their actions.
 from .player_profile import PlayerProfile, PlayerArchetype
 from .hand_history import HandHistory, ActionRecord, Street
 from .range_estimator import RuleBasedRangeEstimator
-from .features import FeatureExtractor, extract_features
+from .features import FeatureExtractor, extract_features, extract_features_batch
 from .range_predictor import RangePredictor, HybridRangeEstimator
 
 __all__ = [
@@ -23,6 +23,7 @@ __all__ = [
     'RuleBasedRangeEstimator',
     'FeatureExtractor',
     'extract_features',
+    'extract_features_batch',
     'RangePredictor',
     'HybridRangeEstimator',
 ]
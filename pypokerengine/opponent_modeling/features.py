@@ -4,7 +4,7 @@ Feature Engineering Module
 Extract features from player profiles and game state for ML models.
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Sequence
 import numpy as np
 from .player_profile import PlayerProfile
 from .hand_history import Street, ActionRecord
@@ -272,6 +272,97 @@ def extract_features(
     return feature_array
 
 
+def extract_features_batch(
+    player_profiles: Sequence[PlayerProfile],
+    actions: Sequence[str],
+    streets: Sequence[Street],
+    boards: Optional[Sequence[Optional[List[str]]]] = None,
+    positions: Optional[Sequence[Optional[str]]] = None,
+    amounts: Optional[Sequence[int]] = None,
+    pot_sizes: Optional[Sequence[int]] = None,
+    effective_stacks: Optional[Sequence[int]] = None,
+    facing_bets: Optional[Sequence[int]] = None
+) -> np.ndarray:
+    """
+    Extract features for many situations at once.
+    
+    Row i equals extract_features() called with the i-th element of every
+    argument. Action, pot-odds, position and street columns are computed as
+    whole-column array ops; player and board features are computed once per
+    distinct profile / board and broadcast to their rows.
+    
+    Args:
+        player_profiles: Profile for each situation
+        actions: Action type for each situation
+        streets: Street for each situation
+        boards: Community cards for each situation (default: none)
+        positions: Position for each situation (default: none)
+        amounts: Bet amounts (default: 0)
+        pot_sizes: Pot sizes (default: 0)
+        effective_stacks: Stacks remaining (default: 0)
+        facing_bets: Bets faced (default: 0)
+        
+    Returns:
+        Numpy array of shape (n_situations, n_features), columns in
+        get_feature_names() order
+    """
+    n = len(actions)
+    if n == 0:
+        return np.zeros((0, len(get_feature_names())))
+    
+    def numeric(values: Optional[Sequence[int]]) -> np.ndarray:
+        return np.zeros(n) if values is None else np.asarray(values, dtype=float)
+    
+    columns: Dict[str, np.ndarray] = {}
+    
+    # Player features: one dict per distinct profile
+    player_rows: Dict[int, Dict[str, float]] = {}
+    for profile in player_profiles:
+        if id(profile) not in player_rows:
+            player_rows[id(profile)] = FeatureExtractor.extract_player_features(profile)
+    player_feats = [player_rows[id(profile)] for profile in player_profiles]
+    for name in player_feats[0]:
+        columns[name] = np.array([feats[name] for feats in player_feats], dtype=float)
+    
+    # Action one-hots and sizing ratios
+    action_arr = np.asarray(actions)
+    for action_type in ('fold', 'check', 'call', 'bet', 'raise'):
+        columns[f'action_{action_type}'] = (action_arr == action_type).astype(float)
+    
+    amount_arr = numeric(amounts)
+    pot_arr = numeric(pot_sizes)
+    stack_arr = numeric(effective_stacks)
+    facing_arr = numeric(facing_bets)
+    has_pot = pot_arr > 0
+    columns['pot_odds'] = np.divide(
+        facing_arr, pot_arr + facing_arr,
+        out=np.zeros(n), where=has_pot & (facing_arr > 0)
+    )
+    columns['bet_to_pot_ratio'] = np.divide(
+        amount_arr, pot_arr, out=np.zeros(n), where=has_pot & (amount_arr > 0)
+    )
+    columns['spr'] = np.divide(stack_arr, pot_arr, out=np.zeros(n), where=has_pot)
+    
+    # Position and street one-hots
+    position_arr = np.asarray(positions if positions is not None else [None] * n, dtype=object)
+    for position in ('BTN', 'SB', 'BB'):
+        columns[f'position_{position.lower()}'] = (position_arr == position).astype(float)
+    street_arr = np.asarray(streets, dtype=object)
+    for street in (Street.PREFLOP, Street.FLOP, Street.TURN, Street.RIVER):
+        columns[f'street_{street.value}'] = (street_arr == street).astype(float)
+    
+    # Board texture: one dict per distinct board
+    board_keys = [tuple(board or ()) for board in (boards if boards is not None else [None] * n)]
+    board_rows = {
+        key: FeatureExtractor.extract_board_texture_features(list(key))
+        for key in dict.fromkeys(board_keys)
+    }
+    for name in FeatureExtractor.extract_board_texture_features([]):
+        columns[name] = np.array([board_rows[key][name] for key in board_keys], dtype=float)
+    
+    return np.column_stack([columns[name] for name in sorted(columns)])
+
+
 def get_feature_names() -> List[str]:
     """
     Get ordered list of feature names.
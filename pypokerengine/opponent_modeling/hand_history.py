@@ -4,7 +4,7 @@ Hand History Module
 Records and tracks all actions across poker hands for opponent analysis.
 """
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -144,12 +144,18 @@ class HandHistory:
     Tracks complete history of all hands played.
     
     Provides methods to query historical data for opponent modeling.
+    
+    Completed hands are also indexed by player, and action counts are kept
+    per (player, street), so per-player queries don't rescan every action
+    of every hand.
     """
     
     def __init__(self):
         """Initialize empty hand history."""
         self.hands: List[HandRecord] = []
         self._current_hand: Optional[HandRecord] = None
+        self._hands_by_player: Dict[str, List[HandRecord]] = {}
+        self._action_counts: Dict[Tuple[str, Street], Dict[str, int]] = {}
     
     def start_new_hand(
         self,
@@ -247,8 +253,17 @@ class HandHistory:
             self._current_hand.showdown_hands = showdown_hands
         
         self.hands.append(self._current_hand)
+        self._index_hand(self._current_hand)
         self._current_hand = None
     
+    def _index_hand(self, hand: HandRecord):
+        """Add a completed hand to the per-player indexes."""
+        for player_id in dict.fromkeys(a.player_id for a in hand.actions):
+            self._hands_by_player.setdefault(player_id, []).append(hand)
+        for a in hand.actions:
+            counts = self._action_counts.setdefault((a.player_id, a.street), {})
+            counts[a.action_type] = counts.get(a.action_type, 0) + 1
+    
     def get_player_hands(self, player_id: str, limit: Optional[int] = None) -> List[HandRecord]:
         """
         Get all hands involving a specific player.
@@ -260,14 +275,11 @@ class HandHistory:
         Returns:
             List of HandRecords involving the player
         """
-        player_hands = [
-            hand for hand in self.hands
-            if any(a.player_id == player_id for a in hand.actions)
-        ]
+        player_hands = self._hands_by_player.get(player_id, [])
         
         if limit:
             return player_hands[-limit:]
-        return player_hands
+        return list(player_hands)
     
     def get_recent_hands(self, n: int = 10) -> List[HandRecord]:
         """Get N most recent hands."""
@@ -285,7 +297,7 @@ class HandHistory:
         """
         if player_id is None:
             return len(self.hands)
-        return len(self.get_player_hands(player_id))
+        return len(self._hands_by_player.get(player_id, []))
     
     def get_action_frequency(
         self,
@@ -304,27 +316,17 @@ class HandHistory:
         Returns:
             Frequency (0-1) of this action
         """
-        player_hands = self.get_player_hands(player_id)
-        
-        total_actions = 0
-        action_count = 0
-        
-        for hand in player_hands:
-            street_actions = [
-                a for a in hand.actions
-                if a.player_id == player_id and a.street == street
-            ]
-            total_actions += len(street_actions)
-            action_count += sum(1 for a in street_actions if a.action_type == action_type)
-        
-        if total_actions == 0:
+        counts = self._action_counts.get((player_id, street))
+        if not counts:
             return 0.0
-        return action_count / total_actions
+        return counts.get(action_type, 0) / sum(counts.values())
     
     def clear(self):
         """Clear all hand history."""
         self.hands = []
         self._current_hand = None
+        self._hands_by_player = {}
+        self._action_counts = {}
     
     def __len__(self) -> int:
         """Return number of completed hands."""
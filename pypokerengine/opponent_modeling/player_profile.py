@@ -7,6 +7,7 @@ Tracks opponent statistics and playing tendencies over time.
 from typing import Optional, Dict, Any
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import cached_property
 
 
 class PlayerArchetype(Enum):
@@ -18,6 +19,16 @@ class PlayerArchetype(Enum):
     UNKNOWN = "unknown"                   # Not enough data yet
 
 
+# Derived stats memoized on the instance, and the counters they read;
+# assigning one of those counters drops the memoized values
+_CACHED_STATS = ('vpip', 'pfr', 'aggression_factor', 'fold_to_cbet', '_archetype')
+_STAT_INPUTS = frozenset((
+    'hands_played', 'vpip_count', 'pfr_count',
+    'postflop_bets', 'postflop_raises', 'postflop_calls',
+    'cbet_faced', 'cbet_folded',
+))
+
+
 @dataclass
 class PlayerProfile:
     """
@@ -75,21 +86,31 @@ class PlayerProfile:
     # Metadata
     notes: str = ""
     
-    @property
+    def __setattr__(self, name: str, value: Any):
+        """Set a field, dropping cached stats that depend on it."""
+        if name in _CACHED_STATS:
+            raise AttributeError(f"can't set derived stat '{name}'")
+        object.__setattr__(self, name, value)
+        if name in _STAT_INPUTS:
+            cached = self.__dict__
+            for stat in _CACHED_STATS:
+                cached.pop(stat, None)
+    
+    @cached_property
     def vpip(self) -> float:
         """Voluntarily Put $ In Pot percentage."""
         if self.hands_played == 0:
             return 0.0
         return self.vpip_count / self.hands_played
     
-    @property
+    @cached_property
     def pfr(self) -> float:
         """Pre-Flop Raise percentage."""
         if self.hands_played == 0:
             return 0.0
         return self.pfr_count / self.hands_played
     
-    @property
+    @cached_property
     def aggression_factor(self) -> float:
         """
         Aggression Factor: (Bets + Raises) / Calls
@@ -106,7 +127,7 @@ class PlayerProfile:
             return float(aggressive_actions) if aggressive_actions > 0 else 0.0
         return (self.postflop_bets + self.postflop_raises) / self.postflop_calls
     
-    @property
+    @cached_property
     def fold_to_cbet(self) -> float:
         """Percentage of times folded to continuation bet."""
         if self.cbet_faced == 0:
@@ -150,6 +171,11 @@ class PlayerProfile:
         Returns:
             PlayerArchetype enum value
         """
+        return self._archetype
+    
+    @cached_property
+    def _archetype(self) -> PlayerArchetype:
+        """Archetype classification behind get_archetype()."""
         # Need minimum hands for classification
         if self.hands_played < 20:
             return PlayerArchetype.UNKNOWN
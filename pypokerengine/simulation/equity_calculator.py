@@ -5,14 +5,14 @@ High-level API for poker equity calculations with LRU caching
 for performance optimization during training and gameplay.
 """
 
-from typing import List, Optional, Tuple, Union
+from typing import FrozenSet, List, Optional, Tuple, Union
 from functools import lru_cache
-import hashlib
 from dataclasses import dataclass
 
 from ..engine.card import Card
+from ..engine.hand_evaluator import HandEvaluator
 from .hand_range import HandRange, parse_hand_to_cards
-from .monte_carlo import MonteCarloSimulator, SimulationResult
+from .monte_carlo import MonteCarloSimulator, SimulationResult, runout_count
 
 
 @dataclass
@@ -131,6 +131,48 @@ class EquityCalculator:
         else:
             return self._calculate_hand_vs_random(hero_cards, board_cards, n_sims)
     
+    def calculate_equity_batch(
+        self,
+        matchups: List[Tuple],
+        n_simulations: Optional[int] = None
+    ) -> List[EquityResult]:
+        """
+        Calculate hand vs hand equity for many matchups at once.
+        
+        A convenience loop over the hand vs hand path of calculate_equity:
+        each matchup is parsed and looked up in the same result cache in
+        turn, so duplicates within the batch and matchups already computed
+        by earlier calls are only simulated once.
+        
+        Args:
+            matchups: (hero_hand, villain_hand) or (hero_hand, villain_hand, board)
+                tuples, in any format calculate_equity accepts
+            n_simulations: Override default simulation count
+            
+        Returns:
+            List of EquityResult, one per matchup, in order
+            
+        Example:
+            >>> calc = EquityCalculator()
+            >>> results = calc.calculate_equity_batch([
+            ...     ("AhAd", "KsKd"),
+            ...     ("AhKc", "QsQd", "Ac7d2s"),
+            ... ])
+        """
+        n_sims = n_simulations or self.default_simulations
+        
+        results = []
+        for matchup in matchups:
+            hero_hand, villain_hand = matchup[0], matchup[1]
+            board = matchup[2] if len(matchup) > 2 else None
+            hero_cards = self._parse_hand(hero_hand)
+            villain_cards = self._parse_hand(villain_hand)
+            board_cards = self._parse_board(board) if board else []
+            results.append(self._calculate_hand_vs_hand(
+                hero_cards, villain_cards, board_cards, n_sims
+            ))
+        return results
+    
     def calculate_preflop_equity(
         self,
         hero_hand: Union[str, List[Card]],
@@ -155,6 +197,30 @@ class EquityCalculator:
             n_simulations=n_simulations
         )
     
+    def calculate_preflop_equity_batch(
+        self,
+        hero_hands: List[Union[str, List[Card]]],
+        n_simulations: Optional[int] = None
+    ) -> List[EquityResult]:
+        """
+        Calculate preflop equity against a random hand for many hands at once.
+        
+        Args:
+            hero_hands: Hero hands, each as "AhKh" or [Card, Card]
+            n_simulations: Override default simulation count
+            
+        Returns:
+            List of EquityResult, one per hand, in order
+            
+        Example:
+            >>> calc = EquityCalculator()
+            >>> aa, kk = calc.calculate_preflop_equity_batch(["AhAd", "KhKc"])
+        """
+        n_sims = n_simulations or self.default_simulations
+        hero_cards = [self._parse_hand(hand) for hand in hero_hands]
+        sim_results = self.simulator.simulate_hand_vs_random_batch(hero_cards, n_sims)
+        return [self._result_to_equity_result(result) for result in sim_results]
+    
     def calculate_postflop_equity(
         self,
         hero_hand: Union[str, List[Card]],
@@ -207,22 +273,23 @@ class EquityCalculator:
         n_simulations: int
     ) -> EquityResult:
         """Internal method for hand vs range calculation with caching."""
-        # Get villain combinations (accounting for blockers)
-        exclude_cards = hero_cards + board_cards
-        villain_combos = villain_range.get_combinations(exclude_cards=exclude_cards)
-        
-        if not villain_combos:
-            raise ValueError("Villain range has no valid combinations after removing blockers")
-        
-        # Create cache key
+        # The villain combos follow from the range and the blockers, so the
+        # key is built before generating them and a cache hit skips that work
         cache_key = self._make_hand_vs_range_key(
-            hero_cards, villain_combos, board_cards, n_simulations
+            hero_cards, villain_range, board_cards, n_simulations
         )
         
         # Check cache first
         if hasattr(self, '_range_cache') and cache_key in self._range_cache:
             sim_result = self._range_cache[cache_key]
         else:
+            # Get villain combinations (accounting for blockers)
+            exclude_cards = hero_cards + board_cards
+            villain_combos = villain_range.get_combinations(exclude_cards=exclude_cards)
+            
+            if not villain_combos:
+                raise ValueError("Villain range has no valid combinations after removing blockers")
+            
             # Compute and cache
             sim_result = self.simulator.simulate_hand_vs_range(
                 hero_cards, villain_combos, board_cards, n_simulations
@@ -244,9 +311,9 @@ class EquityCalculator:
         n_simulations: int
     ) -> EquityResult:
         """Calculate equity against a random hand."""
-        sim_result = self.simulator.calculate_preflop_equity(
-            hero_cards, villain_cards=None, n_simulations=n_simulations
-        )
+        sim_result = self.simulator.simulate_hand_vs_random_batch(
+            [hero_cards], n_simulations, board_cards
+        )[0]
         return self._result_to_equity_result(sim_result)
     
     def _compute_hand_vs_hand(self, cache_key: str) -> SimulationResult:
@@ -254,6 +321,13 @@ class EquityCalculator:
         # Unpack cache key
         hero_cards, villain_cards, board_cards, n_sims = self._unpack_hand_vs_hand_key(cache_key)
         
+        # Exact and cheaper than sampling once few enough runouts remain
+        # (990 on the flop, 44 on the turn)
+        if runout_count(len(board_cards)) <= n_sims:
+            return self.simulator.enumerate_hand_vs_hand(
+                hero_cards, villain_cards, board_cards
+            )
+        
         # Run simulation
         return self.simulator.simulate_hand_vs_hand(
             hero_cards, villain_cards, board_cards, n_sims
@@ -278,20 +352,22 @@ class EquityCalculator:
     def _make_hand_vs_range_key(
         self,
         hero_cards: List[Card],
-        villain_combos: List[Tuple[Card, Card]],
+        villain_range: HandRange,
         board_cards: List[Card],
         n_simulations: int
-    ) -> str:
-        """Create cache key for hand vs range."""
-        hero_str = self._cards_to_string(hero_cards)
-        board_str = self._cards_to_string(board_cards)
-        
-        # Create deterministic hash of villain combos
-        combo_strs = sorted([self._cards_to_string(list(combo)) for combo in villain_combos])
-        combo_hash = hashlib.md5(','.join(combo_strs).encode()).hexdigest()[:8]
+    ) -> Tuple[int, int, FrozenSet[str], int]:
+        """
+        Create cache key for hand vs range.
         
-        key = f"hvr:{hero_str}:{combo_hash}:{board_str}:{n_simulations}"
-        return key
+        Hero and board are addressed by their 52-bit card masks, so the key
+        depends only on which cards are out, not the order they came in.
+        """
+        return (
+            HandEvaluator.hand_mask(hero_cards),
+            HandEvaluator.hand_mask(board_cards),
+            frozenset(villain_range.hands),
+            n_simulations,
+        )
     
     def _unpack_hand_vs_hand_key(self, key: str) -> Tuple[List[Card], List[Card], List[Card], int]:
         """Unpack cache key for hand vs hand."""
@@ -305,16 +381,14 @@ class EquityCalculator:
     
     def _cards_to_string(self, cards: List[Card]) -> str:
         """Convert cards to sortable string."""
-        return ','.join(sorted([str(card) for card in cards]))
+        return ','.join(sorted([card.to_ascii() for card in cards]))
     
     def _string_to_cards(self, s: str) -> List[Card]:
         """Convert string back to cards."""
         if not s:
             return []
         card_strs = s.split(',')
-        return [Card.from_string(cs.replace('♣', 'c').replace('♦', 'd')
-                                    .replace('♥', 'h').replace('♠', 's')) 
-                for cs in card_strs]
+        return [Card.from_string(cs) for cs in card_strs]
     
     def _parse_hand(self, hand: Union[str, List[Card]]) -> List[Card]:
         """Parse hand input to list of cards."""
@@ -344,7 +418,10 @@ class EquityCalculator:
         # For binomial distribution: std_error ≈ sqrt(p*(1-p)/n)
         equity = sim_result.equity
         n = sim_result.total_simulations
-        std_error = (equity * (1 - equity) / n) ** 0.5 if n > 0 else 0.0
+        if sim_result.exact:
+            std_error = 0.0
+        else:
+            std_error = (equity * (1 - equity) / n) ** 0.5 if n > 0 else 0.0
         
         return EquityResult(
             equity=equity,
@@ -354,6 +431,18 @@ class EquityCalculator:
             std_error=std_error
         )
     
+    def __getstate__(self) -> dict:
+        """Pickle without the memoized results (the lru_cache wrapper isn't picklable)."""
+        state = self.__dict__.copy()
+        del state['_cached_hand_vs_hand']
+        state['_range_cache'] = {}
+        return state
+    
+    def __setstate__(self, state: dict):
+        """Restore and start with empty caches."""
+        self.__dict__.update(state)
+        self._cached_hand_vs_hand = lru_cache(maxsize=self.cache_size)(self._compute_hand_vs_hand)
+    
     def clear_cache(self):
         """Clear all cached equity calculations."""
         self._cached_hand_vs_hand.cache_clear()
@@ -5,7 +5,8 @@ Represents and manipulates poker hand ranges for equity calculations.
 Supports heads-up specific range notation and combo generation.
 """
 
-from typing import List, Set, Tuple, Optional
+from typing import Dict, FrozenSet, List, Set, Tuple, Optional
+from functools import lru_cache
 from itertools import combinations
 import re
 from ..engine.card import Card, Rank, Suit
@@ -27,6 +28,10 @@ class HandRange:
                    '9': 9, '8': 8, '7': 7, '6': 6, '5': 5, 
                    '4': 4, '3': 3, '2': 2}
     
+    # Every combo of each hand string, before blockers are removed; shared
+    # by all ranges since a hand's combos never change
+    _COMBOS: Dict[str, List[Tuple[Card, Card]]] = {}
+    
     def __init__(self, hands: Optional[Set[str]] = None):
         """
         Initialize a hand range.
@@ -53,41 +58,7 @@ class HandRange:
             >>> HandRange.from_string("ATs+")  # All suited aces from T to K
             >>> HandRange.from_string("22-77")  # All pairs from 22 to 77
         """
-        hands = set()
-        parts = [p.strip() for p in range_string.split(',')]
-        
-        for part in parts:
-            if not part:
-                continue
-            
-            # Handle specific hands with suited/offsuit (e.g., "AKs", "AKo") - check first!
-            if len(part) == 3 and part[2] in ['s', 'o', 'S', 'O']:
-                hands.add(part.upper())
-            
-            # Handle pair ranges (e.g., "JJ+", "22-77")
-            elif len(part) == 3 and part[0] == part[1] and part[2] == '+':
-                hands.update(cls._parse_pair_plus(part[:2]))
-            elif '-' in part and len(part) == 5:
-                hands.update(cls._parse_pair_range(part))
-            
-            # Handle suited/offsuit ranges (e.g., "ATs+", "AJo+")
-            elif len(part) == 4 and part[3] == '+':
-                if part[2] in ['s', 'S']:
-                    hands.update(cls._parse_suited_plus(part[:2]))
-                elif part[2] in ['o', 'O']:
-                    hands.update(cls._parse_offsuit_plus(part[:2]))
-            
-            # Handle two-card notation
-            elif len(part) == 2:
-                # If both cards are the same, it's a pair
-                if part[0] == part[1]:
-                    hands.add(part.upper())
-                else:
-                    # If different, add both suited and offsuit
-                    hands.add(part.upper() + 'S')
-                    hands.add(part.upper() + 'O')
-            
-        return cls(hands)
+        return cls(set(_parse_range_string(cls, range_string)))
     
     @classmethod
     def _parse_pair_plus(cls, pair: str) -> Set[str]:
@@ -159,11 +130,24 @@ class HandRange:
         all_combos = []
         
         for hand in self.hands:
-            combos = self._hand_to_combos(hand, exclude_set)
-            all_combos.extend(combos)
+            combos = self._cached_combos(hand)
+            if exclude_set:
+                all_combos.extend(
+                    combo for combo in combos
+                    if combo[0] not in exclude_set and combo[1] not in exclude_set
+                )
+            else:
+                all_combos.extend(combos)
         
         return all_combos
     
+    def _cached_combos(self, hand: str) -> List[Tuple[Card, Card]]:
+        """Return every combo of a hand, generated once per hand string."""
+        combos = self._COMBOS.get(hand)
+        if combos is None:
+            combos = self._COMBOS[hand] = self._hand_to_combos(hand, set())
+        return combos
+    
     def _hand_to_combos(self, hand: str, exclude_set: Set[Card]) -> List[Tuple[Card, Card]]:
         """
         Convert a hand string to all possible card combinations.
@@ -219,7 +203,20 @@ class HandRange:
         Returns:
             Total number of possible combinations
         """
-        return len(self.get_combinations(exclude_cards))
+        exclude_set = set(exclude_cards) if exclude_cards else set()
+        total = 0
+        
+        for hand in self.hands:
+            combos = self._cached_combos(hand)
+            if exclude_set:
+                total += sum(
+                    1 for c1, c2 in combos
+                    if c1 not in exclude_set and c2 not in exclude_set
+                )
+            else:
+                total += len(combos)
+        
+        return total
     
     def __len__(self) -> int:
         """Return number of unique hands in range."""
@@ -234,6 +231,52 @@ class HandRange:
         return ', '.join(sorted(self.hands))
 
 
+@lru_cache(maxsize=1024)
+def _parse_range_string(cls: type, range_string: str) -> FrozenSet[str]:
+    """
+    Expand range notation into hand strings (see HandRange.from_string).
+    
+    Memoized per class, since the same range strings are parsed over and
+    over by strategies and demos; the result is frozen so it can be shared.
+    The _parse_* helpers are looked up on cls so subclasses can override them.
+    """
+    hands = set()
+    parts = [p.strip() for p in range_string.split(',')]
+    
+    for part in parts:
+        if not part:
+            continue
+        
+        # Handle specific hands with suited/offsuit (e.g., "AKs", "AKo") - check first!
+        if len(part) == 3 and part[2] in ['s', 'o', 'S', 'O']:
+            hands.add(part.upper())
+        
+        # Handle pair ranges (e.g., "JJ+", "22-77")
+        elif len(part) == 3 and part[0] == part[1] and part[2] == '+':
+            hands.update(cls._parse_pair_plus(part[:2]))
+        elif '-' in part and len(part) == 5:
+            hands.update(cls._parse_pair_range(part))
+        
+        # Handle suited/offsuit ranges (e.g., "ATs+", "AJo+")
+        elif len(part) == 4 and part[3] == '+':
+            if part[2] in ['s', 'S']:
+                hands.update(cls._parse_suited_plus(part[:2]))
+            elif part[2] in ['o', 'O']:
+                hands.update(cls._parse_offsuit_plus(part[:2]))
+        
+        # Handle two-card notation
+        elif len(part) == 2:
+            # If both cards are the same, it's a pair
+            if part[0] == part[1]:
+                hands.add(part.upper())
+            else:
+                # If different, add both suited and offsuit
+                hands.add(part.upper() + 'S')
+                hands.add(part.upper() + 'O')
+    
+    return frozenset(hands)
+
+
 def parse_hand_to_cards(hand_str: str) -> Tuple[Card, Card]:
     """
     Parse a specific hand string to two Card objects.
@@ -6,8 +6,10 @@ Optimized for heads-up pot-limit Texas Hold'em.
 """
 
 from typing import List, Tuple, Optional, Dict
+from itertools import combinations
+from math import comb
 import random
-from ..engine.card import Card, Deck
+from ..engine.card import Card
 from ..engine.hand_evaluator import HandEvaluator
 
 
@@ -20,10 +22,11 @@ class SimulationResult:
         losses: Number of losses
         ties: Number of ties
         total_simulations: Total simulations run
+        exact: True if every runout was enumerated rather than sampled
         equity: Win equity (0-1)
     """
     
-    def __init__(self, wins: int, losses: int, ties: int):
+    def __init__(self, wins: int, losses: int, ties: int, exact: bool = False):
         """
         Initialize simulation result.
         
@@ -31,11 +34,13 @@ class SimulationResult:
             wins: Number of wins
             losses: Number of losses
             ties: Number of ties
+            exact: Whether the counts come from full enumeration
         """
         self.wins = wins
         self.losses = losses
         self.ties = ties
         self.total_simulations = wins + losses + ties
+        self.exact = exact
     
     @property
     def equity(self) -> float:
@@ -117,6 +122,30 @@ class MonteCarloSimulator:
             >>> result = sim.simulate_hand_vs_hand(hero, villain, board)
             >>> print(f"Hero equity: {result.equity:.2%}")
         """
+        return self.simulate_hand_vs_hand_batch(
+            [(hero_cards, villain_cards, board)],
+            n_simulations
+        )[0]
+    
+    def enumerate_hand_vs_hand(
+        self,
+        hero_cards: List[Card],
+        villain_cards: List[Card],
+        board: Optional[List[Card]] = None
+    ) -> SimulationResult:
+        """
+        Compute exact equity between two hands by enumerating every runout.
+        
+        Only practical when few board cards are missing; see runout_count.
+        
+        Args:
+            hero_cards: Hero's hole cards (2 cards)
+            villain_cards: Villain's hole cards (2 cards)
+            board: Current board cards (0-5 cards)
+            
+        Returns:
+            SimulationResult counting each runout once, with exact=True
+        """
         if len(hero_cards) != 2 or len(villain_cards) != 2:
             raise ValueError("Both players must have exactly 2 hole cards")
         
@@ -124,41 +153,147 @@ class MonteCarloSimulator:
         if len(board) > 5:
             raise ValueError("Board cannot have more than 5 cards")
         
-        n_sims = n_simulations or self.n_simulations
+        score = HandEvaluator.score_mask
+        hero_mask = HandEvaluator.hand_mask(hero_cards)
+        villain_mask = HandEvaluator.hand_mask(villain_cards)
+        board_mask = HandEvaluator.hand_mask(board)
+        known = hero_mask | villain_mask | board_mask
+        stub = [1 << i for i in range(52) if not known >> i & 1]
         
         wins = 0
         losses = 0
-        ties = 0
+        runouts = 0
+        for runout in combinations(stub, 5 - len(board)):
+            sim_board = board_mask
+            for bit in runout:
+                sim_board |= bit
+            hero_score = score(hero_mask | sim_board)
+            villain_score = score(villain_mask | sim_board)
+            if hero_score > villain_score:
+                wins += 1
+            elif hero_score < villain_score:
+                losses += 1
+            runouts += 1
+        
+        return SimulationResult(wins, losses, runouts - wins - losses, exact=True)
+    
+    def simulate_hand_vs_hand_batch(
+        self,
+        matchups: List[Tuple[List[Card], List[Card], List[Card]]],
+        n_simulations: Optional[int] = None
+    ) -> List[SimulationResult]:
+        """
+        Simulate equity for many hand vs hand matchups in one pass.
         
-        # Create deck and remove known cards
-        known_cards = set(hero_cards + villain_cards + board)
+        Runouts are dealt by a partial Fisher-Yates shuffle of each
+        matchup's remaining-card bits, reusing the same buffer for every
+        simulation, and scored with HandEvaluator.score_mask, so no Deck
+        or Card lists are built per simulation.
         
-        for _ in range(n_sims):
-            # Create a fresh deck for this simulation
-            deck = Deck(seed=None)  # Don't use seed for individual simulations
+        Args:
+            matchups: (hero_cards, villain_cards, board) triples
+            n_simulations: Override default simulation count
             
-            # Remove known cards
-            deck.cards = [c for c in deck.cards if c not in known_cards]
-            deck.shuffle()
+        Returns:
+            One SimulationResult per matchup, in order
+        """
+        n_sims = n_simulations or self.n_simulations
+        score = HandEvaluator.score_mask
+        rand = random.random
+        results = []
+        
+        for hero_cards, villain_cards, board in matchups:
+            if len(hero_cards) != 2 or len(villain_cards) != 2:
+                raise ValueError("Both players must have exactly 2 hole cards")
+            board = board or []
+            if len(board) > 5:
+                raise ValueError("Board cannot have more than 5 cards")
             
-            # Complete the board (deal remaining cards)
+            hero_mask = HandEvaluator.hand_mask(hero_cards)
+            villain_mask = HandEvaluator.hand_mask(villain_cards)
+            board_mask = HandEvaluator.hand_mask(board)
+            known = hero_mask | villain_mask | board_mask
+            stub = [1 << i for i in range(52) if not known >> i & 1]
+            stub_size = len(stub)
             remaining_cards = 5 - len(board)
-            sim_board = board + [deck.deal_one() for _ in range(remaining_cards)]
             
-            # Evaluate both hands
-            hero_hand = hero_cards + sim_board
-            villain_hand = villain_cards + sim_board
+            wins = 0
+            losses = 0
+            for _ in range(n_sims):
+                sim_board = board_mask
+                for j in range(remaining_cards):
+                    k = j + int(rand() * (stub_size - j))
+                    stub[j], stub[k] = stub[k], stub[j]
+                    sim_board |= stub[j]
+                hero_score = score(hero_mask | sim_board)
+                villain_score = score(villain_mask | sim_board)
+                if hero_score > villain_score:
+                    wins += 1
+                elif hero_score < villain_score:
+                    losses += 1
+            results.append(SimulationResult(wins, losses, n_sims - wins - losses))
+        
+        return results
+    
+    def simulate_hand_vs_random_batch(
+        self,
+        hero_hands: List[List[Card]],
+        n_simulations: Optional[int] = None,
+        board: Optional[List[Card]] = None
+    ) -> List[SimulationResult]:
+        """
+        Simulate equity against a random hand for many hero hands.
+        
+        Each simulation deals the villain's hole cards and the rest of the
+        board with one partial Fisher-Yates pass over the unseen cards.
+        
+        Args:
+            hero_hands: Hero hole cards (2 cards each)
+            n_simulations: Override default simulation count
+            board: Board cards shared by every hand (0-5 cards)
             
-            result = HandEvaluator.compare_hands(hero_hand, villain_hand)
+        Returns:
+            One SimulationResult per hero hand, in order
+        """
+        board = board or []
+        if len(board) > 5:
+            raise ValueError("Board cannot have more than 5 cards")
+        
+        n_sims = n_simulations or self.n_simulations
+        score = HandEvaluator.score_mask
+        rand = random.random
+        board_mask = HandEvaluator.hand_mask(board)
+        cards_needed = 7 - len(board)
+        results = []
+        
+        for hero_cards in hero_hands:
+            if len(hero_cards) != 2:
+                raise ValueError("Hero must have exactly 2 hole cards")
             
-            if result > 0:
-                wins += 1
-            elif result < 0:
-                losses += 1
-            else:
-                ties += 1
+            hero_mask = HandEvaluator.hand_mask(hero_cards)
+            known = hero_mask | board_mask
+            stub = [1 << i for i in range(52) if not known >> i & 1]
+            stub_size = len(stub)
+            
+            wins = 0
+            losses = 0
+            for _ in range(n_sims):
+                # Villain's hole cards land in stub[0:2], the runout after them
+                for j in range(cards_needed):
+                    k = j + int(rand() * (stub_size - j))
+                    stub[j], stub[k] = stub[k], stub[j]
+                sim_board = board_mask
+                for bit in stub[2:cards_needed]:
+                    sim_board |= bit
+                hero_score = score(hero_mask | sim_board)
+                villain_score = score(stub[0] | stub[1] | sim_board)
+                if hero_score > villain_score:
+                    wins += 1
+                elif hero_score < villain_score:
+                    losses += 1
+            results.append(SimulationResult(wins, losses, n_sims - wins - losses))
         
-        return SimulationResult(wins, losses, ties)
+        return results
     
     def simulate_hand_vs_range(
         self,
@@ -196,33 +331,13 @@ class MonteCarloSimulator:
         
         board = board or []
         n_sims = n_simulations or self.n_simulations
-        
-        total_wins = 0
-        total_losses = 0
-        total_ties = 0
-        
-        # For each simulation, randomly select a villain hand from the range
-        for _ in range(n_sims):
-            # Randomly select villain hand
-            villain_cards = list(random.choice(villain_combos))
-            
-            # Make sure no card overlap with hero (shouldn't happen if range properly filtered)
-            if any(card in hero_cards for card in villain_cards):
-                continue
-            
-            # Run one simulation for this matchup
-            result = self.simulate_hand_vs_hand(
-                hero_cards, 
-                villain_cards, 
-                board, 
-                n_simulations=1
-            )
-            
-            total_wins += result.wins
-            total_losses += result.losses
-            total_ties += result.ties
-        
-        return SimulationResult(total_wins, total_losses, total_ties)
+        return _sample_range_showdowns(
+            [HandEvaluator.hand_mask(hero_cards)],
+            [HandEvaluator.hand_mask(combo) for combo in villain_combos],
+            HandEvaluator.hand_mask(board),
+            5 - len(board),
+            n_sims
+        )
     
     def simulate_range_vs_range(
         self,
@@ -248,35 +363,13 @@ class MonteCarloSimulator:
         
         board = board or []
         n_sims = n_simulations or self.n_simulations
-        
-        total_wins = 0
-        total_losses = 0
-        total_ties = 0
-        
-        for _ in range(n_sims):
-            # Randomly select hands from both ranges
-            hero_cards = list(random.choice(hero_combos))
-            villain_cards = list(random.choice(villain_combos))
-            
-            # Ensure no card overlap
-            if any(card in villain_cards for card in hero_cards):
-                continue
-            if board and any(card in hero_cards + villain_cards for card in board):
-                continue
-            
-            # Run one simulation
-            result = self.simulate_hand_vs_hand(
-                hero_cards,
-                villain_cards,
-                board,
-                n_simulations=1
-            )
-            
-            total_wins += result.wins
-            total_losses += result.losses
-            total_ties += result.ties
-        
-        return SimulationResult(total_wins, total_losses, total_ties)
+        return _sample_range_showdowns(
+            [HandEvaluator.hand_mask(combo) for combo in hero_combos],
+            [HandEvaluator.hand_mask(combo) for combo in villain_combos],
+            HandEvaluator.hand_mask(board),
+            5 - len(board),
+            n_sims
+        )
     
     def calculate_preflop_equity(
         self,
@@ -297,33 +390,73 @@ class MonteCarloSimulator:
         """
         if villain_cards:
             return self.simulate_hand_vs_hand(hero_cards, villain_cards, [], n_simulations)
+        return self.simulate_hand_vs_random_batch([hero_cards], n_simulations)[0]
+
+
+def _sample_range_showdowns(
+    hero_masks: List[int],
+    villain_masks: List[int],
+    board_mask: int,
+    remaining_cards: int,
+    n_sims: int
+) -> SimulationResult:
+    """
+    Sample showdowns between two lists of hole-card masks.
+    
+    Each simulation picks one mask from each side, skips the draw if they
+    share a card with each other or the board, and completes the board from
+    the bits not already on it. Dead hole cards are dropped from an
+    over-sized sample rather than rebuilding the stub per draw; the first
+    remaining_cards live bits of a uniform sample are themselves uniform.
+    """
+    score = HandEvaluator.score_mask
+    choice = random.choice
+    sample = random.sample
+    stub = [1 << i for i in range(52) if not board_mask >> i & 1]
+    draw_size = remaining_cards + 4 if remaining_cards else 0
+    
+    wins = 0
+    losses = 0
+    ties = 0
+    for _ in range(n_sims):
+        hero_mask = choice(hero_masks)
+        villain_mask = choice(villain_masks)
+        if hero_mask & villain_mask or (hero_mask | villain_mask) & board_mask:
+            continue
+        
+        dead = hero_mask | villain_mask
+        sim_board = board_mask
+        drawn = 0
+        for bit in sample(stub, draw_size):
+            if drawn == remaining_cards:
+                break
+            if not bit & dead:
+                sim_board |= bit
+                drawn += 1
+        
+        hero_score = score(hero_mask | sim_board)
+        villain_score = score(villain_mask | sim_board)
+        if hero_score > villain_score:
+            wins += 1
+        elif hero_score < villain_score:
+            losses += 1
         else:
-            # Simulate against a random hand
-            # Create all possible villain hands excluding hero cards
-            deck = Deck()
-            deck.cards = [c for c in deck.cards if c not in hero_cards]
-            
-            wins = 0
-            losses = 0
-            ties = 0
-            n_sims = n_simulations or self.n_simulations
-            
-            for _ in range(n_sims):
-                deck.shuffle()
-                villain_cards = [deck.cards[0], deck.cards[1]]
-                
-                result = self.simulate_hand_vs_hand(
-                    hero_cards,
-                    villain_cards,
-                    [],
-                    n_simulations=1
-                )
-                
-                wins += result.wins
-                losses += result.losses
-                ties += result.ties
-            
-            return SimulationResult(wins, losses, ties)
+            ties += 1
+    
+    return SimulationResult(wins, losses, ties)
+
+
+def runout_count(board_size: int) -> int:
+    """
+    Number of distinct board completions once both players' hands are known.
+    
+    Args:
+        board_size: Cards already on the board (0-5)
+        
+    Returns:
+        C(48 - board_size, 5 - board_size), e.g. 990 on the flop
+    """
+    return comb(48 - board_size, 5 - board_size)
 
 
 def quick_equity_check(hero_hand: str, villain_hand: str, board_str: str = "") -> float:
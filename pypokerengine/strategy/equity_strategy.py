@@ -178,26 +178,13 @@ class EquityStrategy:
     ) -> float:
         """Calculate hero's equity vs opponent range."""
         try:
-            # Convert Card objects to strings with ASCII suits
-            def card_to_str(card: Card) -> str:
-                """Convert Card to string format like 'Ah', 'Kd'."""
-                rank_map = {14: 'A', 13: 'K', 12: 'Q', 11: 'J', 10: 'T'}
-                rank_str = rank_map.get(card.rank, str(card.rank))
-                
-                # Convert unicode suit to ASCII
-                suit_str = str(card.suit)
-                suit_map = {'♥': 'h', '♦': 'd', '♣': 'c', '♠': 's',
-                           'h': 'h', 'd': 'd', 'c': 'c', 's': 's'}
-                suit_ascii = suit_map.get(suit_str, 'h')
-                
-                return f"{rank_str}{suit_ascii}"
-            
-            hero_str = ''.join([card_to_str(c) for c in hero_hand])
+            # Convert Card objects to strings like 'AhKd'
+            hero_str = ''.join([c.to_ascii() for c in hero_hand])
             
             # Convert board to string format (concatenated)
             board_str = None
             if board:
-                board_str = ''.join([card_to_str(c) for c in board])
+                board_str = ''.join([c.to_ascii() for c in board])
             
             result = self.equity_calc.calculate_equity(
                 hero_hand=hero_str,
@@ -399,16 +386,7 @@ class EquityStrategy:
         # Calculate preflop equity vs random hand
         try:
             # Convert Card objects to string format
-            def card_to_str(card: Card) -> str:
-                rank_map = {14: 'A', 13: 'K', 12: 'Q', 11: 'J', 10: 'T'}
-                rank_str = rank_map.get(card.rank, str(card.rank))
-                suit_str = str(card.suit)
-                suit_map = {'♥': 'h', '♦': 'd', '♣': 'c', '♠': 's',
-                           'h': 'h', 'd': 'd', 'c': 'c', 's': 's'}
-                suit_ascii = suit_map.get(suit_str, 'h')
-                return f"{rank_str}{suit_ascii}"
-            
-            hero_str = ''.join([card_to_str(c) for c in hero_hand])
+            hero_str = ''.join([c.to_ascii() for c in hero_hand])
             result = self.equity_calc.calculate_preflop_equity(hero_str)
             equity = result.equity
         except:
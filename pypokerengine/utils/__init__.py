@@ -1,6 +1,12 @@
 """Utility modules for poker engine."""
 
 from .logging_config import setup_logging, setup_game_logger, GameLogger
+from .action_prompt import (
+    ACTION_COMMANDS, RAISE_RE, ACTION_PROMPT, INVALID_CHOICE, board_string
+)
 
-__all__ = ['setup_logging', 'setup_game_logger', 'GameLogger']
+__all__ = [
+    'setup_logging', 'setup_game_logger', 'GameLogger',
+    'ACTION_COMMANDS', 'RAISE_RE', 'ACTION_PROMPT', 'INVALID_CHOICE', 'board_string',
+]
 
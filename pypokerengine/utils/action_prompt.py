@@ -0,0 +1,26 @@
+"""
+Action Prompt Helpers
+
+This module provides the command tables and formatting shared by the
+interactive command-line scripts.
+"""
+
+import re
+from typing import List
+
+from ..engine.card import Card
+
+
+# Action prompt commands: fold/check are looked up whole, a raise is "r" or
+# "raise" with an optional amount ("r 60") captured by RAISE_RE
+ACTION_COMMANDS = {'f': 'fold', 'fold': 'fold', 'c': 'check', 'check': 'check'}
+RAISE_RE = re.compile(r'r\S*(?:\s+(\S+))?')
+ACTION_PROMPT = "\nYour action: "
+INVALID_CHOICE = "Invalid choice. Use: f (fold), c (check/call), r (raise)"
+
+
+def board_string(community_cards: List[Card]) -> str:
+    """Format the board for the turn summaries."""
+    if community_cards:
+        return " ".join(str(c) for c in community_cards)
+    return "(no community cards yet)"
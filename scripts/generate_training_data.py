@@ -143,13 +143,7 @@ def generate_random_specific_hand(exclude_cards: List[Card]) -> Optional[str]:
     card1, card2 = sampled[0], sampled[1]
     
     # Convert to string
-    suit_map = {0: 'c', 1: 'd', 2: 'h', 3: 's'}
-    rank_str1 = Card.RANK_SYMBOLS[card1.rank]
-    rank_str2 = Card.RANK_SYMBOLS[card2.rank]
-    suit_str1 = suit_map[card1.suit]
-    suit_str2 = suit_map[card2.suit]
-    
-    return f"{rank_str1}{suit_str1}{rank_str2}{suit_str2}"
+    return card1.to_ascii() + card2.to_ascii()
 
 
 def generate_random_board(street: Street, seed: Optional[int] = None) -> List[str]:
@@ -179,13 +173,7 @@ def generate_random_board(street: Street, seed: Optional[int] = None) -> List[st
         cards = []
     
     # Convert to strings
-    suit_map = {0: 'c', 1: 'd', 2: 'h', 3: 's'}
-    card_strs = [
-        f"{Card.RANK_SYMBOLS[c.rank]}{suit_map[c.suit]}"
-        for c in cards
-    ]
-    
-    return card_strs
+    return [c.to_ascii() for c in cards]
 
 
 def calculate_pot_odds(pot_size: int, bet_size: int) -> float:
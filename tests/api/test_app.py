@@ -0,0 +1,296 @@
+"""
+Tests for the backend session state.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+import backend.app as backend_app
+from backend.app import (
+    SESSIONS, StartGameRequest, PlayerActionRequest,
+    _run_start_game, _run_player_action, _run_bot_action, _state_dict,
+    _find_next_to_act, _legal_actions_for,
+)
+
+
+def passive_bot(**kwargs):
+    """Bot decision that checks when it can and otherwise calls."""
+    if kwargs["legal_actions"].get("check"):
+        return "check", 0
+    return "call", kwargs["current_bet"]
+
+
+@pytest.fixture
+def client():
+    return TestClient(backend_app.app)
+
+
+@pytest.fixture
+def game(client):
+    """Start a game over HTTP against a check/call bot; returns its start payload."""
+    payload = client.post("/start_game", json={}).json()
+    session_id = payload["session_id"]
+    SESSIONS[session_id].bot_strategy.decide_action = passive_bot
+    yield payload
+    SESSIONS.pop(session_id, None)
+
+
+class TestStateCache:
+    """Tests for the per-session cached state dict."""
+    
+    def _act(self, session):
+        """Play one action for whoever is next to act."""
+        round_obj = session.game.current_round
+        actor = _find_next_to_act(round_obj, session)
+        if actor.name == session.human_name:
+            action = "check" if round_obj.current_bet == actor.current_bet else "call"
+            req = PlayerActionRequest(session_id="test", action=action)
+            return _run_player_action(session, req)
+        return _run_bot_action(session)
+    
+    def test_cached_state_unchanged_by_later_actions(self):
+        """Test a served state keeps its log and version after more actions."""
+        session, payload = _run_start_game(StartGameRequest(), "test")
+        state = payload["state"]
+        version = state["version"]
+        log = list(state["action_log"])
+        
+        new_state = self._act(session)
+        
+        assert len(session.action_log) > len(log)
+        assert state["version"] == version
+        assert state["action_log"] == log
+        assert new_state["version"] == version + 1
+        assert new_state["action_log"] == session.action_log
+    
+    def test_state_dict_reused_until_dirty(self):
+        """Test the state dict is only rebuilt after the game changes."""
+        session, payload = _run_start_game(StartGameRequest(), "test")
+        assert _state_dict(session) is payload["state"]
+        
+        self._act(session)
+        assert _state_dict(session) is not payload["state"]
+
+
+
+class TestLegalActionsCache:
+    """Test memoized legal actions follow the betting."""
+    
+    def _legal(self, session, player):
+        """Cached legal actions, checked against a fresh computation."""
+        round_obj = session.game.current_round
+        legal = _legal_actions_for(round_obj, player, session)
+        assert legal == _legal_actions_for(round_obj, player)
+        return legal
+    
+    def test_legal_actions_after_raise_and_new_street(self):
+        """Test a raise and the next street both change the cached answers."""
+        session, _ = _run_start_game(StartGameRequest(), "test")
+        session.bot_strategy.decide_action = passive_bot
+        round_obj = session.game.current_round
+        human = next(p for p in round_obj.players if p.name == session.human_name)
+        bot = next(p for p in round_obj.players if p is not human)
+        assert _find_next_to_act(round_obj, session) is human
+        
+        legal = self._legal(session, human)
+        assert (legal["call"], legal["raise"]["min"], legal["raise"]["max"]) == (True, 40, 70)
+        legal = self._legal(session, bot)
+        assert legal["check"] and not legal["call"]
+        
+        _run_player_action(session, PlayerActionRequest(session_id="test", action="raise", amount=60))
+        
+        # Same street: the bot now faces the raise and can 3-bet to 180
+        legal = self._legal(session, bot)
+        assert not legal["check"] and legal["call"]
+        assert (legal["raise"]["min"], legal["raise"]["max"]) == (80, 180)
+        legal = self._legal(session, human)
+        assert legal["check"] and not legal["fold"]
+        
+        _run_bot_action(session)
+        assert round_obj.street.value == "flop"
+        
+        # New street: no bet to face, pot-sized bets up to 120
+        legal = self._legal(session, bot)
+        assert legal["check"] and not legal["call"]
+        assert (legal["raise"]["min"], legal["raise"]["max"]) == (20, 120)
+
+
+class TestStateETag:
+    """Test conditional /state requests."""
+    
+    def test_repeat_request_is_not_modified(self, client, game):
+        """Test sending the ETag back gets an empty 304."""
+        session_id = game["session_id"]
+        first = client.get("/state", params={"session_id": session_id})
+        etag = first.headers["ETag"]
+        assert first.status_code == 200
+        assert etag == f'"{game["state"]["version"]}"'
+        
+        repeat = client.get("/state", params={"session_id": session_id},
+                            headers={"If-None-Match": etag})
+        assert repeat.status_code == 304
+        assert repeat.content == b""
+        assert repeat.headers["ETag"] == etag
+    
+    def test_etag_changes_after_an_action(self, client, game):
+        """Test an action invalidates the old ETag."""
+        session_id = game["session_id"]
+        etag = client.get("/state", params={"session_id": session_id}).headers["ETag"]
+        
+        client.post("/player_action", json={
+            "session_id": session_id, "action": "call", "amount": 20,
+        })
+        after = client.get("/state", params={"session_id": session_id},
+                           headers={"If-None-Match": etag})
+        assert after.status_code == 200
+        assert after.headers["ETag"] != etag
+        assert after.json()["version"] == game["state"]["version"] + 1
+
+
+class TestStatePolling:
+    """Test the /state version and since parameters."""
+    
+    def test_current_version_gets_short_reply(self, client, game):
+        """Test polling with the current version gets just 'unchanged'."""
+        session_id = game["session_id"]
+        version = game["state"]["version"]
+        reply = client.get("/state", params={"session_id": session_id, "version": version})
+        assert reply.json() == {"version": version, "unchanged": True}
+    
+    def test_older_version_gets_full_state(self, client, game):
+        """Test polling with a stale version gets the whole new state."""
+        session_id = game["session_id"]
+        version = game["state"]["version"]
+        client.post("/player_action", json={
+            "session_id": session_id, "action": "call", "amount": 20,
+        })
+        
+        reply = client.get("/state", params={"session_id": session_id, "version": version}).json()
+        full = client.get("/state", params={"session_id": session_id}).json()
+        assert reply == full
+        assert reply["version"] == version + 1
+        assert "unchanged" not in reply
+    
+    def test_since_returns_only_new_log_lines(self, client, game):
+        """Test since slices the action log from the given offset."""
+        session_id = game["session_id"]
+        seen = len(game["state"]["action_log"])
+        client.post("/player_action", json={
+            "session_id": session_id, "action": "call", "amount": 20,
+        })
+        
+        full_log = client.get("/state", params={"session_id": session_id}).json()["action_log"]
+        reply = client.get("/state", params={"session_id": session_id, "since": seen}).json()
+        assert reply["action_log_start"] == seen
+        assert reply["action_log"] == full_log[seen:]
+        assert len(reply["action_log"]) > 0
+        
+        # An offset past the log (e.g. from the previous hand) gets all of it
+        reply = client.get("/state", params={"session_id": session_id, "since": 999}).json()
+        assert (reply["action_log_start"], reply["action_log"]) == (0, full_log)
+
+
+class TestWebSocket:
+    """Tests for the /ws play socket."""
+    
+    @pytest.fixture
+    def session_id(self, monkeypatch):
+        monkeypatch.setattr(backend_app, "BOT_THINK_SECONDS", 0)
+        session, _ = _run_start_game(StartGameRequest(), "ws-test")
+        SESSIONS["ws-test"] = session
+        yield "ws-test"
+        SESSIONS.pop("ws-test", None)
+    
+    def test_bad_frames_get_error_replies(self, session_id):
+        """Test non-JSON and non-object frames are answered, not fatal."""
+        client = TestClient(backend_app.app)
+        with client.websocket_connect(f"/ws/{session_id}") as ws:
+            assert "version" in ws.receive_json()
+            
+            ws.send_text("not json")
+            assert ws.receive_json() == {"error": "Invalid message"}
+            
+            ws.send_json([1, 2])
+            assert ws.receive_json() == {"error": "Invalid message"}
+            
+            ws.send_json({"type": "player_action", "action": "raise", "amount": "abc"})
+            assert ws.receive_json() == {"error": "Invalid message"}
+            
+            ws.send_json({"type": "player_action", "action": None})
+            assert ws.receive_json() == {"error": "Invalid message"}
+            
+            # The socket still plays after the bad frames
+            ws.send_json({"type": "player_action", "action": "call", "amount": 20})
+            assert "action_log" in ws.receive_json()
+    
+    def test_updates_carry_only_changed_keys(self, session_id):
+        """Test frames after the first are deltas against the previous state."""
+        client = TestClient(backend_app.app)
+        with client.websocket_connect(f"/ws/{session_id}") as ws:
+            first = ws.receive_json()
+            ws.send_json({"type": "player_action", "action": "call", "amount": 20})
+            delta = ws.receive_json()
+        
+        log_keys = {"action_log", "action_log_start"}
+        changed = set(delta) - log_keys
+        assert {"version", "pot", "awaiting_player"} <= changed
+        assert "hand_number" not in delta and "dealer_name" not in delta
+        for key in changed:
+            assert delta[key] != first.get(key), key
+        # Only the new log lines, placed after the ones already sent
+        assert delta["action_log_start"] == len(first["action_log"])
+        assert delta["action_log"] == ["You calls 20"]
+    
+    def test_expired_session_closes_socket(self, session_id):
+        """Test a session expiring mid-socket closes it with 4404."""
+        client = TestClient(backend_app.app)
+        with client.websocket_connect(f"/ws/{session_id}") as ws:
+            ws.receive_json()
+            del SESSIONS[session_id]
+            
+            ws.send_json({"type": "next_hand"})
+            with pytest.raises(WebSocketDisconnect) as exc_info:
+                ws.receive_json()
+            assert exc_info.value.code == 4404
+
+
+
+class TestTurnOrder:
+    """Test the reported next actor as a hand moves through the streets."""
+    
+    def _step(self, client, session_id, state):
+        """Check or call for whoever is to act, over the HTTP API."""
+        if state["awaiting_player"] != "You":
+            return client.get("/bot_action", params={"session_id": session_id}).json()
+        legal = state["legal_actions"]
+        action = "check" if legal.get("check") else "call"
+        return client.post("/player_action", json={
+            "session_id": session_id, "action": action, "amount": state["current_bet"],
+        }).json()
+    
+    def test_next_actor_resets_each_street(self, client, game):
+        """Test the dealer acts first preflop and second on the flop and turn."""
+        session_id = game["session_id"]
+        state = game["state"]
+        dealer = state["dealer_name"]
+        other = "Computer" if dealer == "You" else "You"
+        
+        assert state["street"] == "preflop"
+        assert state["awaiting_player"] == dealer
+        state = self._step(client, session_id, state)
+        # The big blind keeps its option after the limp
+        assert (state["street"], state["awaiting_player"]) == ("preflop", other)
+        state = self._step(client, session_id, state)
+        
+        for street in ("flop", "turn"):
+            assert (state["street"], state["awaiting_player"]) == (street, other)
+            state = self._step(client, session_id, state)
+            assert (state["street"], state["awaiting_player"]) == (street, dealer)
+            state = self._step(client, session_id, state)
+        
+        assert (state["street"], state["awaiting_player"]) == ("river", other)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
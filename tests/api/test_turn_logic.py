@@ -0,0 +1,85 @@
+"""
+Tests for the heads-up turn-order table.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from backend.turn_logic import (
+    SEAT_CAN_ACT, SEAT_ACTED, SEAT_UNMATCHED, next_to_act
+)
+from pypokerengine.engine.player import Player
+from pypokerengine.engine.round import Street
+
+
+def reference_next_to_act(round_obj, acted_names):
+    """The acting-order loop next_to_act's table replaced."""
+    players = round_obj.players
+    current_bet = round_obj.current_bet
+    p0, p1 = players
+    if not (p0.is_active and p1.is_active):
+        return None
+    if not (p0.can_act() or p1.can_act()):
+        return None
+    
+    if round_obj.street == Street.PREFLOP:
+        acting_order = [round_obj.dealer_position, 1 - round_obj.dealer_position]
+    else:
+        acting_order = [1 - round_obj.dealer_position, round_obj.dealer_position]
+    
+    for pos in acting_order:
+        p = players[pos]
+        if not p.is_active:
+            continue
+        if not p.can_act():
+            continue
+        if current_bet == 0:
+            if p.name not in acted_names:
+                return p
+        else:
+            if p.current_bet < current_bet:
+                return p
+            if p.name not in acted_names:
+                return p
+    return None
+
+
+def spot(first, flags):
+    """A preflop round whose seats carry the given SEAT_* flags."""
+    seat_flags = [flags & 7, flags >> 3]
+    current_bet = 20 if any(f & SEAT_UNMATCHED for f in seat_flags) else 0
+    players = []
+    for seat, f in enumerate(seat_flags):
+        player = Player(f"P{seat}", 1000)
+        player.is_all_in = not f & SEAT_CAN_ACT
+        player.current_bet = 10 if f & SEAT_UNMATCHED else current_bet
+        players.append(player)
+    round_obj = SimpleNamespace(
+        players=players,
+        current_bet=current_bet,
+        street=Street.PREFLOP,
+        dealer_position=first,
+        acting_order=[first, 1 - first],
+    )
+    acted_mask = sum(1 << seat for seat, f in enumerate(seat_flags) if f & SEAT_ACTED)
+    acted_names = {p.name for seat, p in enumerate(players) if acted_mask >> seat & 1}
+    return round_obj, acted_mask, acted_names
+
+
+@pytest.mark.parametrize("first", [0, 1])
+@pytest.mark.parametrize("flags", range(64))
+def test_table_matches_acting_order_loop(first, flags):
+    """Test every table entry picks the same seat as the old loop."""
+    round_obj, acted_mask, acted_names = spot(first, flags)
+    assert next_to_act(round_obj, acted_mask) is reference_next_to_act(round_obj, acted_names)
+
+
+def test_folded_seat_ends_the_hand():
+    """Test nobody acts once a player has folded."""
+    round_obj, acted_mask, _ = spot(0, SEAT_CAN_ACT | (SEAT_CAN_ACT << 3))
+    round_obj.players[1].is_active = False
+    assert next_to_act(round_obj, acted_mask) is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
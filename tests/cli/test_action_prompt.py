@@ -0,0 +1,38 @@
+"""
+Tests for the shared action prompt tables.
+"""
+
+import pytest
+from pypokerengine.engine.card import Card
+from pypokerengine.utils import ACTION_COMMANDS, RAISE_RE, board_string
+
+
+class TestActionPrompt:
+    """Tests for prompt parsing and board formatting."""
+    
+    def test_fold_and_check_commands(self):
+        """Test short and long spellings map to the same command."""
+        assert ACTION_COMMANDS['f'] == ACTION_COMMANDS['fold'] == 'fold'
+        assert ACTION_COMMANDS['c'] == ACTION_COMMANDS['check'] == 'check'
+        assert 'r' not in ACTION_COMMANDS
+    
+    @pytest.mark.parametrize("choice,amount", [
+        ("r", None),
+        ("raise", None),
+        ("r 60", "60"),
+        ("raise 120", "120"),
+        ("r abc", "abc"),
+    ])
+    def test_raise_amount_capture(self, choice, amount):
+        """Test the raise regex captures the optional amount."""
+        assert RAISE_RE.match(choice).group(1) == amount
+    
+    def test_board_string(self):
+        """Test board formatting with and without cards."""
+        assert board_string([]) == "(no community cards yet)"
+        board = [Card.from_string("Ah"), Card.from_string("Td")]
+        assert board_string(board) == f"{board[0]} {board[1]}"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
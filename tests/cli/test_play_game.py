@@ -0,0 +1,83 @@
+"""
+Tests for play_game's equity-driven AI.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from pypokerengine.engine.card import Card
+from pypokerengine.simulation import EquityCalculator
+from play_game import simple_ai_strategy
+
+
+def ai_player(hand, board="", pot=30, current_bet=20, player_bet=0):
+    """An AI seat with just what simple_ai_strategy reads."""
+    hole_cards = [Card.from_string(hand[:2]), Card.from_string(hand[2:])]
+    community_cards = [Card.from_string(board[i:i + 2]) for i in range(0, len(board), 2)]
+    current_round = SimpleNamespace(
+        community_cards=community_cards, pot=pot, current_bet=current_bet
+    )
+    return SimpleNamespace(
+        name="Computer",
+        stack=1000,
+        current_bet=player_bet,
+        hole_cards=hole_cards,
+        get_hole_cards_string=lambda: hand,
+        game=SimpleNamespace(current_round=current_round),
+    )
+
+
+FACING_BET = {'fold': True, 'check': False, 'call': True,
+              'raise': {'allowed': True, 'min': 40, 'max': 70}}
+UNOPENED = {'fold': False, 'check': True, 'call': False,
+            'raise': {'allowed': True, 'min': 20, 'max': 60}}
+
+
+class TestSimpleAIStrategy:
+    """Test the raise/check/call/fold thresholds."""
+    
+    @pytest.fixture
+    def calc(self):
+        return EquityCalculator(default_simulations=1000, seed=42)
+    
+    def test_strong_hand_min_raises(self, calc):
+        """Test 70%+ equity raises the minimum."""
+        action = simple_ai_strategy(ai_player("AhAd"), FACING_BET, "preflop", calc)
+        assert action == ('raise', 40)
+    
+    def test_strong_hand_checks_when_raising_not_allowed(self, calc):
+        """Test a strong hand checks if it can't raise."""
+        legal = {**UNOPENED, 'raise': {'allowed': False}}
+        action = simple_ai_strategy(ai_player("AhAd", current_bet=0), legal, "preflop", calc)
+        assert action == ('check', 0)
+    
+    def test_weak_hand_checks(self, calc):
+        """Test a weak hand checks when it can."""
+        action = simple_ai_strategy(ai_player("7h2c", current_bet=0), UNOPENED, "preflop", calc)
+        assert action == ('check', 0)
+    
+    def test_weak_hand_calls_with_pot_odds(self, calc):
+        """Test a weak hand calls a small bet into a big pot."""
+        player = ai_player("7h2c", pot=1000, current_bet=20)
+        assert simple_ai_strategy(player, FACING_BET, "preflop", calc) == ('call', 20)
+    
+    def test_weak_hand_folds_without_pot_odds(self, calc):
+        """Test a weak hand folds to a bet bigger than its equity justifies."""
+        player = ai_player("7h2c", pot=530, current_bet=500)
+        assert simple_ai_strategy(player, FACING_BET, "preflop", calc) == ('fold', 0)
+    
+    def test_board_counts_toward_equity(self, calc):
+        """Test equity is read with the board, not preflop."""
+        # 72o is weak preflop but a full house here
+        player = ai_player("7h2c", board="7d7s2d", current_bet=0)
+        assert simple_ai_strategy(player, UNOPENED, "flop", calc) == ('raise', 20)
+    
+    def test_raise_equity_is_configurable(self, calc):
+        """Test a lower raise threshold makes weaker hands raise."""
+        player = ai_player("7h2c", current_bet=0)
+        action = simple_ai_strategy(player, UNOPENED, "preflop", calc, raise_equity=0.3)
+        assert action == ('raise', 20)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
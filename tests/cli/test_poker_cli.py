@@ -0,0 +1,53 @@
+"""
+Tests for PokerCLI batch runs.
+"""
+
+import io
+
+import pytest
+from pypokerengine.engine.game import Game
+from pypokerengine.cli.poker_cli import PokerCLI
+
+
+@pytest.fixture
+def closed_stdin(monkeypatch):
+    """Make any input() call fail."""
+    stdin = io.StringIO()
+    stdin.close()
+    monkeypatch.setattr("sys.stdin", stdin)
+
+
+class TestBatchRun:
+    """Test verbose=False plays without printing or reading input."""
+    
+    def test_default_policy_is_silent(self, closed_stdin, capsys):
+        """Test a batch game runs to the end with no I/O."""
+        game = Game("Hero", "Villain", starting_stack=100, seed=1)
+        PokerCLI(game, verbose=False).play_game()
+        
+        assert game.is_game_over()
+        assert capsys.readouterr() == ("", "")
+    
+    def test_action_callback_drives_every_seat(self, closed_stdin, capsys):
+        """Test a supplied callback acts for both seats."""
+        seen = set()
+        
+        def shove_or_call(player, legal_actions, street):
+            seen.add(player.name)
+            raise_info = legal_actions.get("raise")
+            if raise_info:
+                return "raise", raise_info["max"]
+            if legal_actions.get("call"):
+                return "call", game.current_round.current_bet
+            return "check", 0
+        
+        game = Game("Hero", "Villain", starting_stack=200, seed=2)
+        PokerCLI(game, verbose=False, action_callback=shove_or_call).play_game()
+        
+        assert game.is_game_over()
+        assert seen == {"Hero", "Villain"}
+        assert capsys.readouterr() == ("", "")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,76 @@
+"""
+Tests for ActionManager pot-limit raise limits.
+"""
+
+import pytest
+from pypokerengine.engine.action_manager import ActionManager
+from pypokerengine.engine.player import Player
+
+
+def heads_up(small_blind, big_blind, stack=1000):
+    """Two players with the blinds posted; returns (sb, bb, pot)."""
+    sb = Player("SB", stack, "SB")
+    bb = Player("BB", stack, "BB")
+    sb.post_blind(small_blind, "small")
+    bb.post_blind(big_blind, "big")
+    return sb, bb, small_blind + big_blind
+
+
+def raise_limits(player, players, current_bet, pot, big_blind):
+    raise_info = ActionManager.get_legal_actions(
+        player, players, current_bet, pot, big_blind
+    )["raise"]
+    return raise_info["min"], raise_info["max"]
+
+
+class TestRaiseLimits:
+    """Test min/max raise sizes under pot-limit rules."""
+    
+    def test_docs_preflop_example(self):
+        """Test POKER_ENGINE_DOCS.md example 1: pot 30 facing 20 raises to 70."""
+        sb, bb, pot = heads_up(10, 20)
+        assert raise_limits(sb, [sb, bb], 20, pot, 20) == (40, 70)
+        
+        # The same spot with nothing posted yet
+        fresh = Player("Fresh", 1000)
+        assert raise_limits(fresh, [fresh, bb], 20, pot, 20) == (40, 70)
+    
+    def test_docs_postflop_example(self):
+        """Test POKER_ENGINE_DOCS.md example 2: pot 100 facing 50 raises to 200."""
+        hero = Player("Hero", 1000)
+        villain = Player("Villain", 1000)
+        assert raise_limits(hero, [hero, villain], 50, 100, 20) == (70, 200)
+    
+    @pytest.mark.parametrize("small_blind,big_blind,expected", [
+        (5, 10, (20, 35)),
+        (25, 50, (100, 175)),
+        (50, 100, (200, 350)),
+    ])
+    def test_small_blind_open_at_other_stakes(self, small_blind, big_blind, expected):
+        """Test the small blind's opening cap scales with the blinds."""
+        sb, bb, pot = heads_up(small_blind, big_blind)
+        assert raise_limits(sb, [sb, bb], big_blind, pot, big_blind) == expected
+    
+    def test_big_blind_option_after_limp(self):
+        """Test the big blind raising a limped pot."""
+        sb, bb, _ = heads_up(10, 20)
+        sb.call(20)
+        # Pot 40, nothing to call: raise the pot to 20 + 40
+        assert raise_limits(bb, [sb, bb], 20, 40, 20) == (40, 80)
+    
+    def test_three_bet_facing_a_raise(self):
+        """Test the big blind re-raising the small blind's raise to 60."""
+        sb, bb, _ = heads_up(10, 20)
+        sb.bet(60)
+        # Call 40 to make the pot 120, then raise 120: total 180
+        assert raise_limits(bb, [sb, bb], 60, 80, 20) == (80, 180)
+    
+    def test_cap_at_opponent_stack(self):
+        """Test the max raise never exceeds what the opponent can cover."""
+        sb, bb, pot = heads_up(10, 20)
+        bb.stack = 30
+        assert raise_limits(sb, [sb, bb], 20, pot, 20) == (40, 50)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,175 @@
+"""
+Tests for HandEvaluator.
+
+Checks each hand category directly, and checks mask evaluation against a
+straightforward best-of-every-5-card-combination reference.
+"""
+
+import random
+from collections import Counter
+from itertools import combinations
+
+import pytest
+from pypokerengine.engine.card import Card, _FULL_DECK
+from pypokerengine.engine.hand_evaluator import HandEvaluator, HandRank
+
+
+def cards(hand_str):
+    """Parse a space-separated hand like 'As Kd 7c'."""
+    return [Card.from_string(s) for s in hand_str.split()]
+
+
+def reference_5(five):
+    """Evaluate exactly 5 cards the direct way: sort, count, classify."""
+    ranks = sorted((c.rank for c in five), reverse=True)
+    is_flush = len({c.suit for c in five}) == 1
+    straight_high = 0
+    if len(set(ranks)) == 5 and ranks[0] - ranks[4] == 4:
+        straight_high = ranks[0]
+    elif ranks == [14, 5, 4, 3, 2]:
+        straight_high = 5
+    groups = sorted(Counter(ranks).items(), key=lambda rc: (rc[1], rc[0]), reverse=True)
+    counts = [count for _, count in groups]
+    grouped = [rank for rank, _ in groups]
+    
+    if straight_high and is_flush:
+        if straight_high == 14:
+            return HandRank.ROYAL_FLUSH, [14]
+        return HandRank.STRAIGHT_FLUSH, [straight_high]
+    if counts[0] == 4:
+        return HandRank.FOUR_OF_A_KIND, grouped
+    if counts[:2] == [3, 2]:
+        return HandRank.FULL_HOUSE, grouped
+    if is_flush:
+        return HandRank.FLUSH, ranks
+    if straight_high:
+        return HandRank.STRAIGHT, [straight_high]
+    if counts[0] == 3:
+        return HandRank.THREE_OF_A_KIND, grouped
+    if counts[:2] == [2, 2]:
+        return HandRank.TWO_PAIR, grouped
+    if counts[0] == 2:
+        return HandRank.ONE_PAIR, grouped
+    return HandRank.HIGH_CARD, ranks
+
+
+def reference(hand):
+    """Best (hand_rank, tiebreakers) over every 5-card subset."""
+    return max(reference_5(five) for five in combinations(hand, 5))
+
+
+class TestHandCategories:
+    """Test each hand category, its tiebreakers and its name."""
+    
+    @pytest.mark.parametrize("hand_str,hand_rank,tiebreakers,name", [
+        ("Ah Kh Qh Jh Th", HandRank.ROYAL_FLUSH, [14], "Royal Flush"),
+        ("9s 8s 7s 6s 5s", HandRank.STRAIGHT_FLUSH, [9], "Straight Flush, Nine high"),
+        ("Qd Qc Qh Qs 3d", HandRank.FOUR_OF_A_KIND, [12, 3], "Four of a Kind, Queens"),
+        ("Jd Jc Jh 4s 4d", HandRank.FULL_HOUSE, [11, 4], "Full House, Jacks over Fours"),
+        ("Kc Tc 8c 5c 2c", HandRank.FLUSH, [13, 10, 8, 5, 2], "Flush, King high"),
+        ("Td 9c 8h 7s 6d", HandRank.STRAIGHT, [10], "Straight, Ten high"),
+        ("7d 7c 7h Ks 2d", HandRank.THREE_OF_A_KIND, [7, 13, 2], "Three of a Kind, Sevens"),
+        ("Ad Ac 8h 8s 2d", HandRank.TWO_PAIR, [14, 8, 2], "Two Pair, Aces and Eights"),
+        ("5d 5c Ah Js 9d", HandRank.ONE_PAIR, [5, 14, 11, 9], "Pair of Fives"),
+        ("Ad Jc 9h 6s 3d", HandRank.HIGH_CARD, [14, 11, 9, 6, 3], "Ace high"),
+    ])
+    def test_category(self, hand_str, hand_rank, tiebreakers, name):
+        """Test a five-card hand of each category."""
+        assert HandEvaluator.evaluate_hand(cards(hand_str)) == (hand_rank, tiebreakers, name)
+    
+    def test_wheel(self):
+        """Test A-2-3-4-5 is a five-high straight."""
+        rank, tiebreakers, name = HandEvaluator.evaluate_hand(cards("Ad 2c 3h 4s 5d"))
+        assert (rank, tiebreakers, name) == (HandRank.STRAIGHT, [5], "Straight, Five high")
+    
+    def test_steel_wheel(self):
+        """Test a suited wheel is a five-high straight flush."""
+        rank, tiebreakers, _ = HandEvaluator.evaluate_hand(cards("Ah 2h 3h 4h 5h"))
+        assert (rank, tiebreakers) == (HandRank.STRAIGHT_FLUSH, [5])
+    
+    def test_wheel_loses_to_six_high_straight(self):
+        """Test the ace plays low in a wheel."""
+        wheel = cards("Ad 2c 3h 4s 5d 9c Kd")
+        six_high = cards("Ad 2c 3h 4s 5d 6c Kd")
+        assert HandEvaluator.compare_hands(six_high, wheel) == 1
+    
+    def test_seven_cards_pick_best_five(self):
+        """Test 7-card hands use the best five, not all seven."""
+        # Flush beats the straight that's also there
+        rank, tiebreakers, _ = HandEvaluator.evaluate_hand(cards("9h 8h 7c 6h 5d 2h Kh"))
+        assert (rank, tiebreakers) == (HandRank.FLUSH, [13, 9, 8, 6, 2])
+        # Two trips make a full house with the higher trips on top
+        rank, tiebreakers, _ = HandEvaluator.evaluate_hand(cards("9h 9c 9d 4h 4c 4s Ad"))
+        assert (rank, tiebreakers) == (HandRank.FULL_HOUSE, [9, 4])
+        # Three pairs keep the best kicker among the rest
+        rank, tiebreakers, _ = HandEvaluator.evaluate_hand(cards("Kh Kc 8d 8h 3c 3s 7d"))
+        assert (rank, tiebreakers) == (HandRank.TWO_PAIR, [13, 8, 7])
+    
+    def test_too_few_cards(self):
+        """Test fewer than five cards is an error."""
+        with pytest.raises(ValueError):
+            HandEvaluator.evaluate_hand(cards("Ah Kh Qh Jh"))
+
+
+class TestKickers:
+    """Test ties and kicker comparisons."""
+    
+    def test_kicker_decides_pair(self):
+        """Test the same pair is decided by the kicker."""
+        board = cards("Ah Ad 9c 6s 2d")
+        assert HandEvaluator.compare_hands(board + cards("Kc 3h"), board + cards("Qc 3s")) == 1
+    
+    def test_board_plays_ties(self):
+        """Test hole cards below the board's five tie."""
+        board = cards("Ah Kd Qc Js 9h")
+        assert HandEvaluator.compare_hands(board + cards("2c 3d"), board + cards("4c 5d")) == 0
+        assert HandEvaluator.find_winner({
+            "a": board + cards("2c 3d"),
+            "b": board + cards("4c 5d"),
+        }) == ["a", "b"]
+    
+    def test_flush_compares_all_five_cards(self):
+        """Test flushes fall through to the fifth card."""
+        board = cards("Ah Th 8h 4h 9c")
+        assert HandEvaluator.compare_hands(board + cards("3h 2c"), board + cards("2h 3c")) == 1
+
+
+class TestAgainstReference:
+    """Test mask evaluation against the reference on random hands."""
+    
+    @pytest.mark.parametrize("n_cards", [5, 6, 7])
+    def test_random_hands_match_reference(self, n_cards):
+        """Test evaluate_hand matches the best-of-combinations reference."""
+        rng = random.Random(n_cards)
+        for _ in range(2000):
+            hand = rng.sample(_FULL_DECK, n_cards)
+            rank, tiebreakers, _ = HandEvaluator.evaluate_hand(hand)
+            assert (rank, tiebreakers) == reference(hand), hand
+    
+    @pytest.mark.parametrize("n_cards", [5, 6, 7])
+    def test_score_mask_orders_like_evaluate_hand(self, n_cards):
+        """Test score_mask ranks and ties hands exactly like evaluate_hand."""
+        rng = random.Random(100 + n_cards)
+        hands = [rng.sample(_FULL_DECK, n_cards) for _ in range(500)]
+        # Re-suit one card of some hands so exact ties come up too
+        for hand in hands[:100]:
+            moved = Card(hand[-1].rank, (hand[-1].suit + 1) % 4)
+            if moved not in hand:
+                hands.append(hand[:-1] + [moved])
+        
+        evaluations = [HandEvaluator.evaluate_hand(hand)[:2] for hand in hands]
+        scores = [HandEvaluator.score_mask(HandEvaluator.hand_mask(hand)) for hand in hands]
+        # Stable sorts agree only if both keys order and tie the same hands
+        order = sorted(range(len(hands)), key=evaluations.__getitem__)
+        assert sorted(range(len(hands)), key=scores.__getitem__) == order
+        assert len(set(scores)) == len(set(map(repr, evaluations)))
+    
+    def test_evaluate_batch_matches_evaluate_mask(self):
+        """Test batch evaluation returns one evaluate_mask result per mask."""
+        rng = random.Random(7)
+        masks = [HandEvaluator.hand_mask(rng.sample(_FULL_DECK, 7)) for _ in range(50)]
+        assert HandEvaluator.evaluate_batch(masks) == [HandEvaluator.evaluate_mask(m) for m in masks]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
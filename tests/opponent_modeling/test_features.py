@@ -5,7 +5,7 @@ Tests for feature extraction.
 import pytest
 import numpy as np
 from pypokerengine.opponent_modeling.features import (
-    FeatureExtractor, extract_features, get_feature_names
+    FeatureExtractor, extract_features, extract_features_batch, get_feature_names
 )
 from pypokerengine.opponent_modeling.player_profile import PlayerProfile
 from pypokerengine.opponent_modeling.hand_history import Street
@@ -112,6 +112,27 @@ class TestFeatureExtractor:
         assert isinstance(features, np.ndarray)
         assert len(features) > 0
     
+    def test_extract_features_batch_matches_single(self):
+        """Test batched extraction matches row-by-row extract_features."""
+        tight = PlayerProfile(player_id="tight", hands_played=100)
+        tight.vpip_count = 15
+        tight.pfr_count = 12
+        loose = PlayerProfile(player_id="loose", hands_played=50)
+        loose.vpip_count = 30
+        
+        situations = [
+            (tight, "bet", Street.FLOP, ["As", "Kh", "Qd"], "BTN", 75, 100, 1000, 0),
+            (loose, "call", Street.PREFLOP, None, "BB", 20, 30, 980, 10),
+            (tight, "raise", Street.RIVER, ["9s", "Ts", "Js", "2h", "2d"], "SB", 300, 200, 500, 100),
+            (loose, "fold", Street.TURN, ["2c", "7h", "Kd", "Ks"], None, 0, 0, 0, 50),
+        ]
+        
+        batch = extract_features_batch(*zip(*situations))
+        
+        assert batch.shape == (len(situations), len(get_feature_names()))
+        for row, situation in zip(batch, situations):
+            np.testing.assert_array_equal(row, extract_features(*situation))
+    
     def test_get_feature_names(self):
         """Test getting feature names."""
         feature_names = get_feature_names()
@@ -90,6 +90,24 @@ class TestHandHistory:
         
         player1_hands = history.get_player_hands("player1")
         assert len(player1_hands) == 2
+        assert history.count_hands("player2") == 1
+
+    def test_get_action_frequency(self):
+        """Test action frequency per player and street."""
+        history = HandHistory()
+
+        for i, action in enumerate(["raise", "call", "raise", "fold"]):
+            history.start_new_hand(f"hand_{i}", "player1", 50, 100)
+            history.record_action("player1", Street.PREFLOP, action, 200)
+            history.record_action("player2", Street.PREFLOP, "call", 200)
+            history.finish_hand([], 400, "player1")
+
+        assert history.get_action_frequency("player1", Street.PREFLOP, "raise") == 0.5
+        assert history.get_action_frequency("player2", Street.PREFLOP, "call") == 1.0
+        assert history.get_action_frequency("player1", Street.FLOP, "bet") == 0.0
+
+        history.clear()
+        assert history.get_action_frequency("player1", Street.PREFLOP, "raise") == 0.0
     
     def test_count_hands(self):
         """Test counting hands."""
@@ -99,6 +99,33 @@ class TestPlayerProfile:
         
         assert profile.get_archetype() == PlayerArchetype.UNKNOWN
     
+    def test_cached_stats_refresh_on_update(self):
+        """Test cached stats are recomputed after the counters change."""
+        profile = PlayerProfile(player_id="test", hands_played=19)
+        assert profile.get_archetype() == PlayerArchetype.UNKNOWN
+        assert profile.vpip == 0.0
+        
+        profile.update_preflop_action("raise", is_raise=True, is_voluntary=True)
+        assert profile.vpip == 0.05
+        assert profile.get_archetype() == PlayerArchetype.TIGHT_AGGRESSIVE
+        
+        profile.vpip_count = 10
+        assert profile.vpip == 0.5
+        assert profile.get_archetype() == PlayerArchetype.LOOSE_PASSIVE
+        
+        # Fields the stats don't read leave the cache alone
+        profile.notes = "calls too much"
+        assert 'vpip' in profile.__dict__
+    
+    def test_derived_stats_are_read_only(self):
+        """Test assigning a derived stat is rejected."""
+        profile = PlayerProfile(player_id="test", hands_played=100)
+        profile.vpip_count = 25
+        
+        with pytest.raises(AttributeError):
+            profile.vpip = 0.3
+        assert profile.vpip == 0.25
+    
     def test_update_preflop_action(self):
         """Test updating preflop action."""
         profile = PlayerProfile(player_id="test")
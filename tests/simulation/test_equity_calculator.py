@@ -155,6 +155,16 @@ class TestEquityCalculator:
         
         assert result.equity > 0.75
     
+    def test_flop_matchup_enumerated_exactly(self):
+        """Test that hand vs hand on a flop enumerates every runout."""
+        calc = EquityCalculator(default_simulations=5000)
+        
+        result = calc.calculate_equity("AhKc", villain_hand="QsQd", board="Ac7d2s")
+        
+        assert result.simulations == 990  # C(45, 2) turn/river runouts
+        assert result.std_error == 0.0
+        assert result == calc.calculate_equity("AhKc", villain_hand="QsQd", board="Ac7d2s")
+    
     def test_std_error_calculation(self):
         """Test that standard error is calculated."""
         calc = EquityCalculator(default_simulations=5000)
@@ -164,6 +174,43 @@ class TestEquityCalculator:
         # Standard error should be small with 5000 sims
         assert 0 < result.std_error < 0.02
 
+    def test_calculate_equity_batch(self):
+        """Test batched hand vs hand calculation."""
+        calc = EquityCalculator(default_simulations=5000)
+
+        results = calc.calculate_equity_batch([
+            ("AhAd", "KsKd"),
+            ("AhKh", "QsQd", "Ac7d2s"),
+            ("AhAd", "KsKd"),
+        ])
+
+        assert len(results) == 3
+        assert 0.75 < results[0].equity < 0.90
+        assert results[1].equity > 0.65
+        assert results[2] == results[0]  # Duplicate simulated once
+        assert results[0].simulations == 5000
+        assert results[1].simulations == 990  # Flop runouts enumerated
+        assert calc.calculate_equity("AhAd", villain_hand="KsKd") == results[0]
+
+    def test_hand_vs_random_uses_board(self):
+        """Test equity against a random hand accounts for the board."""
+        calc = EquityCalculator(default_simulations=5000)
+        
+        result = calc.calculate_equity("7c2d", board="7h7s2c")
+        
+        # A full house on the flop is far ahead of any random hand
+        assert result.equity > 0.95
+    
+    def test_calculate_preflop_equity_batch(self):
+        """Test batched preflop equity against a random hand."""
+        calc = EquityCalculator(default_simulations=5000)
+
+        aa, seven_two = calc.calculate_preflop_equity_batch(["AhAd", "7h2c"])
+
+        assert 0.80 < aa.equity < 0.90
+        assert 0.28 < seven_two.equity < 0.40
+        assert aa.simulations == seven_two.simulations == 5000
+
 
 class TestEquityCalculatorCaching:
     """Test caching functionality."""
@@ -209,6 +256,30 @@ class TestEquityCalculatorCaching:
         cache_info = calc.cache_info()
         assert cache_info['hand_vs_hand']['currsize'] == 0
     
+    def test_pickle_roundtrip(self):
+        """Test that a calculator survives pickling with fresh caches."""
+        import pickle
+        
+        calc = EquityCalculator(default_simulations=1000, cache_size=50, seed=7)
+        calc.calculate_equity("AhAd", villain_hand="KsKd")
+        
+        restored = pickle.loads(pickle.dumps(calc))
+        
+        assert restored.cache_size == 50
+        assert restored.cache_info()['hand_vs_hand']['currsize'] == 0
+        result = restored.calculate_equity("AhAd", villain_hand="KsKd")
+        assert 0.7 < result.equity < 0.9
+    
+    def test_range_cache_keyed_by_card_set(self):
+        """Test hand vs range results are cached regardless of card order."""
+        calc = EquityCalculator(default_simulations=1000)
+        
+        result1 = calc.calculate_equity("AhKc", villain_range="QQ,JJ", board="Ac7d2s")
+        result2 = calc.calculate_equity("KcAh", villain_range="JJ,QQ", board="2sAc7d")
+        
+        assert result1 == result2
+        assert calc.cache_info()['hand_vs_range']['currsize'] == 1
+    
     def test_different_boards_different_cache(self):
         """Test that different boards don't hit same cache."""
         calc = EquityCalculator(default_simulations=1000)
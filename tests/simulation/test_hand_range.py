@@ -184,6 +184,35 @@ class TestHandRangeEdgeCases:
         str_repr = str(range_obj)
         assert "AA" in str_repr or "aa" in str_repr.lower()
 
+    def test_repeated_parse_returns_independent_ranges(self):
+        """Test memoized parsing doesn't share hand sets between ranges."""
+        first = HandRange.from_string("QQ+")
+        first.hands.add("22")
+
+        second = HandRange.from_string("QQ+")
+        assert second.hands == {"QQ", "KK", "AA"}
+
+    def test_cached_combos_respect_blockers(self):
+        """Test blockers still apply once a hand's combos are cached."""
+        range_obj = HandRange.from_string("AA")
+        assert len(range_obj.get_combinations()) == 6
+
+        blocked = range_obj.get_combinations(exclude_cards=[Card.from_string("Ah")])
+        assert len(blocked) == 3
+        assert range_obj.count_combinations(exclude_cards=[Card.from_string("Ah")]) == 3
+        assert len(range_obj.get_combinations()) == 6
+    
+    def test_subclass_parsers_used_by_from_string(self):
+        """Test memoized parsing still calls a subclass's overridden parsers."""
+        class NoAcesRange(HandRange):
+            @classmethod
+            def _parse_pair_plus(cls, pair):
+                return super()._parse_pair_plus(pair) - {"AA"}
+        
+        assert HandRange.from_string("QQ+").hands == {"QQ", "KK", "AA"}
+        assert NoAcesRange.from_string("QQ+").hands == {"QQ", "KK"}
+        assert HandRange.from_string("QQ+").hands == {"QQ", "KK", "AA"}
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -219,6 +219,19 @@ class TestHandVsRangeSimulation:
         
         with pytest.raises(ValueError):
             sim.simulate_hand_vs_range(hero, [])
+    
+    def test_range_vs_range_skips_overlaps(self):
+        """Test range vs range drops draws where the combos share a card."""
+        sim = MonteCarloSimulator(n_simulations=5000)
+        
+        hero_combos = HandRange.from_string("AA").get_combinations()
+        villain_combos = HandRange.from_string("AK").get_combinations()
+        
+        result = sim.simulate_range_vs_range(hero_combos, villain_combos)
+        
+        # Half of AA/AK pairings collide on an ace
+        assert result.total_simulations < 5000
+        assert result.equity > 0.85
 
 
 class TestPreflopEquity:
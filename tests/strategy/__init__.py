@@ -0,0 +1 @@
+"""Tests for strategy layer."""
@@ -0,0 +1,58 @@
+"""
+Tests for EquityStrategy.
+
+Tests the card strings handed to the equity calculator.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from pypokerengine.strategy.equity_strategy import EquityStrategy
+from pypokerengine.simulation.hand_range import HandRange
+from pypokerengine.engine.card import Card
+
+
+class RecordingCalculator:
+    """Equity calculator stand-in that records the strings it receives."""
+
+    def __init__(self):
+        self.calls = []
+
+    def calculate_equity(self, hero_hand, villain_range, board=None, n_simulations=None):
+        self.calls.append((hero_hand, board))
+        return SimpleNamespace(equity=0.5)
+
+    def calculate_preflop_equity(self, hero_hand):
+        self.calls.append((hero_hand, None))
+        return SimpleNamespace(equity=0.5)
+
+
+def cards(text):
+    return [Card.from_string(text[i:i + 2]) for i in range(0, len(text), 2)]
+
+
+@pytest.fixture
+def calculator():
+    return RecordingCalculator()
+
+
+class TestCalculatorInput:
+    """Test that suits survive the conversion to calculator strings."""
+
+    def test_postflop_hero_and_board_suits(self, calculator):
+        strategy = EquityStrategy(equity_calculator=calculator)
+        equity = strategy._calculate_equity(
+            cards("AsKd"), HandRange.from_string("AA"), cards("Tc9c2s")
+        )
+
+        assert equity == 0.5
+        assert calculator.calls == [("AsKd", "Tc9c2s")]
+
+    def test_preflop_hero_suits(self, calculator):
+        strategy = EquityStrategy(equity_calculator=calculator)
+        strategy.decide_preflop_action(
+            cards("AsKd"), None, pot=3, current_bet=2, hero_current_bet=1,
+            hero_stack=99, position="SB", bb=2
+        )
+
+        assert calculator.calls == [("AsKd", None)]